@@ -0,0 +1,77 @@
+"""
+포스터 열 저장소 벤치마크
+
+PostData 레코드 dict(행 저장)와 PostColumns(열 저장)의
+포스터당 메모리와 숫자 필드 집계/정렬 시간을 비교한다.
+
+    python -m bench.bench_post_columns --posts 1000000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from model.post_model import PostColumns, PostData
+
+
+CONTENT = "벤치마크 본문"
+DATE = "2024-01-15T10:30:00"
+
+
+def fill_rows(n_posts: int) -> dict[int, PostData]:
+    return {
+        i: PostData(
+            post_id=i, title=f"t{i}", content=CONTENT, image_url=[],
+            like=i * 7 % 1000, view=i * 13 % 100000, poster_id=i % 1000, posted_date=DATE
+        )
+        for i in range(n_posts)
+    }
+
+
+def fill_columns(n_posts: int) -> PostColumns:
+    columns = PostColumns()
+    for i in range(n_posts):
+        columns.append(
+            post_id=i, title=f"t{i}", content=CONTENT, image_url=[],
+            like=i * 7 % 1000, view=i * 13 % 100000, poster_id=i % 1000, posted_date=DATE
+        )
+    return columns
+
+
+def traced(build, n_posts: int):
+    gc.collect()
+    tracemalloc.start()
+    store = build(n_posts)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return store, current / n_posts
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rows, row_bytes = traced(fill_rows, args.posts)
+    row_sum = timed(lambda: sum(post.like for post in rows.values()))
+    row_sort = timed(lambda: sorted(rows.values(), key=lambda post: post.view))
+    del rows
+
+    columns, column_bytes = traced(fill_columns, args.posts)
+    column_sum = timed(lambda: sum(columns.like))
+    column_sort = timed(lambda: sorted(range(len(columns.view)), key=columns.view.__getitem__))
+
+    print(f"posts={args.posts}")
+    print(f"{'store':<10}{'bytes/post':>12}{'sum(like) ms':>15}{'sort(view) ms':>16}")
+    print(f"{'rows':<10}{row_bytes:>12.1f}{row_sum:>15.1f}{row_sort:>16.1f}")
+    print(f"{'columns':<10}{column_bytes:>12.1f}{column_sum:>15.1f}{column_sort:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
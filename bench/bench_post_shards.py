@@ -0,0 +1,90 @@
+"""
+포스터 저장소 동시 쓰기 스트레스 벤치마크
+
+여러 스레드가 동시에 좋아요/조회수/작성을 할 때 처리량과 사라진 변경(lost update) 수를 비교한다.
+
+    unlocked : 락 없는 PostModel (읽고-더하고-쓰기 사이에 스레드가 바뀌면 변경이 사라짐)
+    global   : PostModel 전체를 락 하나로 감쌈 (공유 저장소의 SerializedModel과 같은 방식)
+    sharded  : ShardedPostModel (샤드마다 락)
+
+    python -m bench.bench_post_shards --threads 8 --ops 200000 --shards 16
+
+스레드 전환을 자주 일으키도록 sys.setswitchinterval을 낮춰서 실행한다.
+"""
+import argparse
+import random
+import sys
+import threading
+import time
+
+from model.post_model import PostModel
+from model.shared_storage import SerializedModel
+from model.sharded_post_model import ShardedPostModel
+
+
+def stress(post_db, n_threads: int, n_ops: int, post_ids: list[int]) -> tuple[float, int]:
+    """
+    Returns:
+        tuple[float, int]: (초당 연산 수, 사라진 변경 수)
+    """
+    before = {post_id: post_db.get_post_by_id(post_id) for post_id in post_ids}
+    barrier = threading.Barrier(n_threads + 1)
+
+    def writer(seed: int):
+        rng = random.Random(seed)
+        barrier.wait()
+        for _ in range(n_ops // n_threads):
+            post_id = rng.choice(post_ids)
+            post_db.update_like(post_id, 1)
+            post_db.increase_view(post_id)
+
+    threads = [threading.Thread(target=writer, args=(seed,)) for seed in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    applied = 0
+    for post_id, old in before.items():
+        new = post_db.get_post_by_id(post_id)
+        applied += (new.like - old.like) + (new.view - old.view)
+    expected = 2 * (n_ops // n_threads) * n_threads
+    return expected / elapsed, expected - applied
+
+
+def make_posts(post_db, n_posts: int) -> list[int]:
+    return [post_db.add_post(f"post {i}", "content", poster_id=0) for i in range(n_posts)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=200_000)
+    parser.add_argument("--posts", type=int, default=1_000)
+    parser.add_argument("--shards", type=int, default=16)
+    parser.add_argument("--switch-interval", type=float, default=1e-6)
+    args = parser.parse_args()
+
+    sys.setswitchinterval(args.switch_interval)
+
+    unlocked = PostModel()
+    global_locked = PostModel()
+    sharded = ShardedPostModel(args.shards)
+    variants = [
+        ("unlocked", unlocked, make_posts(unlocked, args.posts)),
+        ("global", SerializedModel(global_locked, threading.Lock()), make_posts(global_locked, args.posts)),
+        ("sharded", sharded, make_posts(sharded, args.posts)),
+    ]
+
+    print(f"threads={args.threads} ops={args.ops} posts={args.posts} shards={args.shards}")
+    print(f"{'store':<10}{'ops/s':>12}{'lost updates':>14}")
+    for name, post_db, post_ids in variants:
+        ops_per_second, lost = stress(post_db, args.threads, args.ops, post_ids)
+        print(f"{name:<10}{ops_per_second:>12.0f}{lost:>14}")
+
+
+if __name__ == "__main__":
+    main()
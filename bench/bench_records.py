@@ -0,0 +1,108 @@
+"""
+저장 레코드 벤치마크
+
+Pydantic BaseModel 레코드(기존 방식)와 slots dataclass 레코드(PostData, CommentData)의
+메모리 사용량과 삽입 처리량을 비교한다.
+
+    python -m bench.bench_records --rows 1000000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from pydantic import BaseModel, Field
+
+from model.comment_model import CommentData
+from model.post_model import PostData
+
+
+# 기존 저장 레코드 정의 (비교용)
+class PydanticPostData(BaseModel):
+    post_id: int = Field(...)
+    title: str = Field(...)
+    content: str = Field(...)
+    image_url: list[str] = Field(...)
+    like: int = Field(...)
+    view: int = Field(...)
+    poster_id: int = Field(...)
+    posted_date: str = Field(...)
+
+
+class PydanticCommentData(BaseModel):
+    comment_id: int
+    post_id: int
+    user_id: int
+    comment_date: str
+    comment: str
+
+
+TITLE = "벤치마크 제목"
+CONTENT = "벤치마크 본문 " * 8
+IMAGES = ["https://example.com/images/bench.jpg"]
+DATE = "2024-01-15T10:30:00"
+
+
+def make_post(cls, i: int):
+    return cls(
+        post_id=i,
+        title=TITLE,
+        content=CONTENT,
+        image_url=IMAGES,
+        like=0,
+        view=0,
+        poster_id=i % 1000,
+        posted_date=DATE
+    )
+
+
+def make_comment(cls, i: int):
+    return cls(
+        comment_id=i,
+        post_id=i // 10,
+        user_id=i % 1000,
+        comment_date=DATE,
+        comment=CONTENT
+    )
+
+
+def measure(factory, cls, rows: int) -> tuple[float, float]:
+    """
+    rows개의 레코드를 dict에 삽입하면서 (초당 삽입 수, 레코드당 바이트)를 잰다
+    """
+    gc.collect()
+    tracemalloc.start()
+    store = {}
+
+    start = time.perf_counter()
+    for i in range(rows):
+        store[i] = factory(cls, i)
+    elapsed = time.perf_counter() - start
+
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del store
+    gc.collect()
+
+    return rows / elapsed, current / rows
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"rows={args.rows}")
+    print(f"{'record':<22}{'inserts/s':>14}{'bytes/row':>12}")
+    for name, factory, cls in [
+        ("pydantic post", make_post, PydanticPostData),
+        ("slots post", make_post, PostData),
+        ("pydantic comment", make_comment, PydanticCommentData),
+        ("slots comment", make_comment, CommentData),
+    ]:
+        throughput, per_row = measure(factory, cls, args.rows)
+        print(f"{name:<22}{throughput:>14,.0f}{per_row:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+포스터 검색 벤치마크
+
+SearchIndex(역색인 + BM25)의 색인 시간/포스터당 메모리와
+질의 지연시간(p50/p95)을 본문 전체를 훑는 선형 탐색과 비교한다.
+
+    python -m bench.bench_search --posts 1000000
+"""
+import argparse
+import gc
+import random
+import statistics
+import time
+import tracemalloc
+from itertools import accumulate
+
+from model.search_index import SearchIndex
+
+
+# 자주 쓰는 단어 몇 개와, 무작위 한글 음절로 만든 드문 단어들 (앞쪽일수록 자주 나옴)
+COMMON_WORDS = [
+    "검색", "게시판", "댓글", "좋아요", "조회수", "서버", "데이터베이스", "색인", "캐시", "성능",
+    "fastapi", "sqlite", "python", "async", "cache", "index", "query", "server", "client", "json",
+]
+VOCABULARY_SIZE = 20_000
+
+
+def make_vocabulary(rng: random.Random) -> list[str]:
+    rare = [
+        "".join(chr(0xAC00 + rng.randrange(11172)) for _ in range(rng.randint(2, 4)))
+        for _ in range(VOCABULARY_SIZE)
+    ]
+    return COMMON_WORDS + rare
+
+
+def make_posts(n_posts: int, vocabulary: list[str], rng: random.Random) -> list[tuple[str, str]]:
+    # 지프(Zipf) 분포에 가깝게 앞쪽 단어를 더 자주 뽑는다
+    cum_weights = list(accumulate(1 / (rank + 1) for rank in range(len(vocabulary))))
+    return [
+        (
+            " ".join(rng.choices(vocabulary, cum_weights=cum_weights, k=4)),
+            " ".join(rng.choices(vocabulary, cum_weights=cum_weights, k=30))
+        )
+        for _ in range(n_posts)
+    ]
+
+
+def build_index(posts: list[tuple[str, str]]) -> SearchIndex:
+    index = SearchIndex()
+    for post_id, (title, content) in enumerate(posts):
+        index.add(post_id, title, content)
+    return index
+
+
+def linear_search(posts: list[tuple[str, str]], query: str, limit: int) -> list[int]:
+    # 색인 없이 단어가 몇 번 나오는지로 순위를 매기는 기준선
+    words = query.lower().split()
+    scores = []
+    for post_id, (title, content) in enumerate(posts):
+        text = f"{title} {content}".lower()
+        score = sum(text.count(word) for word in words)
+        if score:
+            scores.append((score, post_id))
+    scores.sort(reverse=True)
+    return [post_id for _, post_id in scores[:limit]]
+
+
+def latencies(fn, queries: list[str]) -> tuple[float, float]:
+    times = []
+    for query in queries:
+        start = time.perf_counter()
+        fn(query)
+        times.append((time.perf_counter() - start) * 1e3)
+    times.sort()
+    return statistics.median(times), times[min(len(times) - 1, int(len(times) * 0.95))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--linear-queries", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    vocabulary = make_vocabulary(rng)
+    posts = make_posts(args.posts, vocabulary, rng)
+    queries = [" ".join(rng.sample(vocabulary[:2000], k=rng.randint(1, 3))) for _ in range(args.queries)]
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    index = build_index(posts)
+    build_s = time.perf_counter() - start
+    index_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    index_p50, index_p95 = latencies(lambda query: index.search(query, args.limit), queries)
+    linear_p50, linear_p95 = latencies(
+        lambda query: linear_search(posts, query, args.limit), queries[:args.linear_queries]
+    )
+
+    print(f"posts={args.posts} terms={len(index.postings)} build={build_s:.1f}s "
+          f"index={index_bytes / 2**20:.1f}MiB ({index_bytes / args.posts:.1f} bytes/post)")
+    print(f"{'search':<10}{'p50 ms':>10}{'p95 ms':>10}")
+    print(f"{'index':<10}{index_p50:>10.1f}{index_p95:>10.1f}")
+    print(f"{'linear':<10}{linear_p50:>10.1f}{linear_p95:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+멀티 워커 처리량 벤치마크 (공유 저장소)
+
+공유 저장소 프로세스를 띄우고, uvicorn 워커 수를 바꿔가며
+GET /posts 와 GET /posts/{id} 를 섞은 요청의 초당 처리량을 잰다.
+클라이언트도 여러 프로세스에서 동시에 요청한다.
+
+    python -m bench.bench_shared_workers --workers 1 2 4 8 --seconds 10
+
+모든 워커가 저장소 프로세스 하나에 호출마다 pickle로 주고받으므로 워커를 늘려도 처리량이 늘어난다는 보장은 없다.
+배포할 머신에서 돌려서 워커 수를 정하는 데 쓴다 (코어가 워커 수보다 적으면 오히려 줄어든다).
+"""
+import argparse
+import http.client
+import multiprocessing
+import os
+import secrets
+import socket
+import subprocess
+import sys
+import time
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise TimeoutError(f"port {port} did not open")
+
+
+def client(port: int, seconds: float, results) -> None:
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    paths = ["/posts?offset=0&limit=10", "/posts/1", "/posts/2", "/posts/3"]
+    done = 0
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        conn.request("GET", paths[done % len(paths)])
+        conn.getresponse().read()
+        done += 1
+    conn.close()
+    results.put(done)
+
+
+def run(workers: int, clients: int, seconds: float, env: dict) -> float:
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        env=env
+    )
+    try:
+        wait_for_port(port)
+        time.sleep(1.0)  # 모든 워커가 뜰 때까지
+
+        results = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=client, args=(port, seconds, results)) for _ in range(clients)]
+        for process in processes:
+            process.start()
+        total = sum(results.get() for _ in processes)
+        for process in processes:
+            process.join()
+        return total / seconds
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    address = f"127.0.0.1:{free_port()}"
+    env = {
+        **os.environ,
+        "STORAGE_BACKEND": "shared",
+        "SHARED_STORAGE_ADDRESS": address,
+        "SHARED_STORAGE_AUTHKEY": secrets.token_hex(32)
+    }
+    storage = subprocess.Popen([sys.executable, "-m", "model.shared_storage"], env=env, stdout=subprocess.DEVNULL)
+    try:
+        wait_for_port(int(address.rsplit(":", 1)[1]))
+
+        print(f"cpus={os.cpu_count()} clients={args.clients} seconds={args.seconds}")
+        print(f"{'workers':<10}{'req/s':>12}")
+        for workers in args.workers:
+            print(f"{workers:<10}{run(workers, args.clients, args.seconds, env):>12.0f}")
+    finally:
+        storage.terminate()
+        storage.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+포스터 저장소 콜드 스타트 벤치마크
+
+같은 포스터 N개를 다음 방법으로 올렸을 때 첫 GET /posts 페이지까지 걸리는 시간을 비교한다.
+첫 페이지는 GET /posts 기본값(커서 방식, 작성순, 목록 요약)과 같은 get_posts_after(None, 20, summary=True)로 잰다.
+
+    seed       : 기존 PostModel.__init__ 더미 데이터 경로 (add_dummy_post 반복)
+    json       : JSON 스냅샷 읽기 + load_state
+    binary     : 바이너리 스냅샷 mmap + load_state (문자열은 지연 디코딩, 정렬 인덱스는 배열 복사)
+    binary-old : date_order가 없는 이전 바이너리 스냅샷 (첫 페이지에서 작성일을 모두 읽어 정렬 인덱스를 만듦)
+
+    python -m bench.bench_snapshot_load --posts 1000000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from model.binary_snapshot import write_binary_snapshot, read_binary_snapshot
+from model.journal import write_json_snapshot, read_json_snapshot
+from model.post_model import PostModel, posts as dummy_posts
+
+
+def make_rows(n_posts: int) -> list[dict]:
+    base = dummy_posts[0]
+    return [{**base, "title": f"{base['title']} #{i}"} for i in range(n_posts)]
+
+
+def load_by_seeding(rows: list[dict]) -> PostModel:
+    post_db = PostModel()
+    for row in rows:
+        post_db.add_dummy_post(**row)
+    return post_db
+
+
+def load_snapshot(path: str, read) -> PostModel:
+    post_db = PostModel()
+    post_db.load_state(read(path)["models"]["post"])
+    return post_db
+
+
+def time_to_first_page(load) -> float:
+    start = time.perf_counter()
+    post_db = load()
+    post_db.get_posts_after(None, 20, summary=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=1_000_000)
+    parser.add_argument(
+        "--seed-posts", type=int, default=100_000,
+        help="seed 경로는 느려서 이 개수만 재고 --posts 개수로 환산한다"
+    )
+    args = parser.parse_args()
+
+    rows = make_rows(args.posts)
+    state = PostModel()
+    for row in rows:
+        state.columns.append(state.next_post_id, row["title"], row["content"], row["image_url"],
+                             row["like"], row["view"], row["poster_id"], row["posted_date"])
+        state.next_post_id += 1
+    # 열에 바로 넣었으므로 정렬 인덱스는 dump_state에서 새로 만든다
+    state.date_index = None
+    snapshot = {"seq": 0, "models": {"post": state.dump_state()}}
+    old_snapshot = {"seq": 0, "models": {"post": {**snapshot["models"]["post"]}}}
+    del old_snapshot["models"]["post"]["date_order"]
+    del state
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "snapshot.json")
+        binary_path = os.path.join(directory, "snapshot.bin")
+        old_binary_path = os.path.join(directory, "snapshot-old.bin")
+        write_json_snapshot(json_path, snapshot)
+        write_binary_snapshot(binary_path, snapshot)
+        write_binary_snapshot(old_binary_path, old_snapshot)
+        del snapshot, old_snapshot
+
+        seed_posts = min(args.seed_posts, args.posts)
+        seed = time_to_first_page(lambda: load_by_seeding(rows[:seed_posts])) * args.posts / seed_posts
+        del rows
+        from_json = time_to_first_page(lambda: load_snapshot(json_path, read_json_snapshot))
+        from_binary = time_to_first_page(lambda: load_snapshot(binary_path, read_binary_snapshot))
+        from_old_binary = time_to_first_page(lambda: load_snapshot(old_binary_path, read_binary_snapshot))
+
+        print(f"posts={args.posts}")
+        print(f"{'loader':<12}{'first page (s)':>16}{'file (MB)':>12}")
+        print(f"{'seed':<12}{seed:>16.2f}{'-':>12}  (measured on {seed_posts} posts)")
+        print(f"{'json':<12}{from_json:>16.2f}{os.path.getsize(json_path) / 1e6:>12.1f}")
+        print(f"{'binary':<12}{from_binary:>16.2f}{os.path.getsize(binary_path) / 1e6:>12.1f}")
+        print(f"{'binary-old':<12}{from_old_binary:>16.2f}{os.path.getsize(old_binary_path) / 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+UserModel 조회 벤치마크
+
+인덱스 기반 조회와 기존 방식(리스트 선형 탐색)의 조회 시간을 비교한다.
+
+    python -m bench.bench_user_lookup --users 300000
+"""
+import argparse
+import random
+import timeit
+
+from model.user_model import UserModel
+
+
+def build_model(n_users: int) -> UserModel:
+    user_db = UserModel()
+    for i in range(n_users):
+        user_db.add_user(
+            email=f"user{i}@bench.com",
+            password="Bench1234!",
+            nickname=f"nick{i}",
+            user_profile_image_url="http"
+        )
+    return user_db
+
+
+def linear_search_by_email(rows: list, email: str):
+    # 인덱스 도입 전 search_user_by_email 구현과 동일한 선형 탐색
+    for user_data in rows:
+        if user_data.email == email:
+            return user_data
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=300_000)
+    parser.add_argument("--lookups", type=int, default=200)
+    args = parser.parse_args()
+
+    user_db = build_model(args.users)
+    rows = list(user_db.db.values())
+
+    rng = random.Random(0)
+    emails = [f"user{rng.randrange(args.users)}@bench.com" for _ in range(args.lookups)]
+    nicknames = [f"nick{rng.randrange(args.users)}" for _ in range(args.lookups)]
+    user_ids = [rng.randrange(args.users) for _ in range(args.lookups)]
+
+    linear = timeit.timeit(lambda: [linear_search_by_email(rows, e) for e in emails], number=1)
+    by_email = timeit.timeit(lambda: [user_db.search_user_by_email(e) for e in emails], number=1)
+    by_nickname = timeit.timeit(lambda: [user_db.search_user_by_nickname(n) for n in nicknames], number=1)
+    by_id = timeit.timeit(lambda: [user_db.search_user_by_id(i) for i in user_ids], number=1)
+
+    per_lookup = lambda total: total / args.lookups * 1e6
+    print(f"users={args.users} lookups={args.lookups}")
+    print(f"linear scan (email) : {per_lookup(linear):10.2f} us/lookup")
+    print(f"index (email)       : {per_lookup(by_email):10.2f} us/lookup")
+    print(f"index (nickname)    : {per_lookup(by_nickname):10.2f} us/lookup")
+    print(f"index (user_id)     : {per_lookup(by_id):10.2f} us/lookup")
+    print(f"speedup (email)     : {linear / by_email:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import os
+
+# ================ 저장소 설정 ==========================
+# 환경 변수로 저장소 구현을 선택한다
+#   memory : 프로세스 메모리에 저장 (기본값, 재시작하면 사라짐)
+#   sqlite : SQLite 파일에 저장
+#   shared : 공유 저장소 프로세스(python -m model.shared_storage)에 저장, 여러 워커가 같은 데이터를 봄
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "memory")
+
+# SQLite 파일 경로와 커넥션 풀 크기
+SQLITE_PATH = os.getenv("SQLITE_PATH", "community.db")
+SQLITE_POOL_SIZE = int(os.getenv("SQLITE_POOL_SIZE", "4"))
+
+# 공유 저장소 프로세스 주소("host:port")와 인증 키
+# 저장소 프로세스는 요청을 pickle로 풀기 때문에 인증 키를 아는 프로세스는 그 안에서 임의의 코드를 실행할 수 있다.
+# 그래서 기본값을 두지 않고, 비어 있으면 저장소 프로세스와 shared 저장소를 쓰는 서버 모두 시작하지 않는다.
+SHARED_STORAGE_ADDRESS = os.getenv("SHARED_STORAGE_ADDRESS", "127.0.0.1:50055")
+SHARED_STORAGE_AUTHKEY = os.getenv("SHARED_STORAGE_AUTHKEY", "").encode()
+
+# 메모리 포스터 저장소의 샤드 수 (2 이상이면 샤드마다 락을 두어 여러 스레드가 동시에 쓸 수 있음)
+# 공유 저장소 프로세스는 지정하지 않으면 16개로 나눈다 (model/shared_storage.py의 DEFAULT_POST_SHARDS)
+POST_SHARDS = int(os.getenv("POST_SHARDS", "1"))
+
+# sqlite / shared 저장소 호출을 실행할 워커당 스레드 수
+STORAGE_THREADS = int(os.getenv("STORAGE_THREADS", "4"))
+
+# 좋아요 수 정합성 검사 주기(초): 좋아요 목록에서 포스터별 좋아요 수를 다시 세어 어긋난 값을 고치고 로그로 남긴다
+# 서버 시작 시 한 번 실행하고 이후 주기마다 실행 (0이면 끔)
+LIKE_RECONCILE_INTERVAL = float(os.getenv("LIKE_RECONCILE_INTERVAL", "60"))
+
+# 조회수 쓰기 지연(write-behind): 조회수 증가를 워커 메모리에 모았다가
+# 주기(초)마다 또는 모인 증가분이 개수를 넘으면 한 번에 저장소에 반영 (주기가 0이면 조회마다 바로 반영)
+VIEW_FLUSH_INTERVAL = float(os.getenv("VIEW_FLUSH_INTERVAL", "1.0"))
+VIEW_FLUSH_THRESHOLD = int(os.getenv("VIEW_FLUSH_THRESHOLD", "1000"))
+
+# 게시글 상세 응답 캐시 (워커마다 LRU): 응답 크기 합의 상한(바이트, 0이면 끔)과 최대 보관 시간(초, 0이면 무효화될 때까지)
+# 무효화는 같은 워커 안의 변경만 알 수 있으므로, 워커가 여러 개면 TTL을 두는 것이 좋다
+POST_CACHE_MAX_BYTES = int(os.getenv("POST_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+POST_CACHE_TTL = float(os.getenv("POST_CACHE_TTL", "0"))
+
+# ================ 관리자 ==================================
+# 관리자 API(GET /admin/export 등)의 X-Admin-Token 헤더 값 (비워두면 관리자 API를 막는다)
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+
+# ================ 메모리 저장소 내구성 ====================
+# 디렉토리를 지정하면 메모리 모델의 변경을 작업 로그에 남기고 주기적으로 스냅샷을 뜬다
+# (비워두면 기존처럼 재시작 시 데이터가 사라진다)
+JOURNAL_DIR = os.getenv("JOURNAL_DIR", "")
+
+# 로그 fsync 묶음: 주기(초)마다 또는 개수가 쌓이면 한 번에 fsync (주기가 0이면 매 요청 fsync)
+JOURNAL_FSYNC_INTERVAL = float(os.getenv("JOURNAL_FSYNC_INTERVAL", "0.05"))
+JOURNAL_FSYNC_BATCH = int(os.getenv("JOURNAL_FSYNC_BATCH", "256"))
+
+# 스냅샷 검사 주기(초)와 스냅샷을 뜨는 최소 로그 개수
+JOURNAL_SNAPSHOT_INTERVAL = float(os.getenv("JOURNAL_SNAPSHOT_INTERVAL", "300"))
+JOURNAL_SNAPSHOT_MIN_OPS = int(os.getenv("JOURNAL_SNAPSHOT_MIN_OPS", "10000"))
+
+# 스냅샷 형식: binary (mmap으로 열고 지연 디코딩, 기본값) 또는 json
+JOURNAL_SNAPSHOT_FORMAT = os.getenv("JOURNAL_SNAPSHOT_FORMAT", "binary")
@@ -1,36 +1,212 @@
 from fastapi import Depends
 from typing import Annotated
 from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
+import config
 from model.user_model import UserModel
 from model.post_model import PostModel
+from model.sharded_post_model import ShardedPostModel
 from model.comment_model import CommentModel
 from model.like_model import LikeModel
+from model.sqlite_model import (
+    SqlitePool,
+    SqliteUserModel,
+    SqlitePostModel,
+    SqliteCommentModel,
+    SqliteLikeModel,
+    SqliteLikeService,
+    seed_dummy_data
+)
+from model.like_service import LikeService
+from model.view_counter import ViewCounter
+from model.post_cache import PostCache
+from model.shared_storage import StorageManager, connect
+from model.journal import Journal, write_json_snapshot, read_json_snapshot
+from model.binary_snapshot import write_binary_snapshot, read_binary_snapshot
+from model.async_storage import (
+    AsyncUserStorage,
+    AsyncPostStorage,
+    AsyncCommentStorage,
+    AsyncLikeStorage,
+    AsyncLikeService,
+    InMemoryAdapter,
+    ThreadPoolAdapter
+)
+
+
+# SQLite 저장소를 쓸 때 모든 모델이 하나의 커넥션 풀을 공유
+@lru_cache(maxsize=None)
+def get_sqlite_pool() -> SqlitePool:
+    pool = SqlitePool(config.SQLITE_PATH, size=config.SQLITE_POOL_SIZE)
+    seed_dummy_data(pool)
+    return pool
+
+
+def use_sqlite() -> bool:
+    return config.STORAGE_BACKEND == "sqlite"
+
+
+def make_memory_models() -> dict:
+    if config.POST_SHARDS > 1:
+        post_db = ShardedPostModel(config.POST_SHARDS)
+    else:
+        post_db = PostModel()
+    return {"user": UserModel(), "post": post_db, "comment": CommentModel(), "like": LikeModel()}
+
+
+# 메모리 저장소에 JOURNAL_DIR이 있으면 네 모델을 하나의 저널로 묶어서 복구/기록
+@lru_cache(maxsize=None)
+def get_journal() -> Journal:
+    if config.JOURNAL_SNAPSHOT_FORMAT == "json":
+        snapshot_format = {"write_snapshot": write_json_snapshot, "read_snapshot": read_json_snapshot}
+    else:
+        snapshot_format = {"write_snapshot": write_binary_snapshot, "read_snapshot": read_binary_snapshot}
+
+    return Journal(
+        config.JOURNAL_DIR,
+        make_memory_models(),
+        fsync_interval=config.JOURNAL_FSYNC_INTERVAL,
+        fsync_batch=config.JOURNAL_FSYNC_BATCH,
+        snapshot_interval=config.JOURNAL_SNAPSHOT_INTERVAL,
+        snapshot_min_ops=config.JOURNAL_SNAPSHOT_MIN_OPS,
+        **snapshot_format
+    )
+
+
+def use_shared() -> bool:
+    return config.STORAGE_BACKEND == "shared"
+
+
+# 메모리 모델 4개 (JOURNAL_DIR이 있으면 저널 프록시)
+# 공유 저장소 프로세스도 이 함수로 모델을 만든다
+@lru_cache(maxsize=None)
+def get_memory_models() -> dict:
+    if config.JOURNAL_DIR:
+        return get_journal().proxies
+    return make_memory_models()
+
+
+# 여러 워커가 하나의 저장소 프로세스(model/shared_storage.py)를 공유
+@lru_cache(maxsize=None)
+def get_shared_manager() -> StorageManager:
+    return connect(config.SHARED_STORAGE_ADDRESS, config.SHARED_STORAGE_AUTHKEY)
 
 
 # 각 DB 클라이언트를 lru_cache로 Singleton처럼 사용
 @lru_cache(maxsize=None)
 def get_user_db() -> UserModel:
-    return UserModel()
+    if use_sqlite():
+        return SqliteUserModel(get_sqlite_pool())
+    if use_shared():
+        return get_shared_manager().user()
+    return get_memory_models()["user"]
 
 
 @lru_cache(maxsize=None)
 def get_post_db() -> PostModel:
-    return PostModel()
+    if use_sqlite():
+        return SqlitePostModel(get_sqlite_pool())
+    if use_shared():
+        return get_shared_manager().post()
+    return get_memory_models()["post"]
 
 
 @lru_cache(maxsize=None)
 def get_comment_db() -> CommentModel:
-    return CommentModel()
+    if use_sqlite():
+        return SqliteCommentModel(get_sqlite_pool())
+    if use_shared():
+        return get_shared_manager().comment()
+    return get_memory_models()["comment"]
 
 
 @lru_cache(maxsize=None)
 def get_like_db() -> LikeModel:
-    return LikeModel()
+    if use_sqlite():
+        return SqliteLikeModel(get_sqlite_pool())
+    if use_shared():
+        return get_shared_manager().like()
+    return get_memory_models()["like"]
+
+
+# 좋아요 멤버십과 좋아요 수를 함께 바꾸는 서비스
+@lru_cache(maxsize=None)
+def get_like_service() -> LikeService:
+    if use_sqlite():
+        return SqliteLikeService(get_sqlite_pool())
+    if use_shared():
+        return get_shared_manager().like_service()
+    return LikeService(get_post_db(), get_like_db())
+
+
+def close_storage() -> None:
+    """
+    서버 종료 시 열려 있는 저장소를 정리 (남은 로그 fsync, 커넥션 닫기)
+    """
+    if get_journal.cache_info().currsize:
+        get_journal().close()
+    if get_sqlite_pool.cache_info().currsize:
+        get_sqlite_pool().close()
+
+
+# 라우터에서 await 하는 비동기 저장소
+# 디스크/원격 저장소는 스레드 풀에서 실행
+@lru_cache(maxsize=None)
+def get_storage_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=config.STORAGE_THREADS, thread_name_prefix="storage")
+
+
+def wrap_async(model):
+    if use_sqlite() or use_shared():
+        return ThreadPoolAdapter(model, get_storage_executor())
+    return InMemoryAdapter(model)
+
+
+@lru_cache(maxsize=None)
+def get_user_storage() -> AsyncUserStorage:
+    return wrap_async(get_user_db())
+
+
+@lru_cache(maxsize=None)
+def get_post_storage() -> AsyncPostStorage:
+    return wrap_async(get_post_db())
+
+
+@lru_cache(maxsize=None)
+def get_comment_storage() -> AsyncCommentStorage:
+    return wrap_async(get_comment_db())
+
+
+@lru_cache(maxsize=None)
+def get_like_storage() -> AsyncLikeStorage:
+    return wrap_async(get_like_db())
+
+
+@lru_cache(maxsize=None)
+def get_like_service_storage() -> AsyncLikeService:
+    return wrap_async(get_like_service())
+
+
+# 게시글 상세 응답 캐시 (워커마다 하나)
+@lru_cache(maxsize=None)
+def get_post_cache() -> PostCache:
+    return PostCache(max_bytes=config.POST_CACHE_MAX_BYTES, ttl=config.POST_CACHE_TTL)
+
+
+# 조회수 증가분을 모아서 반영하는 집계기 (워커마다 하나)
+# 반영한 조회수는 캐시된 응답에도 더해서 캐시를 지우지 않고 최신으로 유지
+@lru_cache(maxsize=None)
+def get_view_counter() -> ViewCounter:
+    flush_threshold = config.VIEW_FLUSH_THRESHOLD if config.VIEW_FLUSH_INTERVAL > 0 else 1
+    return ViewCounter(get_post_storage(), flush_threshold=flush_threshold, on_flush=get_post_cache().add_views)
 
 
 # FastAPI 의존성 타입 alias
-UserModelDep = Annotated[UserModel, Depends(get_user_db)]
-PostModelDep = Annotated[PostModel, Depends(get_post_db)]
-CommentModelDep = Annotated[CommentModel, Depends(get_comment_db)]
-LikeModelDep = Annotated[LikeModel, Depends(get_like_db)]
+UserModelDep = Annotated[AsyncUserStorage, Depends(get_user_storage)]
+PostModelDep = Annotated[AsyncPostStorage, Depends(get_post_storage)]
+CommentModelDep = Annotated[AsyncCommentStorage, Depends(get_comment_storage)]
+LikeModelDep = Annotated[AsyncLikeStorage, Depends(get_like_storage)]
+LikeServiceDep = Annotated[AsyncLikeService, Depends(get_like_service_storage)]
+ViewCounterDep = Annotated[ViewCounter, Depends(get_view_counter)]
+PostCacheDep = Annotated[PostCache, Depends(get_post_cache)]
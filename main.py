@@ -1,12 +1,55 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 
-from routers import user, post
+import config
+from routers import user, post, admin
+from dependencies import (
+    close_storage,
+    use_shared,
+    get_shared_manager,
+    get_like_service_storage,
+    get_view_counter,
+    get_post_cache
+)
+from model.like_service import reconcile_periodically
 
 # ================ 앱 ==================================
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # shared 저장소는 시작할 때 접속해서, 인증 키가 없거나 틀리면 요청을 받기 전에 멈춘다
+    if use_shared():
+        get_shared_manager()
+
+    # 좋아요 수 정합성 검사 (shared 저장소는 저장소 프로세스에서 한 번만 실행)
+    # 고친 포스터는 이 워커의 상세 응답 캐시에서 지운다 (다른 워커의 캐시는 POST_CACHE_TTL로 만료)
+    reconciler = None
+    if config.LIKE_RECONCILE_INTERVAL > 0 and not use_shared():
+        reconciler = asyncio.create_task(
+            reconcile_periodically(get_like_service_storage(), config.LIKE_RECONCILE_INTERVAL, get_post_cache())
+        )
+
+    # 모아둔 조회수 증가분을 주기적으로 반영
+    view_counter = get_view_counter()
+    view_flusher = None
+    if config.VIEW_FLUSH_INTERVAL > 0:
+        view_flusher = asyncio.create_task(view_counter.flush_periodically(config.VIEW_FLUSH_INTERVAL))
+
+    yield
+
+    if reconciler is not None:
+        reconciler.cancel()
+    if view_flusher is not None:
+        view_flusher.cancel()
+    await view_counter.flush()
+    close_storage()
+
+
+app = FastAPI(lifespan=lifespan)
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -58,3 +101,4 @@ async def pydantic_validation_exception_handler(request: Request, exc: Validatio
 # 라우터 등록은 exception handler 이후에
 app.include_router(user.router)
 app.include_router(post.router)
+app.include_router(admin.router)
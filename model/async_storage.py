@@ -0,0 +1,156 @@
+import asyncio
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Protocol
+
+from .user_model import UserModel, UserData, UserPublic
+from .post_model import PostModel, PostData, PostPublic, PostSummary, PostSummaryPublic
+from .comment_model import CommentModel, CommentData, CommentPublic
+from .like_model import LikeData
+
+
+# ================ 비동기 저장소 프로토콜 ====================
+# 라우터는 아래 프로토콜만 보고 저장소를 await 한다.
+# *_2_*_public 변환 함수는 저장소를 건드리지 않으므로 동기 함수로 두고, 워커 안에서 바로 실행한다.
+
+class AsyncUserStorage(Protocol):
+    async def add_user(self, email: str, password: str, nickname: str, user_profile_image_url: str) -> int: ...
+    async def search_user_by_nickname(self, nickname: str) -> UserData | None: ...
+    async def search_user_by_email(self, email: str) -> UserData | None: ...
+    async def search_user_by_id(self, user_id: int) -> UserData | None: ...
+    async def get_users_by_ids(self, user_ids: Iterable[int]) -> dict[int, UserData]: ...
+    async def scan_users(self, after: int | None, limit: int) -> list[UserData]: ...
+    async def update_user_profile(self, user_id: int, nickname: str, user_profile_image_url: str) -> bool: ...
+    async def update_password(self, user_id: int, password: str) -> bool: ...
+    async def delete_user_by_user_id(self, user_id: int) -> bool: ...
+    async def authenticate_user(self, email: str, password: str) -> UserData | None: ...
+    def user_data_2_user_public(self, data: UserData) -> UserPublic: ...
+
+
+class AsyncPostStorage(Protocol):
+    async def add_post(
+        self, title: str, content: str, poster_id: int, image_url: list[str] = [], poster_nickname: str = ""
+    ) -> int: ...
+    async def get_post_by_id(self, post_id: int) -> PostData | None: ...
+    async def get_posts_by_ids(self, post_ids: Iterable[int]) -> dict[int, PostData]: ...
+    async def scan_posts(self, after: int | None, limit: int) -> list[PostData]: ...
+    async def get_summary_by_id(self, post_id: int) -> PostSummary | None: ...
+    async def edit_post(self, post_id: int, title: str, content: str, image_url: list[str]) -> bool: ...
+    async def update_like(self, post_id: int, delta: int) -> int | None: ...
+    async def update_comment_count(self, post_id: int, delta: int) -> int | None: ...
+    async def update_poster_nickname(self, poster_id: int, nickname: str) -> int: ...
+    async def increase_view(self, post_id: int) -> int | None: ...
+    async def add_views(self, views: list[tuple[int, int]]) -> int: ...
+    async def delete_post_by_id(self, post_id: int) -> bool: ...
+    async def get_posts(
+        self, offset: int, limit: int, summary: bool = False
+    ) -> tuple[list[PostData] | list[PostSummary], int]: ...
+    async def get_posts_after(
+        self, key: tuple[str, int] | None, limit: int, descending: bool = False, summary: bool = False
+    ) -> tuple[list[PostData] | list[PostSummary], bool]: ...
+    async def get_posts_by_poster(
+        self, poster_id: int, key: tuple[str, int] | None, limit: int, descending: bool = False, summary: bool = False
+    ) -> tuple[list[PostData] | list[PostSummary], bool]: ...
+    async def get_posts_ranked(
+        self, field: str, key: tuple[int, int] | None, limit: int, descending: bool = True, summary: bool = False
+    ) -> tuple[list[PostData] | list[PostSummary], bool]: ...
+    async def search_posts(self, query: str, limit: int, offset: int = 0) -> list[PostSummary]: ...
+    async def get_like_counts(self) -> dict[int, int]: ...
+    def post_data_2_post_public(self, data: PostData) -> PostPublic: ...
+    def post_summary_2_summary_public(self, data: PostSummary) -> PostSummaryPublic: ...
+
+
+class AsyncCommentStorage(Protocol):
+    async def add_comment(self, post_id: int, user_id: int, comment_date: str, comment: str) -> int: ...
+    async def get_comment_by_comment_id(self, comment_id: int) -> CommentData | None: ...
+    async def edit_comment(self, comment_id: int, comment: str, comment_date: str) -> bool: ...
+    async def delete_comment_by_comment_id(self, comment_id: int) -> bool: ...
+    async def get_comments_by_post_id(self, post_id: int) -> list[CommentData]: ...
+    async def scan_comments(self, after: int | None, limit: int) -> list[CommentData]: ...
+    async def get_comments_after(
+        self, post_id: int, after: int | None, limit: int
+    ) -> tuple[list[CommentData], bool]: ...
+    async def count_comments_by_post_id(self, post_id: int) -> int: ...
+    def comment_data_2_comment_public(self, comment_data: CommentData, commenter: UserData) -> CommentPublic: ...
+    def comments_2_comment_public(
+        self, comment_data: list[CommentData], commenters: dict[int, UserData]
+    ) -> list[CommentPublic]: ...
+
+
+class AsyncLikeStorage(Protocol):
+    async def add_like(self, post_id: int, user_id: int) -> bool: ...
+    async def delete_like(self, post_id: int, user_id: int) -> bool: ...
+    async def has_liked(self, post_id: int, user_id: int) -> bool: ...
+    async def get_likers_by_post_id(self, post_id: int) -> list[int]: ...
+    async def get_liked_post_ids_by_user_id(self, user_id: int) -> list[int]: ...
+    async def count_likes_by_post_id(self, post_id: int) -> int: ...
+    async def count_likes_by_post(self) -> dict[int, int]: ...
+    async def get_likes_by_post_ids(self, post_ids: list[int]) -> list[LikeData]: ...
+
+
+class AsyncLikeService(Protocol):
+    async def like(self, post_id: int, user_id: int) -> int | None: ...
+    async def unlike(self, post_id: int, user_id: int) -> int | None: ...
+    async def reconcile(self) -> dict[int, tuple[int, int]]: ...
+
+
+# 어댑터가 저장소를 거치지 않고 그대로 돌려주는 동기 변환 함수 (정적 메소드)
+# 모델이 공유 저장소 프록시여도 변환은 워커에서 한다 (이벤트 루프에서 프로세스 왕복을 하지 않도록)
+SYNC_METHODS = {
+    "user_data_2_user_public": UserModel.user_data_2_user_public,
+    "post_data_2_post_public": PostModel.post_data_2_post_public,
+    "post_summary_2_summary_public": PostModel.post_summary_2_summary_public,
+    "comment_data_2_comment_public": CommentModel.comment_data_2_comment_public,
+    "comments_2_comment_public": CommentModel.comments_2_comment_public,
+}
+
+
+# ================ 어댑터 ===================================
+class InMemoryAdapter:
+    """
+    메모리 모델을 비동기 프로토콜로 감싸는 어댑터
+
+    메모리 연산은 충분히 짧으므로 이벤트 루프에서 바로 실행한다.
+    (스레드를 거치지 않으니 모델에 락도 필요 없다)
+    """
+
+    def __init__(self, model):
+        self.model = model
+
+    def __getattr__(self, name: str):
+        if name in SYNC_METHODS:
+            return SYNC_METHODS[name]
+        method = getattr(self.model, name)
+
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+
+        # 다음 조회부터는 __getattr__를 거치지 않도록 캐시
+        setattr(self, name, call)
+        return call
+
+
+class ThreadPoolAdapter:
+    """
+    디스크 모델(SQLite 등)을 비동기 프로토콜로 감싸는 어댑터
+
+    모든 호출을 크기가 제한된 스레드 풀에서 실행해서,
+    느린 쿼리가 이벤트 루프의 다른 요청을 막지 않게 한다.
+    """
+
+    def __init__(self, model, executor: ThreadPoolExecutor):
+        self.model = model
+        self.executor = executor
+
+    def __getattr__(self, name: str):
+        if name in SYNC_METHODS:
+            return SYNC_METHODS[name]
+        method = getattr(self.model, name)
+
+        async def call(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, partial(method, *args, **kwargs))
+
+        setattr(self, name, call)
+        return call
@@ -0,0 +1,231 @@
+import json
+import mmap
+import os
+import struct
+from array import array
+from itertools import accumulate
+
+
+# ================ 바이너리 스냅샷 형식 ======================
+#
+#   magic           8 bytes   b"KTBSNAP\x01"
+#   manifest_len    uint64 (little endian)
+#   manifest        JSON (utf-8), 뒤를 8바이트 경계까지 0으로 채움
+#   data            열(column) 데이터, 각 구역은 8바이트 경계에서 시작
+#
+# manifest에는 seq와 모델별 스칼라 값(next_*_id), 행 개수, 열 목록, 정수 배열 목록이 들어간다.
+# 열과 배열의 offset은 data 시작 위치 기준이다.
+#
+#   int  : int64 배열 (count개)
+#   str  : int64 offset 배열 (count + 1개) + utf-8 blob
+#   json : str과 같고, 읽을 때 json.loads 한다 (image_url 같은 리스트)
+#
+# 파일은 mmap으로 열고, int 열은 memoryview로 바로 읽으며
+# 문자열 열은 행에 처음 접근할 때 디코딩한다.
+
+MAGIC = b"KTBSNAP\x01"
+HEADER = struct.Struct("<8sQ")
+
+# 모델 이름 -> (행 목록 키, [(열 이름, 종류)])
+# 열 순서는 각 모델 dump_state()의 행 순서와 같다
+# (version 열과 포스터 요약 열은 나중에 추가되어 이전 스냅샷에는 없으며, 읽으면 기본값이 된다)
+SCHEMAS = {
+    "user": ("users", [
+        ("user_id", "int"), ("email", "str"), ("password", "str"),
+        ("nickname", "str"), ("user_profile_image_url", "str"), ("version", "int"),
+    ]),
+    "post": ("posts", [
+        ("post_id", "int"), ("title", "str"), ("content", "str"), ("image_url", "json"),
+        ("like", "int"), ("view", "int"), ("poster_id", "int"), ("posted_date", "str"),
+        ("version", "int"), ("comment_count", "int"), ("poster_nickname", "str"),
+        ("preview", "str"), ("thumbnail", "json"),
+    ]),
+    "comment": ("comments", [
+        ("comment_id", "int"), ("post_id", "int"), ("user_id", "int"),
+        ("comment_date", "str"), ("comment", "str"), ("version", "int"),
+    ]),
+    "like": ("likes", [
+        ("post_id", "int"), ("user_id", "int"),
+    ]),
+}
+
+
+# 모델 이름 -> 행과 따로 int64 배열로 저장하는 상태 키 (정렬 인덱스 등)
+# 이전 스냅샷에는 없으며, 읽으면 상태에서 빠진다
+INT_ARRAYS = {
+    "post": ("date_order",),
+}
+
+
+def pad8(size: int) -> int:
+    return (8 - size % 8) % 8
+
+
+class LazyStrings:
+    """
+    스냅샷의 문자열 열을 list처럼 쓰게 해주는 래퍼
+
+    스냅샷에 있던 행은 접근할 때마다 mmap에서 디코딩하고(캐시하지 않아 메모리가 늘지 않음),
+    수정된 행은 overlay에, 새로 추가된 행은 tail 리스트에 둔다.
+    """
+
+    def __init__(self, offsets: memoryview, blob: memoryview, is_json: bool = False):
+        self.offsets = offsets
+        self.blob = blob
+        self.is_json = is_json
+        self.base = len(offsets) - 1
+        self.overlay: dict[int, object] = {}
+        self.tail: list = []
+
+    def __len__(self) -> int:
+        return self.base + len(self.tail)
+
+    def __getitem__(self, row: int):
+        if row >= self.base:
+            return self.tail[row - self.base]
+        if row in self.overlay:
+            return self.overlay[row]
+
+        text = str(self.blob[self.offsets[row]:self.offsets[row + 1]], "utf-8")
+        return json.loads(text) if self.is_json else text
+
+    def __setitem__(self, row: int, value) -> None:
+        if row >= self.base:
+            self.tail[row - self.base] = value
+        else:
+            self.overlay[row] = value
+
+    def __iter__(self):
+        return (self[row] for row in range(len(self)))
+
+    def append(self, value) -> None:
+        self.tail.append(value)
+
+
+class ColumnarRows:
+    """
+    스냅샷에서 읽은 한 모델의 행 목록 (열 단위)
+
+    행 단위로 순회하면 dump_state()의 행 목록처럼 동작하고,
+    열 저장소를 쓰는 모델은 columns를 그대로 가져다 쓸 수 있다.
+    """
+
+    def __init__(self, count: int, columns: dict):
+        self.count = count
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        columns = list(self.columns.values())
+        for row in range(self.count):
+            yield [column[row] for column in columns]
+
+
+def encode_column(values: list, kind: str) -> list[bytes]:
+    if kind == "int":
+        return [array("q", values).tobytes()]
+
+    if kind == "json":
+        values = [json.dumps(value, ensure_ascii=False) for value in values]
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = array("q", [0])
+    offsets.extend(accumulate(len(value) for value in encoded))
+    return [offsets.tobytes(), b"".join(encoded)]
+
+
+def write_binary_snapshot(path: str, snapshot: dict) -> None:
+    """
+    Journal 스냅샷({"seq", "models": {이름: dump_state()}})을 바이너리 파일로 저장
+    """
+    sections: list[bytes] = []
+    position = 0
+    models = {}
+
+    def add_section(data: bytes) -> int:
+        nonlocal position
+        offset = position
+        sections.append(data)
+        sections.append(b"\0" * pad8(len(data)))
+        position += len(data) + pad8(len(data))
+        return offset
+
+    for name, state in snapshot["models"].items():
+        rows_key, schema = SCHEMAS[name]
+        rows = state[rows_key]
+        columns = []
+        for index, (column_name, kind) in enumerate(schema):
+            parts = encode_column([row[index] for row in rows], kind)
+            column = {"name": column_name, "kind": kind, "offset": add_section(parts[0])}
+            if kind != "int":
+                column["blob_offset"] = add_section(parts[1])
+                column["blob_length"] = len(parts[1])
+            columns.append(column)
+
+        arrays = {}
+        for key in INT_ARRAYS.get(name, ()):
+            if key in state:
+                arrays[key] = {"offset": add_section(array("q", state[key]).tobytes()), "count": len(state[key])}
+
+        models[name] = {
+            "scalars": {key: value for key, value in state.items() if key != rows_key and key not in arrays},
+            "count": len(rows),
+            "columns": columns,
+            "arrays": arrays
+        }
+
+    manifest = json.dumps({"seq": snapshot["seq"], "models": models}).encode("utf-8")
+    manifest += b"\0" * pad8(HEADER.size + len(manifest))
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(manifest)))
+        f.write(manifest)
+        for section in sections:
+            f.write(section)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read_binary_snapshot(path: str) -> dict:
+    """
+    바이너리 스냅샷을 mmap으로 열어서 Journal 스냅샷 형태로 반환
+
+    모델 상태의 행 목록은 ColumnarRows이고, 실제 디코딩은 행에 접근할 때 일어난다
+    """
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(mapped)
+    magic, manifest_len = HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise ValueError(f"not a binary snapshot: {path}")
+
+    data_start = HEADER.size + manifest_len
+    manifest = json.loads(bytes(view[HEADER.size:data_start]).rstrip(b"\0"))
+
+    models = {}
+    for name, section in manifest["models"].items():
+        rows_key, _ = SCHEMAS[name]
+        count = section["count"]
+        columns = {}
+        for column in section["columns"]:
+            start = data_start + column["offset"]
+            if column["kind"] == "int":
+                columns[column["name"]] = view[start:start + 8 * count].cast("q")
+            else:
+                blob_start = data_start + column["blob_offset"]
+                columns[column["name"]] = LazyStrings(
+                    view[start:start + 8 * (count + 1)].cast("q"),
+                    view[blob_start:blob_start + column["blob_length"]],
+                    is_json=column["kind"] == "json"
+                )
+
+        arrays = {}
+        for key, array_section in section.get("arrays", {}).items():
+            start = data_start + array_section["offset"]
+            arrays[key] = view[start:start + 8 * array_section["count"]].cast("q")
+
+        models[name] = {**section["scalars"], rows_key: ColumnarRows(count, columns), **arrays}
+
+    return {"seq": manifest["seq"], "models": models}
@@ -1,5 +1,8 @@
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+
 from pydantic import BaseModel
-from .user_model import UserData
+from .user_model import UserData, DELETED_USER
 
 # 10개의 댓글 더미 데이터
 comments = [
@@ -65,12 +68,17 @@ comments = [
     }
 ]
 
-class CommentData(BaseModel):
+@dataclass(slots=True)
+class CommentData:
+    """
+    DB에 저장되는 댓글 정보 (외부로 나갈 때는 CommentPublic으로 변환)
+    """
     comment_id: int
     post_id: int
     user_id: int
     comment_date: str
     comment: str
+    version: int = 0    # 수정할 때마다 1 증가 (ETag에 사용)
 
 class CommentPublic(BaseModel):
     commenter_image: str
@@ -80,23 +88,27 @@ class CommentPublic(BaseModel):
 
 
 class CommentModel:
+    # 상태를 바꾸는 메소드 (작업 로그에 기록됨)
+    MUTATIONS = ("add_comment", "edit_comment", "delete_comment_by_comment_id")
+
     def __init__(self):
-        self.comment_db = []
+        # comment_id -> CommentData
+        self.comment_db: dict[int, CommentData] = {}
+
+        # post_id -> 해당 포스터의 comment_id 정렬 리스트
+        # comment_id가 단조 증가하므로 append만으로 정렬(작성 순서)이 유지되고,
+        # 커서 페이지네이션은 bisect로 위치를 찾는다
+        self.post_index: dict[int, list[int]] = {}
+
+        # 삭제 후에도 id가 재사용되지 않도록 단조 증가하는 id
+        self.next_comment_id = 0
 
-    def add_dummy_comment(self, post_id: int, user_id: int, comment_date: str, comment: str) -> None:
-        self.comment_db.append(
-            CommentData(
-                comment_id=len(self.comment_db),
-                post_id=post_id,
-                user_id=user_id,
-                comment_date=comment_date,
-                comment=comment
-            )
-        )
-    
         # 더미 댓글 데이터 추가
         for comment in comments:
             self.add_dummy_comment(**comment)
+
+    def add_dummy_comment(self, post_id: int, user_id: int, comment_date: str, comment: str) -> None:
+        self.add_comment(post_id, user_id, comment_date, comment)
     
     def add_comment(self, post_id: int, user_id: int, comment_date: str, comment: str) -> int:
         """
@@ -109,54 +121,173 @@ class CommentModel:
             user_id: 댓글 작성자 ID
             comment_data: 댓글 작성 시간
             comment: 댓글 내용
+
+        Returns:
+            int: 추가된 댓글의 id
         """
+        comment_id = self.next_comment_id
+        self.next_comment_id += 1
 
-        self.comment_db.append(
-            CommentData(
-                comment_id=len(self.comment_db),
-                post_id=post_id,
-                user_id=user_id,
-                comment_date=comment_date,
-                comment=comment
-            )
+        self.comment_db[comment_id] = CommentData(
+            comment_id=comment_id,
+            post_id=post_id,
+            user_id=user_id,
+            comment_date=comment_date,
+            comment=comment
         )
+        self.post_index.setdefault(post_id, []).append(comment_id)
 
-        return len(self.comment_db) - 1
+        return comment_id
     
     
     def get_comment_by_comment_id(self, comment_id: int) -> CommentData | None:
-        for comment in self.comment_db:
-            if comment.comment_id == comment_id:
-                return comment
-        
-        return None
+        return self.comment_db.get(comment_id)
+
+
+    def edit_comment(self, comment_id: int, comment: str, comment_date: str) -> bool:
+        """
+        댓글 내용과 작성 시간을 수정
+
+        Args:
+            comment_id (int): 수정할 댓글 id
+            comment (str): 새 댓글 내용
+            comment_date (str): 수정 시간
+
+        Returns:
+            bool: 댓글이 있어서 수정했으면 True
+        """
+        comment_data = self.comment_db.get(comment_id)
+        if comment_data is None:
+            return False
+
+        comment_data.comment = comment
+        comment_data.comment_date = comment_date
+        comment_data.version += 1
+        return True
 
 
     def delete_comment_by_comment_id(self, comment_id: int) -> bool:
-        for idx, comment in enumerate(self.comment_db):
-            if comment.comment_id == comment_id:
-                del self.comment_db[idx]
-                return True
-        
-        return False
+        comment = self.comment_db.pop(comment_id, None)
+        if comment is None:
+            return False
 
+        thread = self.post_index[comment.post_id]
+        del thread[bisect_left(thread, comment_id)]
+        if not thread:
+            del self.post_index[comment.post_id]
 
-    def comment_data_2_comment_public(self, comment_data: CommentData, commenter:UserData) -> CommentPublic:
+        return True
+
+
+    @staticmethod
+    def comment_data_2_comment_public(comment_data: CommentData, commenter:UserData) -> CommentPublic:
 
         return CommentPublic(
             commenter_image=commenter.user_profile_image_url,
             commenter_nickname=commenter.nickname,
-            commented_date=comment_data.comment_data,
+            commented_date=comment_data.comment_date,
             comment=comment_data.comment
         )
 
 
+    @staticmethod
+    def comments_2_comment_public(
+            comment_data: list[CommentData],
+            commenters: dict[int, UserData]
+        ) -> list[CommentPublic]:
+        """
+        댓글 목록을 작성자 정보와 함께 외부로 전송하는 데이터로 한 번에 변경
+
+        작성자는 UserModel.get_users_by_ids로 미리 한 번에 조회해서 넘긴다
+
+        Args:
+            comment_data (list[CommentData]): 변경할 댓글 목록
+            commenters (dict[int, UserData]): user_id -> 댓글 작성자
+
+        Returns:
+            list[CommentPublic]: 댓글 전부를 순서대로 (탈퇴한 사용자의 댓글은 DELETED_USER로 표시해서 댓글 수와 맞춘다)
+        """
+        return [
+            CommentModel.comment_data_2_comment_public(comment, commenters.get(comment.user_id, DELETED_USER))
+            for comment in comment_data
+        ]
+
+
+    def dump_state(self) -> dict:
+        """
+        스냅샷에 저장할 상태를 JSON으로 바꿀 수 있는 형태로 반환
+        """
+        return {
+            "next_comment_id": self.next_comment_id,
+            "comments": [
+                [comment.comment_id, comment.post_id, comment.user_id, comment.comment_date, comment.comment,
+                 comment.version]
+                for comment in self.comment_db.values()
+            ]
+        }
+
+    def load_state(self, state: dict) -> None:
+        """
+        dump_state로 만든 상태로 DB와 포스터별 인덱스를 다시 만든다
+        """
+        self.comment_db = {}
+        self.post_index = {}
+
+        for row in state["comments"]:
+            comment_data = CommentData(*row)
+            self.comment_db[comment_data.comment_id] = comment_data
+            self.post_index.setdefault(comment_data.post_id, []).append(comment_data.comment_id)
+
+        self.next_comment_id = state["next_comment_id"]
+
+
+    def scan_comments(self, after: int | None, limit: int) -> list[CommentData]:
+        """
+        comment_id 순서로 after 다음의 댓글을 limit개 조회 (전체 내보내기용, scan_users와 같은 방식)
+        """
+        comments = []
+        comment_id = 0 if after is None else after + 1
+        while len(comments) < limit and comment_id < self.next_comment_id:
+            comment_data = self.comment_db.get(comment_id)
+            if comment_data is not None:
+                comments.append(comment_data)
+            comment_id += 1
+        return comments
+
+
     def get_comments_by_post_id(self, post_id: int) -> list[CommentData]:
-        result = []
+        """
+        포스터에 달린 댓글을 작성 순서대로 반환
+
+        Args:
+            post_id (int): 댓글을 가져올 포스터 id
+
+        Returns:
+            list[CommentData]: 해당 포스터의 댓글 목록
+        """
+        thread = self.post_index.get(post_id, [])
+
+        return [self.comment_db[comment_id] for comment_id in thread]
+
+
+    def get_comments_after(self, post_id: int, after: int | None, limit: int) -> tuple[list[CommentData], bool]:
+        """
+        포스터의 댓글을 comment_id 순서로 after 다음부터 limit개 조회 (커서 페이지네이션)
+
+        Args:
+            post_id (int): 댓글을 가져올 포스터 id
+            after (int | None): 이전 페이지의 마지막 comment_id, None이면 처음부터
+            limit (int): 가져올 개수
+
+        Returns:
+            tuple[list[CommentData], bool]: 댓글 목록, 그 다음에도 댓글이 더 있는지
+        """
+        thread = self.post_index.get(post_id, [])
+        start = 0 if after is None else bisect_right(thread, after)
+        comment_ids = thread[start:start + limit + 1]
+
+        return [self.comment_db[comment_id] for comment_id in comment_ids[:limit]], len(comment_ids) > limit
 
-        for comment in self.comment_db:
-            if comment.post_id == post_id:
-                result.append(comment)
-        
-        return result
 
+    def count_comments_by_post_id(self, post_id: int) -> int:
+        return len(self.post_index.get(post_id, ()))
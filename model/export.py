@@ -0,0 +1,154 @@
+import argparse
+import asyncio
+import dataclasses
+import json
+import sys
+import zlib
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+
+# ================ NDJSON 내보내기 ==========================
+# 저장소 전체를 한 줄에 하나씩 JSON 객체(NDJSON)로 내보낸다.
+#   {"type": "user", "user_id": 0, "email": ..., ...}
+# 엔티티마다 id 순서로 EXPORT_BATCH개씩 keyset(scan_*)으로 읽어서 바로 흘려보내므로
+# 데이터가 아무리 많아도 메모리에는 한 묶음만 올라간다.
+# 한 시점의 스냅샷이 아니라서, 내보내는 중에 바뀐 항목은 읽은 시점의 값으로 나간다.
+
+EXPORT_BATCH = 1000
+ENTITIES = ("users", "posts", "comments", "likes")
+
+# 내보내지 않는 필드
+PRIVATE_FIELDS = {"user": frozenset({"password"})}
+
+
+async def scan(fetch: Callable[[int | None, int], Awaitable[list]], id_field: str, batch_size: int) -> AsyncIterator[list]:
+    """
+    scan_* 메소드를 마지막 id 다음부터 반복 호출해서 묶음 단위로 순회
+    """
+    after = None
+    while True:
+        batch = await fetch(after, batch_size)
+        if batch:
+            yield batch
+        if len(batch) < batch_size:
+            return
+        after = getattr(batch[-1], id_field)
+
+
+def to_records(kind: str, items: list) -> list[dict]:
+    private = PRIVATE_FIELDS.get(kind, frozenset())
+    return [
+        {"type": kind, **{key: value for key, value in dataclasses.asdict(item).items() if key not in private}}
+        for item in items
+    ]
+
+
+async def export_records(
+        user_db,
+        post_db,
+        comment_db,
+        like_db,
+        entities: tuple[str, ...] = ENTITIES,
+        batch_size: int = EXPORT_BATCH
+    ) -> AsyncIterator[list[dict]]:
+    """
+    비동기 저장소에서 엔티티별로 레코드 묶음을 읽어서 순서대로 내보낸다 (users → posts → comments → likes)
+
+    좋아요는 id가 없으므로 포스터를 다시 한 번 훑으면서 포스터 묶음마다 그 포스터들의 좋아요를 읽는다
+
+    Args:
+        user_db, post_db, comment_db, like_db: 비동기 저장소 (AsyncUserStorage 등)
+        entities (tuple[str, ...]): 내보낼 엔티티 (ENTITIES 중)
+        batch_size (int): 한 번에 읽을 개수
+
+    Yields:
+        list[dict]: "type" 필드가 붙은 레코드 묶음
+    """
+    if "users" in entities:
+        async for users in scan(user_db.scan_users, "user_id", batch_size):
+            yield to_records("user", users)
+
+    if "posts" in entities:
+        async for posts in scan(post_db.scan_posts, "post_id", batch_size):
+            yield to_records("post", posts)
+
+    if "comments" in entities:
+        async for comments in scan(comment_db.scan_comments, "comment_id", batch_size):
+            yield to_records("comment", comments)
+
+    if "likes" in entities:
+        async for posts in scan(post_db.scan_posts, "post_id", batch_size):
+            likes = await like_db.get_likes_by_post_ids([post.post_id for post in posts])
+            if likes:
+                yield to_records("like", likes)
+
+
+async def ndjson_chunks(batches: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+    """
+    레코드 묶음 하나를 NDJSON 바이트 덩어리 하나로
+    """
+    async for batch in batches:
+        yield "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in batch).encode("utf-8")
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    바이트 덩어리를 받는 대로 gzip으로 압축해서 흘려보낸다 (전체를 모으지 않음)
+    """
+    compressor = zlib.compressobj(wbits=31)  # 31 = gzip 헤더/트레일러
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_ndjson(
+        user_db,
+        post_db,
+        comment_db,
+        like_db,
+        entities: tuple[str, ...] = ENTITIES,
+        compress: bool = False,
+        batch_size: int = EXPORT_BATCH
+    ) -> AsyncIterator[bytes]:
+    """
+    저장소 전체를 NDJSON(선택적으로 gzip) 바이트 스트림으로 (StreamingResponse / CLI에서 사용)
+    """
+    chunks = ndjson_chunks(export_records(user_db, post_db, comment_db, like_db, entities, batch_size))
+    return gzip_chunks(chunks) if compress else chunks
+
+
+async def write_export(out, **kwargs) -> None:
+    async for chunk in export_ndjson(**kwargs):
+        out.write(chunk)
+
+
+if __name__ == "__main__":
+    # 설정(STORAGE_BACKEND 등)이 가리키는 저장소를 파일 또는 표준 출력으로 내보낸다
+    #   python -m model.export --out export.ndjson.gz
+    import dependencies
+
+    parser = argparse.ArgumentParser(description="저장소를 NDJSON으로 내보낸다")
+    parser.add_argument("--out", default="-", help="출력 파일 (기본: 표준 출력)")
+    parser.add_argument("--gzip", action="store_true", help="gzip으로 압축 (--out이 .gz로 끝나면 자동)")
+    parser.add_argument("--entities", nargs="+", choices=ENTITIES, default=list(ENTITIES))
+    parser.add_argument("--batch-size", type=int, default=EXPORT_BATCH)
+    args = parser.parse_args()
+
+    out = sys.stdout.buffer if args.out == "-" else open(args.out, "wb")
+    try:
+        asyncio.run(write_export(
+            out,
+            user_db=dependencies.get_user_storage(),
+            post_db=dependencies.get_post_storage(),
+            comment_db=dependencies.get_comment_storage(),
+            like_db=dependencies.get_like_storage(),
+            entities=tuple(args.entities),
+            compress=args.gzip or args.out.endswith(".gz"),
+            batch_size=args.batch_size
+        ))
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+        dependencies.close_storage()
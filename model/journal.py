@@ -0,0 +1,289 @@
+import json
+import os
+import threading
+
+
+class OperationLog:
+    """
+    append-only 작업 로그 (한 줄에 JSON 하나)
+
+    append()는 버퍼에 쓰기만 하고, fsync는 백그라운드 스레드가
+    fsync_interval초마다 또는 fsync_batch개가 쌓일 때마다 한 번에 한다.
+    fsync_interval이 0이면 append마다 fsync 한다.
+    """
+
+    def __init__(self, path: str, fsync_interval: float = 0.05, fsync_batch: int = 256):
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self.fsync_batch = fsync_batch
+
+        self.lock = threading.Lock()
+        self.file = open(path, "a", encoding="utf-8")
+        self.pending = 0
+
+        self.wakeup = threading.Event()
+        self.closed = False
+        self.flusher = None
+        if fsync_interval > 0:
+            self.flusher = threading.Thread(target=self.flush_loop, name="oplog-fsync", daemon=True)
+            self.flusher.start()
+
+    def append(self, record: dict) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self.lock:
+            self.file.write(line)
+            self.pending += 1
+            pending = self.pending
+
+        if self.flusher is None:
+            self.sync()
+        elif pending >= self.fsync_batch:
+            self.wakeup.set()
+
+    def sync(self) -> None:
+        with self.lock:
+            if self.pending == 0:
+                return
+            self.file.flush()
+            self.pending = 0
+            fd = self.file.fileno()
+        os.fsync(fd)
+
+    def flush_loop(self) -> None:
+        while not self.closed:
+            self.wakeup.wait(self.fsync_interval)
+            self.wakeup.clear()
+            self.sync()
+
+    def rotate(self, rotated_path: str) -> None:
+        """
+        현재 로그를 rotated_path로 옮기고 빈 로그로 다시 시작
+
+        이전 스냅샷이 중간에 실패해서 rotated_path가 남아있으면,
+        그 내용은 아직 어느 스냅샷에도 없으므로 덮어쓰지 않고 뒤에 이어 붙인다
+        """
+        with self.lock:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.pending = 0
+            self.file.close()
+
+            if os.path.exists(rotated_path):
+                with open(self.path, encoding="utf-8") as src, open(rotated_path, "a", encoding="utf-8") as dst:
+                    dst.write(src.read())
+                    dst.flush()
+                    os.fsync(dst.fileno())
+                os.remove(self.path)
+            else:
+                os.replace(self.path, rotated_path)
+
+            self.file = open(self.path, "a", encoding="utf-8")
+
+    def close(self) -> None:
+        self.closed = True
+        self.wakeup.set()
+        if self.flusher is not None:
+            self.flusher.join()
+        self.sync()
+        self.file.close()
+
+
+def read_log(path: str):
+    """
+    로그 파일의 레코드를 순서대로 읽는다
+
+    쓰는 도중 죽어서 잘린 마지막 줄은 무시한다
+    """
+    if not os.path.exists(path):
+        return
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                return
+
+
+def write_json_snapshot(path: str, snapshot: dict) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read_json_snapshot(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class JournaledModel:
+    """
+    모델의 MUTATIONS 메소드 호출을 작업 로그에 남기는 프록시
+
+    변경은 저널 락 안에서 적용 → 기록 순서로 일어나므로,
+    스냅샷은 항상 어떤 seq 시점의 일관된 상태가 된다.
+    실패한 변경(False / None 반환)은 기록하지 않는다.
+    """
+
+    def __init__(self, name: str, model, journal: "Journal"):
+        self.name = name
+        self.model = model
+        self.journal = journal
+
+    def __getattr__(self, attr: str):
+        self.journal.ensure_loaded(self.name)
+        method = getattr(self.model, attr)
+        if attr not in self.model.MUTATIONS:
+            return method
+
+        def call(*args, **kwargs):
+            with self.journal.lock:
+                result = method(*args, **kwargs)
+                if result is not False and result is not None:
+                    self.journal.record(self.name, attr, args, kwargs)
+            return result
+
+        setattr(self, attr, call)
+        return call
+
+
+class Journal:
+    """
+    메모리 모델의 작업 로그 + 주기적 스냅샷
+
+    directory 아래에
+        snapshot      : 마지막 스냅샷 (seq와 모델별 상태)
+        oplog         : 스냅샷 이후의 작업 로그
+        oplog.old     : 스냅샷을 쓰는 동안 잠시 남겨두는 이전 로그
+    를 둔다. 시작할 때 스냅샷을 열고 seq 이후의 로그를 모델별로 모아두며,
+    각 모델은 프록시로 처음 접근할 때 스냅샷 상태 + 자기 로그를 적용한다.
+    (모델끼리는 서로의 상태를 보지 않으므로 모델별로 따로 적용해도 결과가 같다)
+    """
+
+    SNAPSHOT = "snapshot"
+    LOG = "oplog"
+    ROTATED_LOG = "oplog.old"
+
+    def __init__(
+            self,
+            directory: str,
+            models: dict,
+            fsync_interval: float = 0.05,
+            fsync_batch: int = 256,
+            snapshot_interval: float = 300.0,
+            snapshot_min_ops: int = 10_000,
+            write_snapshot=write_json_snapshot,
+            read_snapshot=read_json_snapshot
+        ):
+        """
+        Args:
+            directory (str): 스냅샷과 로그를 둘 디렉토리
+            models (dict): 이름 -> 메모리 모델 (user, post, comment, like)
+            fsync_interval (float): 로그 fsync 주기(초), 0이면 매번 fsync
+            fsync_batch (int): 이만큼 쌓이면 주기를 기다리지 않고 fsync
+            snapshot_interval (float): 스냅샷 검사 주기(초)
+            snapshot_min_ops (int): 로그가 이만큼 쌓였을 때만 스냅샷을 뜬다
+            write_snapshot / read_snapshot: 스냅샷 파일 형식
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.models = models
+        self.snapshot_interval = snapshot_interval
+        self.snapshot_min_ops = snapshot_min_ops
+        self.write_snapshot = write_snapshot
+        self.read_snapshot = read_snapshot
+
+        self.lock = threading.RLock()
+        self.seq = 0
+        self.ops_since_snapshot = 0
+
+        self.recover()
+
+        self.log = OperationLog(self.path(self.LOG), fsync_interval, fsync_batch)
+        self.proxies = {name: JournaledModel(name, model, self) for name, model in models.items()}
+
+        self.stopped = threading.Event()
+        self.snapshotter = threading.Thread(target=self.snapshot_loop, name="snapshot", daemon=True)
+        self.snapshotter.start()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def recover(self) -> None:
+        """
+        스냅샷과 로그 꼬리를 읽어서 모델별로 적용할 준비를 한다
+
+        실제 적용은 ensure_loaded()에서 모델별로 처음 접근할 때 한다
+        """
+        self.loaded: set[str] = set()
+        self.pending_states: dict[str, dict] = {}
+        self.pending_records: dict[str, list[dict]] = {name: [] for name in self.models}
+
+        snapshot_path = self.path(self.SNAPSHOT)
+        if os.path.exists(snapshot_path):
+            snapshot = self.read_snapshot(snapshot_path)
+            self.pending_states = dict(snapshot["models"])
+            self.seq = snapshot["seq"]
+
+        for log_name in (self.ROTATED_LOG, self.LOG):
+            for record in read_log(self.path(log_name)):
+                if record["seq"] <= self.seq:
+                    continue
+                self.pending_records[record["model"]].append(record)
+                self.seq = record["seq"]
+                self.ops_since_snapshot += 1
+
+    def ensure_loaded(self, name: str) -> None:
+        """
+        모델에 스냅샷 상태와 로그 꼬리를 아직 적용하지 않았으면 적용
+        """
+        if name in self.loaded:
+            return
+
+        with self.lock:
+            if name in self.loaded:
+                return
+
+            model = self.models[name]
+            state = self.pending_states.pop(name, None)
+            if state is not None:
+                model.load_state(state)
+            for record in self.pending_records.pop(name):
+                getattr(model, record["op"])(*record["args"], **record["kwargs"])
+
+            self.loaded.add(name)
+
+    def record(self, name: str, op: str, args: tuple, kwargs: dict) -> None:
+        # 저널 락 안에서만 호출된다
+        self.seq += 1
+        self.ops_since_snapshot += 1
+        self.log.append({"seq": self.seq, "model": name, "op": op, "args": list(args), "kwargs": kwargs})
+
+    def snapshot(self) -> None:
+        """
+        현재 상태를 스냅샷으로 저장하고 그 이전 로그를 지운다
+        """
+        with self.lock:
+            for name in self.models:
+                self.ensure_loaded(name)
+            seq = self.seq
+            states = {name: model.dump_state() for name, model in self.models.items()}
+            self.log.rotate(self.path(self.ROTATED_LOG))
+            self.ops_since_snapshot = 0
+
+        # 파일 쓰기는 락 밖에서 (임시 파일에 쓰고 교체)
+        tmp_path = self.path(self.SNAPSHOT + ".tmp")
+        self.write_snapshot(tmp_path, {"seq": seq, "models": states})
+        os.replace(tmp_path, self.path(self.SNAPSHOT))
+        os.remove(self.path(self.ROTATED_LOG))
+
+    def snapshot_loop(self) -> None:
+        while not self.stopped.wait(self.snapshot_interval):
+            if self.ops_since_snapshot >= self.snapshot_min_ops:
+                self.snapshot()
+
+    def close(self) -> None:
+        self.stopped.set()
+        self.snapshotter.join()
+        self.log.close()
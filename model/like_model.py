@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 
 likes = [
@@ -45,17 +45,28 @@ likes = [
         ]
 
 
-class LikeData(BaseModel):
+@dataclass(slots=True)
+class LikeData:
     post_id: int
     user_id: int
 
 
 class LikeModel:
+    # 상태를 바꾸는 메소드 (작업 로그에 기록됨)
+    MUTATIONS = ("add_like", "delete_like")
+
     def __init__(self):
 
         # 10개의 좋아요 더미 데이터
-        
-        self.like_db = []
+
+        # (post_id, user_id) 멤버십 집합 (dict를 순서 있는 집합으로 사용해 누른 순서를 유지)
+        self.like_db: dict[tuple[int, int], None] = {}
+
+        # 인접 인덱스 (dict를 순서 있는 집합으로 사용해 누른 순서를 유지)
+        # post_id -> 좋아요를 누른 user_id
+        self.post_likes: dict[int, dict[int, None]] = {}
+        # user_id -> 좋아요를 누른 post_id
+        self.user_likes: dict[int, dict[int, None]] = {}
 
         # 더미 좋아요 데이터 추가
         for like in likes:
@@ -75,41 +86,126 @@ class LikeModel:
         Returns:
             bool: 좋아요 추가 성공 여부
         """
-        # 이미 좋아요를 눌렀는지 확인
-        for like in self.like_db:
-            if like.post_id == post_id and like.user_id == user_id:
-                return False  # 이미 좋아요를 누름
-
-        # 유효한 포스트와 사용자인지 확인
-        self.like_db.append(
-            LikeData(
-                post_id=post_id,
-                user_id=user_id
-            )
-        )
-        return True
+        return self.add_like(post_id, user_id)
 
 
     def add_like(self, post_id: int, user_id: int) -> bool:
-        for liked in self.like_db:
-            if liked.post_id == post_id and liked.user_id == user_id:
-                return False
+        key = (post_id, user_id)
+        # 이미 좋아요를 눌렀는지 확인
+        if key in self.like_db:
+            return False
 
-        self.like_db.append(
-            LikeData(
-                post_id=post_id,  # 키워드 인자로 수정
-                user_id=user_id   # 키워드 인자로 수정
-            )
-        )
+        self.like_db[key] = None
+        self.post_likes.setdefault(post_id, {})[user_id] = None
+        self.user_likes.setdefault(user_id, {})[post_id] = None
 
         return True
     
 
     def delete_like(self, post_id: int, user_id: int) -> bool:
-        for idx, like in enumerate(self.like_db):
-            if like.post_id == post_id and like.user_id == user_id:
-                del self.like_db[idx]
-                return True
-        
-        return False
+        key = (post_id, user_id)
+        if key not in self.like_db:
+            return False
+
+        del self.like_db[key]
+        self._discard(self.post_likes, post_id, user_id)
+        self._discard(self.user_likes, user_id, post_id)
+
+        return True
+
+
+    def has_liked(self, post_id: int, user_id: int) -> bool:
+        """
+        사용자가 포스터에 좋아요를 눌렀는지 확인
+
+        Args:
+            post_id (int): 확인할 포스터 id
+            user_id (int): 확인할 사용자 id
+
+        Returns:
+            bool: 좋아요를 눌렀으면 True
+        """
+        return (post_id, user_id) in self.like_db
+
+
+    def get_likers_by_post_id(self, post_id: int) -> list[int]:
+        """
+        포스터에 좋아요를 누른 사용자 id를 누른 순서대로 반환
+
+        Args:
+            post_id (int): 조회할 포스터 id
+
+        Returns:
+            list[int]: 좋아요를 누른 user_id 목록
+        """
+        return list(self.post_likes.get(post_id, ()))
+
+
+    def get_liked_post_ids_by_user_id(self, user_id: int) -> list[int]:
+        """
+        사용자가 좋아요를 누른 포스터 id를 누른 순서대로 반환
+
+        Args:
+            user_id (int): 조회할 사용자 id
+
+        Returns:
+            list[int]: 좋아요를 누른 post_id 목록
+        """
+        return list(self.user_likes.get(user_id, ()))
+
+
+    def count_likes_by_post_id(self, post_id: int) -> int:
+        return len(self.post_likes.get(post_id, ()))
+
+
+    def count_likes_by_post(self) -> dict[int, int]:
+        """
+        좋아요가 있는 모든 포스터의 좋아요 수를 한 번에 반환
+
+        Returns:
+            dict[int, int]: post_id -> 좋아요 수
+        """
+        return {post_id: len(user_ids) for post_id, user_ids in self.post_likes.items()}
+
+
+    def get_likes_by_post_ids(self, post_ids: list[int]) -> list[LikeData]:
+        """
+        여러 포스터의 좋아요를 한 번에 반환 (전체 내보내기에서 포스터 묶음마다 사용)
+
+        Args:
+            post_ids (list[int]): post_id 목록
+
+        Returns:
+            list[LikeData]: post_ids 순서, 포스터 안에서는 좋아요를 누른 순서
+        """
+        return [
+            LikeData(post_id, user_id)
+            for post_id in post_ids
+            for user_id in self.post_likes.get(post_id, ())
+        ]
+
+
+    def dump_state(self) -> dict:
+        """
+        스냅샷에 저장할 상태를 JSON으로 바꿀 수 있는 형태로 반환
+        """
+        return {"likes": [list(key) for key in self.like_db]}
+
+    def load_state(self, state: dict) -> None:
+        """
+        dump_state로 만든 상태로 멤버십 집합과 인접 인덱스를 다시 만든다
+        """
+        self.like_db = {}
+        self.post_likes = {}
+        self.user_likes = {}
+
+        for post_id, user_id in state["likes"]:
+            self.add_like(post_id, user_id)
+
 
+    @staticmethod
+    def _discard(index: dict[int, dict[int, None]], key: int, value: int) -> None:
+        bucket = index[key]
+        del bucket[value]
+        if not bucket:
+            del index[key]
@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import threading
+import time
+
+from .post_model import PostModel
+from .like_model import LikeModel
+
+
+logger = logging.getLogger(__name__)
+
+
+class LikeService:
+    """
+    좋아요 멤버십(LikeModel)과 포스터의 좋아요 수(PostModel.like)를 함께 바꾸는 서비스
+
+    좋아요 수는 멤버십에서 다시 셀 수 있는 비정규화 값이므로,
+    두 값을 바꾸는 동안 포스터별 락(post_id % stripes)을 잡아서
+    같은 포스터의 좋아요/취소/정합성 검사가 섞이지 않게 한다.
+    """
+
+    def __init__(self, post_db: PostModel, like_db: LikeModel, stripes: int = 64):
+        self.post_db = post_db
+        self.like_db = like_db
+        self.locks = [threading.Lock() for _ in range(stripes)]
+
+    def lock_of(self, post_id: int) -> threading.Lock:
+        return self.locks[post_id % len(self.locks)]
+
+    def like(self, post_id: int, user_id: int) -> int | None:
+        """
+        좋아요를 추가하고 포스터의 좋아요 수를 1 올린다
+
+        Args:
+            post_id (int): 좋아요를 누를 포스터 id
+            user_id (int): 좋아요를 누르는 사용자 id
+
+        Returns:
+            int | None: 변경된 좋아요 수, 이미 눌렀거나 포스터가 없으면 None
+        """
+        with self.lock_of(post_id):
+            if not self.like_db.add_like(post_id, user_id):
+                return None
+
+            count = self.post_db.update_like(post_id, 1)
+            if count is None:
+                # 포스터가 그 사이에 삭제됨
+                self.like_db.delete_like(post_id, user_id)
+            return count
+
+    def unlike(self, post_id: int, user_id: int) -> int | None:
+        """
+        좋아요를 취소하고 포스터의 좋아요 수를 1 내린다
+
+        Args:
+            post_id (int): 좋아요를 취소할 포스터 id
+            user_id (int): 좋아요를 취소하는 사용자 id
+
+        Returns:
+            int | None: 변경된 좋아요 수, 누르지 않았거나 포스터가 없으면 None
+        """
+        with self.lock_of(post_id):
+            if not self.like_db.delete_like(post_id, user_id):
+                return None
+
+            count = self.post_db.update_like(post_id, -1)
+            if count is None:
+                self.like_db.add_like(post_id, user_id)
+            return count
+
+    def reconcile(self) -> dict[int, tuple[int, int]]:
+        """
+        모든 포스터의 좋아요 수를 멤버십에서 한 번에 다시 세어 맞춘다
+
+        먼저 락 없이 전체 개수를 비교하고,
+        어긋난 포스터만 락 안에서 다시 세어 고친다 (세는 사이에 좋아요가 눌렸을 수 있으므로)
+
+        Returns:
+            dict[int, tuple[int, int]]: 어긋났던 포스터 post_id -> (저장된 좋아요 수, 실제 좋아요 수)
+        """
+        actual = self.like_db.count_likes_by_post()
+        drift = {}
+        for post_id, stored in self.post_db.get_like_counts().items():
+            if stored == actual.get(post_id, 0):
+                continue
+
+            with self.lock_of(post_id):
+                post = self.post_db.get_post_by_id(post_id)
+                if post is None:
+                    continue
+                count = self.like_db.count_likes_by_post_id(post_id)
+                if post.like != count:
+                    self.post_db.update_like(post_id, count - post.like)
+                    drift[post_id] = (post.like, count)
+
+        return drift
+
+
+def report_drift(drift: dict[int, tuple[int, int]]) -> None:
+    if drift:
+        logger.warning(
+            "like counters drifted on %d posts: %s",
+            len(drift),
+            ", ".join(f"{post_id}: {stored} -> {actual}" for post_id, (stored, actual) in drift.items())
+        )
+
+
+def reconcile_forever(like_service: LikeService, interval: float) -> None:
+    """
+    interval초마다 좋아요 수 정합성 검사 (공유 저장소 프로세스의 백그라운드 스레드에서 사용)
+    """
+    while True:
+        report_drift(like_service.reconcile())
+        time.sleep(interval)
+
+
+async def reconcile_once(like_service, post_cache=None) -> dict[int, tuple[int, int]]:
+    """
+    좋아요 수 정합성 검사를 한 번 실행하고, 좋아요 수를 고친 포스터의 캐시된 상세 응답을 지운다
+
+    update_like로 고치면 포스터 version도 바뀌지만, 캐시는 같은 워커의 라우터를 거친 변경만 알기 때문에
+    여기서 지우지 않으면 TTL이 없을 때 다른 변경이 있을 때까지 예전 좋아요 수와 ETag가 나간다
+    """
+    drift = await like_service.reconcile()
+    report_drift(drift)
+    if post_cache is not None:
+        for post_id in drift:
+            post_cache.invalidate(post_id)
+    return drift
+
+
+async def reconcile_periodically(like_service, interval: float, post_cache=None) -> None:
+    """
+    interval초마다 좋아요 수 정합성 검사 (서버 이벤트 루프의 백그라운드 태스크에서 사용)
+
+    like_service는 비동기 어댑터로 감싼 서비스라서,
+    메모리 저장소에서는 요청 처리와 같은 이벤트 루프에서 실행되어 모델에 락이 필요 없다
+    """
+    while True:
+        await reconcile_once(like_service, post_cache)
+        await asyncio.sleep(interval)
@@ -0,0 +1,154 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from pydantic import BaseModel
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    response: BaseModel
+    # 저장소에 반영된 조회수 (ViewCounter가 반영할 때마다 더해서 최신으로 유지)
+    view: int
+    # 응답에 들어간 사용자 (작성자 + 댓글 작성자), 프로필이 바뀌면 무효화
+    user_ids: frozenset[int]
+    # 응답에 들어간 항목들의 version으로 만든 ETag 재료 (조회수는 응답할 때 더함)
+    etag_key: str
+    size: int
+    expires_at: float
+
+
+class PostCache:
+    """
+    게시글 상세 응답을 post_id별로 담아두는 LRU 캐시 (워커 프로세스 안)
+
+    응답을 만드는 데 쓴 데이터(포스터, 작성자, 댓글, 좋아요)가 바뀌면
+    라우터가 invalidate / invalidate_user를 불러서 그 응답만 지운다.
+    조회수는 캐시를 지우지 않고 따로 유지한다: 저장된 조회수는 add_views로 갱신하고,
+    반영 전 증가분은 응답할 때 더한다.
+
+    응답을 만드는 중(await)에 무효화가 일어나면 낡은 응답을 넣지 않도록,
+    get()이 돌려준 세대(generation)가 put() 때와 다르면 넣지 않는다.
+
+    모든 메소드는 이벤트 루프에서만 호출하므로 락이 필요 없다.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, ttl: float = 0.0):
+        """
+        Args:
+            max_bytes (int): 캐시에 담을 응답 크기(JSON 바이트) 합의 상한
+            ttl (float): 응답을 담아두는 최대 시간(초), 0이면 무효화될 때까지
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self.entries: OrderedDict[int, CacheEntry] = OrderedDict()
+        self.total_bytes = 0
+        # user_id -> 그 사용자가 들어간 캐시된 post_id
+        self.posts_by_user: dict[int, set[int]] = {}
+        self.generation = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, post_id: int) -> tuple[CacheEntry | None, int]:
+        """
+        캐시된 응답을 찾는다
+
+        Returns:
+            tuple[CacheEntry | None, int]: 캐시 항목(없으면 None), put()에 넘길 세대
+        """
+        entry = self.entries.get(post_id)
+        if entry is not None and self.ttl > 0 and entry.expires_at < time.monotonic():
+            self.remove(post_id)
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None, self.generation
+
+        self.entries.move_to_end(post_id)
+        self.hits += 1
+        return entry, self.generation
+
+    def put(
+            self,
+            post_id: int,
+            generation: int,
+            response: BaseModel,
+            view: int,
+            user_ids: set[int],
+            etag_key: str
+        ) -> None:
+        """
+        만든 응답을 담는다 (get() 이후 무효화가 있었으면 담지 않음)
+
+        Args:
+            post_id (int): 게시글 id
+            generation (int): get()이 돌려준 세대
+            response (BaseModel): 게시글 상세 응답
+            view (int): 응답을 만들 때 읽은 저장된 조회수
+            user_ids (set[int]): 응답에 들어간 사용자 id
+            etag_key (str): 응답에 들어간 항목들의 version으로 만든 ETag 재료
+        """
+        if generation != self.generation or self.max_bytes <= 0:
+            return
+
+        size = len(response.model_dump_json())
+        if size > self.max_bytes:
+            return
+
+        self.remove(post_id)
+        self.entries[post_id] = CacheEntry(
+            response=response,
+            view=view,
+            user_ids=frozenset(user_ids),
+            etag_key=etag_key,
+            size=size,
+            expires_at=time.monotonic() + self.ttl
+        )
+        self.total_bytes += size
+        for user_id in user_ids:
+            self.posts_by_user.setdefault(user_id, set()).add(post_id)
+
+        while self.total_bytes > self.max_bytes:
+            self.remove(next(iter(self.entries)))
+
+    def remove(self, post_id: int) -> None:
+        entry = self.entries.pop(post_id, None)
+        if entry is None:
+            return
+
+        self.total_bytes -= entry.size
+        for user_id in entry.user_ids:
+            post_ids = self.posts_by_user[user_id]
+            post_ids.discard(post_id)
+            if not post_ids:
+                del self.posts_by_user[user_id]
+
+    def invalidate(self, post_id: int) -> None:
+        """
+        게시글 내용/댓글/좋아요가 바뀌었을 때 그 게시글의 응답을 지운다
+        """
+        self.generation += 1
+        self.remove(post_id)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """
+        사용자 프로필이 바뀌거나 탈퇴했을 때 그 사용자가 작성자/댓글 작성자로 들어간 응답을 지운다
+        """
+        self.generation += 1
+        for post_id in list(self.posts_by_user.get(user_id, ())):
+            self.remove(post_id)
+
+    def add_views(self, views: list[tuple[int, int]]) -> None:
+        """
+        저장소에 반영된 조회수 증가분을 캐시 항목에 더한다 (ViewCounter.flush 후 호출)
+
+        반영 중에 만들던 응답은 조회수가 이미 반영됐는지 알 수 없으므로 담지 않는다
+        """
+        self.generation += 1
+        for post_id, count in views:
+            entry = self.entries.get(post_id)
+            if entry is not None:
+                entry.view += count
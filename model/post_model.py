@@ -1,5 +1,17 @@
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import islice
+from typing import Literal
+
 from pydantic import BaseModel, Field
 from .user_model import UserModel
+from .comment_model import comments
+from .binary_snapshot import ColumnarRows
+from .search_index import SearchIndex
+from .rank_index import RankIndex
 
 # 10개의 포스트 더미 데이터
 posts = [
@@ -96,7 +108,60 @@ posts = [
 ]
 
 
-class PostData(BaseModel):
+@dataclass(slots=True)
+class PostData:
+    """
+    DB에 저장되는 포스터 정보 (외부로 나갈 때는 PostPublic으로 변환)
+    """
+    post_id: int
+    title: str
+    content: str
+    image_url: list[str]
+    like: int
+    view: int
+    poster_id: int
+    posted_date: str
+    # 내용이나 좋아요 수가 바뀔 때마다 1 증가 (ETag에 사용, 조회수는 포함하지 않음)
+    version: int = 0
+
+
+@dataclass(slots=True)
+class PostSummary:
+    """
+    목록(피드)에 보여주는 포스터 요약 (외부로 나갈 때는 PostSummaryPublic으로 변환)
+
+    미리보기/대표 이미지/작성자 닉네임/댓글 수는 쓸 때 미리 만들어 저장해두므로
+    목록 조회 때 문자열을 자르거나 다른 저장소를 조회하지 않는다
+    """
+    post_id: int
+    title: str
+    preview: str
+    thumbnail: str | None
+    poster_id: int
+    poster_nickname: str
+    like: int
+    view: int
+    comment_count: int
+    posted_date: str
+    version: int
+
+
+# 목록 미리보기에 담는 본문 앞부분 글자 수
+PREVIEW_LENGTH = 100
+
+# 더미 포스터의 댓글 수 (더미 댓글 기준)
+dummy_comment_counts = Counter(comment["post_id"] for comment in comments)
+
+
+def make_preview(content: str) -> str:
+    return content[:PREVIEW_LENGTH]
+
+
+def make_thumbnail(image_url: list[str]) -> str | None:
+    return image_url[0] if image_url else None
+
+
+class PostPublic(BaseModel):
     post_id: int = Field(...)
     title: str = Field(...)
     content: str = Field(...)
@@ -107,10 +172,308 @@ class PostData(BaseModel):
     posted_date: str = Field(...)
 
 
+class PostSummaryPublic(BaseModel):
+    post_id: int
+    title: str
+    preview: str
+    thumbnail: str | None
+    poster_id: int
+    poster_nickname: str
+    like: int
+    view: int
+    comment_count: int
+    posted_date: str
+
+
+class PostColumns:
+    """
+    포스터를 열(column) 단위로 저장하는 저장소
+
+    숫자 필드(post_id, poster_id, like, view, version, comment_count)는 typed array에 연속으로 저장하고,
+    제목/내용/이미지/작성일은 각각 별도의 리스트 열에 저장한다.
+    목록 요약용 미리보기/대표 이미지/작성자 닉네임도 열로 두고 쓸 때 갱신한다.
+    한 행(row)은 모든 열에서 같은 위치를 가지며, post_id는 단조 증가하므로
+    행 순서가 곧 작성 순서다.
+
+    삭제는 alive 표시만 지우는 tombstone 방식이고,
+    삭제된 행이 절반을 넘으면 compact()로 열을 다시 채운다.
+
+    stride는 post_id를 stride로 나눈 나머지로 샤드를 나눌 때 쓰며,
+    row_of를 post_id // stride 위치에 두어 샤드마다 빈칸 없이 채운다.
+    """
+
+    def __init__(self, stride: int = 1):
+        self.stride = stride
+
+        self.post_id = array("q")
+        self.poster_id = array("q")
+        self.like = array("q")
+        self.view = array("q")
+        self.version = array("q")
+        self.comment_count = array("q")
+
+        self.title: list[str] = []
+        self.content: list[str] = []
+        self.image_url: list[list[str]] = []
+        self.posted_date: list[str] = []
+
+        # 목록 요약용 열
+        self.poster_nickname: list[str] = []
+        self.preview: list[str] = []
+        self.thumbnail: list[str | None] = []
+
+        # 행이 살아있으면 1, 삭제되었으면 0
+        self.alive = bytearray()
+        self.live_count = 0
+
+        # post_id // stride를 위치로 하는 행 번호 배열 (없거나 삭제된 포스터는 -1)
+        # post_id가 0부터 단조 증가하므로 dict 없이 O(1) 조회가 된다
+        self.row_of = array("q")
+
+    @classmethod
+    def from_snapshot(cls, columns: dict) -> "PostColumns":
+        """
+        바이너리 스냅샷의 열(ColumnarRows.columns)로 저장소를 만든다
+
+        숫자 열은 한 번에 복사(memcpy)하고, 문자열 열은 지연 디코딩 열을 그대로 쓴다.
+        스냅샷에는 살아있는 행만 들어있다.
+        """
+        store = cls()
+        store.post_id.frombytes(columns["post_id"].cast("B"))
+        store.poster_id.frombytes(columns["poster_id"].cast("B"))
+        store.like.frombytes(columns["like"].cast("B"))
+        store.view.frombytes(columns["view"].cast("B"))
+        if "version" in columns:
+            store.version.frombytes(columns["version"].cast("B"))
+        else:
+            # version 열이 없는 이전 스냅샷
+            store.version = array("q", bytes(8 * len(store.post_id)))
+
+        store.title = columns["title"]
+        store.content = columns["content"]
+        store.image_url = columns["image_url"]
+        store.posted_date = columns["posted_date"]
+
+        count = len(store.post_id)
+        if "comment_count" in columns:
+            store.comment_count.frombytes(columns["comment_count"].cast("B"))
+            store.poster_nickname = columns["poster_nickname"]
+            store.preview = columns["preview"]
+            store.thumbnail = columns["thumbnail"]
+        else:
+            # 요약 열이 없는 이전 스냅샷은 본문에서 다시 만든다 (댓글 수와 닉네임은 비어있음)
+            store.comment_count = array("q", bytes(8 * count))
+            store.poster_nickname = [""] * count
+            store.preview = [make_preview(content) for content in store.content]
+            store.thumbnail = [make_thumbnail(image_url) for image_url in store.image_url]
+
+        store.alive = bytearray(b"\x01") * count
+        store.live_count = count
+        if count:
+            store.row_of = array("q", [-1]) * (store.post_id[-1] + 1)
+            for row, post_id in enumerate(store.post_id):
+                store.row_of[post_id] = row
+
+        return store
+
+    def __len__(self) -> int:
+        return self.live_count
+
+    def append(self, post_id: int, title: str, content: str, image_url: list[str],
+               like: int, view: int, poster_id: int, posted_date: str, version: int = 0,
+               comment_count: int = 0, poster_nickname: str = "",
+               preview: str | None = None, thumbnail: str | None = None) -> None:
+        # preview가 없으면(새 포스터, 이전 스냅샷) 미리보기와 대표 이미지를 본문에서 만든다
+        if preview is None:
+            preview, thumbnail = make_preview(content), make_thumbnail(image_url)
+
+        slot = post_id // self.stride
+        if slot >= len(self.row_of):
+            self.row_of.extend([-1] * (slot + 1 - len(self.row_of)))
+        self.row_of[slot] = len(self.post_id)
+        self.live_count += 1
+
+        self.post_id.append(post_id)
+        self.poster_id.append(poster_id)
+        self.like.append(like)
+        self.view.append(view)
+        self.version.append(version)
+        self.comment_count.append(comment_count)
+        self.title.append(title)
+        self.content.append(content)
+        self.image_url.append(image_url)
+        self.posted_date.append(posted_date)
+        self.poster_nickname.append(poster_nickname)
+        self.preview.append(preview)
+        self.thumbnail.append(thumbnail)
+        self.alive.append(1)
+
+    def row(self, post_id: int) -> int | None:
+        slot = post_id // self.stride
+        if 0 <= slot < len(self.row_of):
+            row = self.row_of[slot]
+            if row >= 0:
+                return row
+        return None
+
+    def materialize(self, row: int) -> PostData:
+        """
+        행 하나를 PostData로 만들어 반환 (반환된 객체를 수정해도 저장소에는 반영되지 않음)
+        """
+        return PostData(
+            post_id=self.post_id[row],
+            title=self.title[row],
+            content=self.content[row],
+            image_url=self.image_url[row],
+            like=self.like[row],
+            view=self.view[row],
+            poster_id=self.poster_id[row],
+            posted_date=self.posted_date[row],
+            version=self.version[row]
+        )
+
+    def summarize(self, row: int) -> PostSummary:
+        """
+        행 하나를 목록용 PostSummary로 만들어 반환 (본문과 이미지 목록은 읽지 않음)
+        """
+        return PostSummary(
+            post_id=self.post_id[row],
+            title=self.title[row],
+            preview=self.preview[row],
+            thumbnail=self.thumbnail[row],
+            poster_id=self.poster_id[row],
+            poster_nickname=self.poster_nickname[row],
+            like=self.like[row],
+            view=self.view[row],
+            comment_count=self.comment_count[row],
+            posted_date=self.posted_date[row],
+            version=self.version[row]
+        )
+
+    def set_content(self, row: int, title: str, content: str, image_url: list[str]) -> None:
+        """
+        제목/내용/이미지를 바꾸고 미리보기와 대표 이미지를 다시 만든다
+        """
+        self.title[row] = title
+        self.content[row] = content
+        self.image_url[row] = image_url
+        self.preview[row] = make_preview(content)
+        self.thumbnail[row] = make_thumbnail(image_url)
+        self.version[row] += 1
+
+    def delete(self, post_id: int) -> bool:
+        row = self.row(post_id)
+        if row is None:
+            return False
+
+        self.row_of[post_id // self.stride] = -1
+        self.live_count -= 1
+        self.alive[row] = 0
+        # 문자열 열은 바로 비워서 메모리를 돌려준다
+        self.title[row] = ""
+        self.content[row] = ""
+        self.image_url[row] = []
+        self.posted_date[row] = ""
+        self.poster_nickname[row] = ""
+        self.preview[row] = ""
+        self.thumbnail[row] = None
+
+        if self.live_count * 2 < len(self.post_id):
+            self.compact()
+        return True
+
+    def compact(self) -> None:
+        """
+        삭제된 행을 제거하고 열을 다시 채운다 (행 순서는 유지)
+        """
+        rows = [row for row in range(len(self.post_id)) if self.alive[row]]
+
+        self.post_id = array("q", (self.post_id[row] for row in rows))
+        self.poster_id = array("q", (self.poster_id[row] for row in rows))
+        self.like = array("q", (self.like[row] for row in rows))
+        self.view = array("q", (self.view[row] for row in rows))
+        self.version = array("q", (self.version[row] for row in rows))
+        self.comment_count = array("q", (self.comment_count[row] for row in rows))
+        self.title = [self.title[row] for row in rows]
+        self.content = [self.content[row] for row in rows]
+        self.image_url = [self.image_url[row] for row in rows]
+        self.posted_date = [self.posted_date[row] for row in rows]
+        self.poster_nickname = [self.poster_nickname[row] for row in rows]
+        self.preview = [self.preview[row] for row in rows]
+        self.thumbnail = [self.thumbnail[row] for row in rows]
+        self.alive = bytearray(b"\x01" * len(rows))
+        for row, post_id in enumerate(self.post_id):
+            self.row_of[post_id // self.stride] = row
+
+    def live_rows(self):
+        """
+        살아있는 행 번호를 작성 순서대로 순회
+        """
+        alive = self.alive
+        return (row for row in range(len(alive)) if alive[row])
+
+
+def slice_sorted_keys(
+        index,
+        key: tuple[str, int] | None,
+        limit: int,
+        descending: bool,
+        key_of=None
+    ):
+    """
+    정렬된 (posted_date, post_id) 인덱스에서 key 다음의 항목을 limit + 1개까지 잘라서 반환
+
+    하나를 더 가져와서 다음 페이지가 있는지 알 수 있게 한다.
+    인덱스 항목이 키가 아니면(post_id 배열 등) key_of로 항목의 키를 구해서 비교한다.
+    """
+    if descending:
+        end = len(index) if key is None else bisect_left(index, key, key=key_of)
+        return index[max(0, end - limit - 1):end][::-1]
+
+    start = 0 if key is None else bisect_right(index, key, key=key_of)
+    return index[start:start + limit + 1]
+
+
+def load_int_array(values) -> array | None:
+    """
+    스냅샷의 정수 목록(JSON은 list, 바이너리는 memoryview)을 array로 (없으면 None)
+    """
+    if values is None:
+        return None
+    if isinstance(values, memoryview):
+        result = array("q")
+        result.frombytes(values.cast("B"))
+        return result
+    return array("q", values)
+
+
 class PostModel():
+    # 상태를 바꾸는 메소드 (작업 로그에 기록됨)
+    MUTATIONS = (
+        "add_post", "edit_post", "update_like", "increase_view", "add_views", "delete_post_by_id",
+        "update_comment_count", "update_poster_nickname"
+    )
+
     def __init__(self):
-        
-        self.post_db = []
+
+        # 포스터는 열 단위 저장소에 보관 (행 순서 = 작성 순서)
+        self.columns = PostColumns()
+
+        # 삭제 후에도 id가 재사용되지 않도록 단조 증가하는 id
+        self.next_post_id = 0
+
+        # 커서 페이지네이션용 정렬 인덱스: (posted_date, post_id) 순서의 post_id 배열
+        # 작성/삭제 때 갱신하고 스냅샷에도 저장한다 (date_order가 없는 이전 스냅샷만 처음 필요할 때 만듦)
+        self.date_index: array | None = array("q")
+
+        # 작성자별 (posted_date, post_id) 정렬 인덱스 (처음 필요할 때 만듦)
+        self.author_index: dict[int, list[tuple[str, int]]] | None = None
+
+        # 제목/본문 검색용 역색인 (처음 검색할 때 만들고 이후 작성/수정/삭제 때 갱신)
+        self.search_index: SearchIndex | None = None
+
+        # 인기순 목록용 (좋아요/조회수, post_id) 정렬 인덱스 ("like"/"view"별로 처음 필요할 때 만듦)
+        self.rank_indexes: dict[str, RankIndex] = {}
 
         for post in posts:
             self.add_dummy_post(**post)
@@ -140,18 +503,25 @@ class PostModel():
         user_db = UserModel()
         poster_data = user_db.search_user_by_id(poster_id)
         if poster_data:
-            self.post_db.append(
-                PostData(
-                    post_id=len(self.post_db),
-                    title=title,
-                    content=content,
-                    image_url=image_url,
-                    like=like,
-                    view=view,
-                    poster_id=poster_id,
-                    posted_date=posted_date
-                )
+            post_id = self.next_post_id
+            self.next_post_id += 1
+
+            self.columns.append(
+                post_id=post_id,
+                title=title,
+                content=content,
+                image_url=image_url,
+                like=like,
+                view=view,
+                poster_id=poster_id,
+                posted_date=posted_date,
+                comment_count=dummy_comment_counts[post_id],
+                poster_nickname=poster_data.nickname
             )
+            self.index_add(posted_date, post_id)
+            self.author_index_add(poster_id, posted_date, post_id)
+            self.search_index_add(post_id, title, content)
+            self.rank_add(post_id, like, view)
 
 
     def add_post(
@@ -160,6 +530,7 @@ class PostModel():
             content: str,
             poster_id: int,
             image_url: list[str] = [],
+            poster_nickname: str = ""
         ) -> int:
         """
         포스터를 DB에 추가해주는 함수
@@ -169,65 +540,549 @@ class PostModel():
             content (str): 포스터의 내용
             poster_id (int): 작성자
             image_url (list[str]): 포스터의 이미지
+            poster_nickname (str): 작성자 닉네임 (목록 요약에 저장)
         
         Return:
             int: 추가된 포스터의 id값
         """
+        post_id = self.next_post_id
+        self.next_post_id += 1
 
-
-        self.post_db.append(
-            PostData(
-                post_id=len(self.post_db),
-                title=title,
-                content=content,
-                image_url=image_url,
-                like=0,
-                view=0,
-                poster_id=poster_id,
-                posted_date="2000-10-11"
-            )
+        self.columns.append(
+            post_id=post_id,
+            title=title,
+            content=content,
+            image_url=image_url,
+            like=0,
+            view=0,
+            poster_id=poster_id,
+            posted_date="2000-10-11",
+            poster_nickname=poster_nickname
         )
+        self.index_add("2000-10-11", post_id)
+        self.author_index_add(poster_id, "2000-10-11", post_id)
+        self.search_index_add(post_id, title, content)
+        self.rank_add(post_id, 0, 0)
 
-        return len(self.post_db) - 1
+        return post_id
 
 
     def get_post_by_id(self, post_id: int) -> PostData | None:
         """
-        DB에서 post_id를 이용하여 사용자를 조회
+        DB에서 post_id를 이용하여 포스터를 조회
+
+        반환되는 PostData는 조회 시점의 사본이므로,
+        수정은 edit_post / update_like / increase_view를 사용한다
 
         Args:
             post_id (int): 검색에 사용될 post_id
 
         Returns:
-            PostData | None: DB에 사용자가 있으면 유저 데이터 반환
+            PostData | None: DB에 포스터가 있으면 포스터 데이터 반환
         """
-        for post_data in self.post_db:
-            if post_data.post_id == post_id:
-                return post_data
-        return None
+        row = self.columns.row(post_id)
+        if row is None:
+            return None
+        return self.columns.materialize(row)
 
 
-    def delete_post_by_id(self, post_id: int) -> PostData | None:
+    def get_posts_by_ids(self, post_ids: Iterable[int]) -> dict[int, PostData]:
         """
-        DB에서 post_id를 이용하여 사용자를 조회
+        여러 포스터를 한 번에 조회 (같은 포스터는 한 번만 찾는다)
 
         Args:
-            post_id (int): 검색에 사용될 post_id
+            post_ids (Iterable[int]): 조회할 post_id 목록 (중복 가능)
+
+        Returns:
+            dict[int, PostData]: post_id -> 포스터 데이터 사본, 없는 포스터는 빠진다
+        """
+        columns = self.columns
+        posts = {}
+        for post_id in set(post_ids):
+            row = columns.row(post_id)
+            if row is not None:
+                posts[post_id] = columns.materialize(row)
+        return posts
+
+
+    def scan_posts(self, after: int | None, limit: int) -> list[PostData]:
+        """
+        post_id 순서로 after 다음의 포스터를 limit개 조회 (전체 내보내기용)
+
+        id는 단조 증가하므로 after 다음 id 구간을 get_posts_by_ids로 차례로 찾는다 (삭제된 id만큼만 더 본다)
+
+        Args:
+            after (int | None): 이전 묶음의 마지막 post_id, None이면 처음부터
+            limit (int): 가져올 개수
+
+        Returns:
+            list[PostData]: post_id 순 포스터 데이터 사본 (limit개보다 적으면 마지막 묶음)
+        """
+        posts = []
+        start = 0 if after is None else after + 1
+        while len(posts) < limit and start < self.next_post_id:
+            end = min(start + limit - len(posts), self.next_post_id)
+            found = self.get_posts_by_ids(range(start, end))
+            posts.extend(found[post_id] for post_id in sorted(found))
+            start = end
+        return posts
+
+
+    def get_summary_by_id(self, post_id: int) -> PostSummary | None:
+        """
+        post_id로 포스터의 목록 요약을 조회 (본문을 읽지 않음)
+        """
+        row = self.columns.row(post_id)
+        if row is None:
+            return None
+        return self.columns.summarize(row)
+
+
+    def edit_post(self, post_id: int, title: str, content: str, image_url: list[str]) -> bool:
+        """
+        포스터의 제목, 내용, 이미지를 수정
+
+        Args:
+            post_id (int): 수정할 post_id
+            title (str): 새 제목
+            content (str): 새 내용
+            image_url (list[str]): 새 이미지 목록
+
+        Returns:
+            bool: 포스터가 있어서 수정했으면 True
+        """
+        row = self.columns.row(post_id)
+        if row is None:
+            return False
+
+        self.columns.set_content(row, title, content, image_url)
+        self.search_index_add(post_id, title, content)
+        return True
+
+
+    def update_like(self, post_id: int, delta: int) -> int | None:
+        """
+        포스터의 좋아요 수를 delta만큼 변경
+
+        Args:
+            post_id (int): 변경할 post_id
+            delta (int): 더할 값 (취소는 음수)
+
+        Returns:
+            int | None: 변경된 좋아요 수, 포스터가 없으면 None
+        """
+        row = self.columns.row(post_id)
+        if row is None:
+            return None
+
+        like = self.columns.like[row]
+        self.columns.like[row] = like + delta
+        self.columns.version[row] += 1
+        self.rank_move("like", post_id, like, like + delta)
+        return like + delta
+
+
+    def update_comment_count(self, post_id: int, delta: int) -> int | None:
+        """
+        포스터의 댓글 수(목록 요약)를 delta만큼 변경
+
+        Args:
+            post_id (int): 변경할 post_id
+            delta (int): 더할 값 (삭제는 음수)
+
+        Returns:
+            int | None: 변경된 댓글 수, 포스터가 없으면 None
+        """
+        row = self.columns.row(post_id)
+        if row is None:
+            return None
+
+        self.columns.comment_count[row] += delta
+        self.columns.version[row] += 1
+        return self.columns.comment_count[row]
+
+
+    def update_poster_nickname(self, poster_id: int, nickname: str) -> int:
+        """
+        작성자가 닉네임을 바꾸면 그 사용자가 쓴 포스터의 목록 요약 닉네임을 바꾼다
+
+        Args:
+            poster_id (int): 닉네임을 바꾼 사용자 id
+            nickname (str): 새 닉네임
+
+        Returns:
+            int: 닉네임을 바꾼 포스터 수
+        """
+        columns = self.columns
+        rows = [columns.row(post_id) for _, post_id in self.author_keys(poster_id)]
+        for row in rows:
+            columns.poster_nickname[row] = nickname
+            columns.version[row] += 1
+        return len(rows)
+
+
+    def increase_view(self, post_id: int) -> int | None:
+        """
+        포스터의 조회수를 1 증가
+
+        Args:
+            post_id (int): 조회한 post_id
+
+        Returns:
+            int | None: 증가된 조회수, 포스터가 없으면 None
+        """
+        row = self.columns.row(post_id)
+        if row is None:
+            return None
+
+        view = self.columns.view[row]
+        self.columns.view[row] = view + 1
+        self.rank_move("view", post_id, view, view + 1)
+        return view + 1
+
+
+    def add_views(self, views: list[tuple[int, int]]) -> int:
+        """
+        여러 포스터의 조회수를 한 번에 증가 (ViewCounter가 모아둔 증가분 반영)
+
+        Args:
+            views (list[tuple[int, int]]): (post_id, 증가분) 목록, 없는 포스터는 건너뜀
+
+        Returns:
+            int: 조회수를 증가시킨 포스터 수
+        """
+        updated = 0
+        for post_id, count in views:
+            row = self.columns.row(post_id)
+            if row is not None:
+                view = self.columns.view[row]
+                self.columns.view[row] = view + count
+                self.rank_move("view", post_id, view, view + count)
+                updated += 1
+        return updated
+
+
+    def delete_post_by_id(self, post_id: int) -> bool:
+        """
+        DB에서 post_id에 해당하는 포스터를 삭제
+
+        Args:
+            post_id (int): 삭제할 post_id
+
+        Returns:
+            bool: 포스터가 있어서 삭제했으면 True
+        """
+        row = self.columns.row(post_id)
+        if row is None:
+            return False
+
+        self.index_remove(self.columns.posted_date[row], post_id)
+        self.author_index_remove(self.columns.poster_id[row], self.columns.posted_date[row], post_id)
+        self.search_index_remove(post_id)
+        self.rank_remove(post_id, self.columns.like[row], self.columns.view[row])
+        return self.columns.delete(post_id)
+
+
+    def get_posts(self, offset: int, limit: int, summary: bool = False) -> tuple[list[PostData] | list[PostSummary], int]:
+        total = len(self.columns)
+        next_offset = min(total, offset + limit)
+
+        # DB에서 포스터를 가져오는 코드 (작성 순서)
+        rows = islice(self.columns.live_rows(), offset, next_offset)
+        project = self.columns.summarize if summary else self.columns.materialize
+        posts = [project(row) for row in rows]
+
+        return posts, next_offset if next_offset != total else -1
+
+
+    def get_posts_after(
+            self,
+            key: tuple[str, int] | None,
+            limit: int,
+            descending: bool = False,
+            summary: bool = False
+        ) -> tuple[list[PostData] | list[PostSummary], bool]:
+        """
+        (posted_date, post_id) 순서에서 key 다음의 포스터를 limit개 조회 (커서 페이지네이션)
+
+        offset 방식과 달리 앞쪽 페이지의 개수와 상관없이 O(log n + limit)이고,
+        페이지 사이에 포스터가 삭제/추가되어도 건너뛰거나 겹치지 않는다
+
+        Args:
+            key (tuple[str, int] | None): 이전 페이지의 마지막 (posted_date, post_id), None이면 처음부터
+            limit (int): 가져올 개수
+            descending (bool): True면 최신순(내림차순)
+            summary (bool): True면 PostData 대신 목록 요약(PostSummary)으로 조회
+
+        Returns:
+            tuple[list[PostData] | list[PostSummary], bool]: 포스터 목록, 그 다음에도 포스터가 더 있는지
+        """
+        post_ids = slice_sorted_keys(self.sorted_keys(), key, limit, descending, self.date_key)
+        fetch = self.get_summary_by_id if summary else self.get_post_by_id
+        posts = [fetch(post_id) for post_id in post_ids[:limit]]
+        return posts, len(post_ids) > limit
+
+
+    def sorted_keys(self) -> array:
+        """
+        (posted_date, post_id) 순서의 post_id 배열
+
+        정수 배열이라 스냅샷에서 그대로 복사해 올리고, 이분 탐색에서 비교하는 행의 작성일만 디코딩한다.
+        date_order가 없는 이전 스냅샷으로 올렸을 때만 여기서 작성일을 모두 읽어서 만든다.
+        """
+        if self.date_index is None:
+            columns = self.columns
+            keys = sorted((columns.posted_date[row], columns.post_id[row]) for row in columns.live_rows())
+            self.date_index = array("q", (post_id for _, post_id in keys))
+        return self.date_index
+
+    def date_key(self, post_id: int) -> tuple[str, int]:
+        return self.columns.posted_date[self.columns.row(post_id)], post_id
+
+    def index_add(self, posted_date: str, post_id: int) -> None:
+        if self.date_index is not None:
+            index = self.date_index
+            index.insert(bisect_right(index, (posted_date, post_id), key=self.date_key), post_id)
+
+    def index_remove(self, posted_date: str, post_id: int) -> None:
+        # 열에서 지우기 전에 호출된다 (비교할 때 지울 포스터의 작성일도 읽으므로)
+        if self.date_index is not None:
+            index = self.date_index
+            del index[bisect_left(index, (posted_date, post_id), key=self.date_key)]
+
+
+    def get_posts_by_poster(
+            self,
+            poster_id: int,
+            key: tuple[str, int] | None,
+            limit: int,
+            descending: bool = False,
+            summary: bool = False
+        ) -> tuple[list[PostData] | list[PostSummary], bool]:
+        """
+        한 작성자의 포스터를 (posted_date, post_id) 순서로 key 다음부터 limit개 조회
+
+        작성자별 인덱스만 보므로 전체 포스터 수와 상관없이 그 작성자의 포스터 수에만 비례한다
+
+        Args:
+            poster_id (int): 작성자 id
+            key (tuple[str, int] | None): 이전 페이지의 마지막 (posted_date, post_id), None이면 처음부터
+            limit (int): 가져올 개수
+            descending (bool): True면 최신순(내림차순)
+            summary (bool): True면 PostData 대신 목록 요약(PostSummary)으로 조회
+
+        Returns:
+            tuple[list[PostData] | list[PostSummary], bool]: 포스터 목록, 그 다음에도 포스터가 더 있는지
+        """
+        keys = slice_sorted_keys(self.author_keys(poster_id), key, limit, descending)
+        fetch = self.get_summary_by_id if summary else self.get_post_by_id
+        posts = [fetch(post_id) for _, post_id in keys[:limit]]
+        return posts, len(keys) > limit
+
+    def author_keys(self, poster_id: int) -> list[tuple[str, int]]:
+        """
+        작성자의 (posted_date, post_id) 정렬 인덱스 (포스터가 없으면 빈 리스트)
+        """
+        if self.author_index is None:
+            columns = self.columns
+            author_index: dict[int, list[tuple[str, int]]] = {}
+            for row in columns.live_rows():
+                author_index.setdefault(columns.poster_id[row], []).append(
+                    (columns.posted_date[row], columns.post_id[row])
+                )
+            for keys in author_index.values():
+                keys.sort()
+            self.author_index = author_index
+        return self.author_index.get(poster_id, [])
+
+    def author_index_add(self, poster_id: int, posted_date: str, post_id: int) -> None:
+        if self.author_index is not None:
+            insort(self.author_index.setdefault(poster_id, []), (posted_date, post_id))
+
+    def author_index_remove(self, poster_id: int, posted_date: str, post_id: int) -> None:
+        if self.author_index is not None:
+            keys = self.author_index[poster_id]
+            del keys[bisect_left(keys, (posted_date, post_id))]
+            if not keys:
+                del self.author_index[poster_id]
+
+
+    def get_posts_ranked(
+            self,
+            field: Literal["like", "view"],
+            key: tuple[int, int] | None,
+            limit: int,
+            descending: bool = True,
+            summary: bool = False
+        ) -> tuple[list[PostData] | list[PostSummary], bool]:
+        """
+        (좋아요 수 또는 조회수, post_id) 순서에서 key 다음의 포스터를 limit개 조회 (인기순 커서 페이지네이션)
+
+        정렬 인덱스는 좋아요/조회수가 바뀔 때마다 갱신되므로 요청마다 전체를 정렬하지 않는다.
+        조회수는 ViewCounter가 저장소에 반영한 값 기준이다.
+
+        Args:
+            field (str): "like" 또는 "view"
+            key (tuple[int, int] | None): 이전 페이지의 마지막 (카운트, post_id), None이면 처음부터
+            limit (int): 가져올 개수
+            descending (bool): True면 많은 순(내림차순)
+            summary (bool): True면 PostData 대신 목록 요약(PostSummary)으로 조회
+
+        Returns:
+            tuple[list[PostData] | list[PostSummary], bool]: 포스터 목록, 그 다음에도 포스터가 더 있는지
+        """
+        keys = self.ranked_keys(field).after(key, limit, descending)
+        fetch = self.get_summary_by_id if summary else self.get_post_by_id
+        posts = [fetch(post_id) for _, post_id in keys[:limit]]
+        return posts, len(keys) > limit
+
+    def ranked_keys(self, field: str) -> RankIndex:
+        rank_index = self.rank_indexes.get(field)
+        if rank_index is None:
+            columns = self.columns
+            counts = getattr(columns, field)
+            rank_index = RankIndex((counts[row], columns.post_id[row]) for row in columns.live_rows())
+            self.rank_indexes[field] = rank_index
+        return rank_index
+
+    def rank_add(self, post_id: int, like: int, view: int) -> None:
+        for field, count in (("like", like), ("view", view)):
+            if field in self.rank_indexes:
+                self.rank_indexes[field].add((count, post_id))
+
+    def rank_remove(self, post_id: int, like: int, view: int) -> None:
+        for field, count in (("like", like), ("view", view)):
+            if field in self.rank_indexes:
+                self.rank_indexes[field].remove((count, post_id))
+
+    def rank_move(self, field: str, post_id: int, old: int, new: int) -> None:
+        if field in self.rank_indexes:
+            self.rank_indexes[field].move((old, post_id), (new, post_id))
+
+
+    def search_posts(self, query: str, limit: int, offset: int = 0) -> list[PostSummary]:
+        """
+        제목/본문에서 검색어와 관련 있는 포스터를 BM25 점수 순으로 조회
+
+        Args:
+            query (str): 검색어
+            limit (int): 가져올 개수
+            offset (int): 건너뛸 개수
+
+        Returns:
+            list[PostSummary]: 관련도 순 포스터 요약 목록
+        """
+        hits = self.built_search_index().search(query, limit, offset)
+        posts = [self.get_summary_by_id(post_id) for post_id, _ in hits]
+        return [post for post in posts if post is not None]
+
+    def built_search_index(self) -> SearchIndex:
+        """
+        검색 역색인 (스냅샷으로 올린 본문을 시작할 때 모두 디코딩하지 않도록 처음 검색할 때 만든다)
+        """
+        if self.search_index is None:
+            columns = self.columns
+            search_index = SearchIndex()
+            for row in columns.live_rows():
+                search_index.add(columns.post_id[row], columns.title[row], columns.content[row])
+            self.search_index = search_index
+        return self.search_index
+
+    def search_index_add(self, post_id: int, title: str, content: str) -> None:
+        if self.search_index is not None:
+            self.search_index.add(post_id, title, content)
+
+    def search_index_remove(self, post_id: int) -> None:
+        if self.search_index is not None:
+            self.search_index.remove(post_id)
+
+
+    def get_like_counts(self) -> dict[int, int]:
+        """
+        살아있는 모든 포스터의 좋아요 수를 한 번에 반환 (좋아요 수 정합성 검사용)
 
         Returns:
-            PostData | None: DB에 사용자가 있으면 유저 데이터 반환
+            dict[int, int]: post_id -> 저장된 좋아요 수
+        """
+        columns = self.columns
+        return {columns.post_id[row]: columns.like[row] for row in columns.live_rows()}
+
+
+    def dump_state(self) -> dict:
         """
-        for idx, post_data in enumerate(self.post_db):
-            if post_data.post_id == post_id:
-                del self.post_db[idx]
-                return True
-        return False
+        스냅샷에 저장할 상태를 JSON으로 바꿀 수 있는 형태로 반환
+        """
+        columns = self.columns
+        return {
+            "next_post_id": self.next_post_id,
+            "posts": [
+                [columns.post_id[row], columns.title[row], columns.content[row], columns.image_url[row],
+                 columns.like[row], columns.view[row], columns.poster_id[row], columns.posted_date[row],
+                 columns.version[row], columns.comment_count[row], columns.poster_nickname[row],
+                 columns.preview[row], columns.thumbnail[row]]
+                for row in columns.live_rows()
+            ],
+            "date_order": list(self.sorted_keys())
+        }
+
+    def load_state(self, state: dict) -> None:
+        """
+        dump_state로 만든 상태로 열 저장소를 다시 만든다
+
+        정렬 인덱스(date_order)는 정수 배열이라 그대로 복사하고, 나머지 인덱스는 처음 필요할 때 만든다
+        """
+        rows = state["posts"]
+        if isinstance(rows, ColumnarRows):
+            self.columns = PostColumns.from_snapshot(rows.columns)
+        else:
+            self.columns = PostColumns()
+            for row in rows:
+                self.columns.append(*row)
+
+        self.next_post_id = state["next_post_id"]
+        self.date_index = load_int_array(state.get("date_order"))
+        self.author_index = None
+        self.search_index = None
+        self.rank_indexes = {}
+
+
+    @staticmethod
+    def post_data_2_post_public(data: PostData) -> PostPublic:
+        """
+        DB에서 가져온 포스터를 외부로 전송하는 데이터로 변경
 
+        Args:
+            data (PostData): 변경할 데이터
 
-    def get_posts(self, offset: int, limit: int) -> tuple[list[PostData], int]:
-        next_offset = min(len(self.post_db), offset + limit)
+        Returns:
+            PostPublic: 외부로 전송가능한 포스터 정보
+        """
+        return PostPublic(
+            post_id=data.post_id,
+            title=data.title,
+            content=data.content,
+            image_url=data.image_url,
+            like=data.like,
+            view=data.view,
+            poster_id=data.poster_id,
+            posted_date=data.posted_date
+        )
 
-        # DB에서 포스터를 가져오는 코드
-        posts = self.post_db[offset:next_offset]
 
-        return posts, next_offset if next_offset != len(self.post_db) else -1
+    @staticmethod
+    def post_summary_2_summary_public(data: PostSummary) -> PostSummaryPublic:
+        """
+        목록 요약을 외부로 전송하는 데이터로 변경
+        """
+        return PostSummaryPublic(
+            post_id=data.post_id,
+            title=data.title,
+            preview=data.preview,
+            thumbnail=data.thumbnail,
+            poster_id=data.poster_id,
+            poster_nickname=data.poster_nickname,
+            like=data.like,
+            view=data.view,
+            comment_count=data.comment_count,
+            posted_date=data.posted_date
+        )
@@ -0,0 +1,101 @@
+from bisect import bisect_left, bisect_right, insort
+
+
+class RankIndex:
+    """
+    (카운트, post_id) 키를 정렬된 상태로 유지하는 인덱스 (인기순 목록용)
+
+    좋아요/조회수는 계속 바뀌므로, 하나의 큰 정렬 리스트에 insort/del을 하면
+    바뀔 때마다 리스트 전체를 옮기게 된다. 그래서 키를 LOAD개 안팎의 작은 정렬 리스트(버킷)로 나누고,
+    각 버킷의 최댓값 목록(maxes)을 이분 탐색해서 버킷을 찾은 뒤 그 버킷 안에서만 넣고 뺀다.
+    (탐색 O(log n), 옮기는 양은 버킷 크기만큼)
+    """
+
+    LOAD = 1000
+
+    def __init__(self, keys=()):
+        keys = sorted(keys)
+        self.buckets: list[list[tuple[int, int]]] = [
+            keys[i:i + self.LOAD] for i in range(0, len(keys), self.LOAD)
+        ]
+        self.maxes: list[tuple[int, int]] = [bucket[-1] for bucket in self.buckets]
+        self.length = len(keys)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def add(self, key: tuple[int, int]) -> None:
+        if not self.buckets:
+            self.buckets.append([key])
+            self.maxes.append(key)
+            self.length = 1
+            return
+
+        i = min(bisect_left(self.maxes, key), len(self.buckets) - 1)
+        bucket = self.buckets[i]
+        insort(bucket, key)
+        self.maxes[i] = bucket[-1]
+        self.length += 1
+
+        # 버킷이 너무 커지면 반으로 나눈다
+        if len(bucket) > 2 * self.LOAD:
+            half = bucket[self.LOAD:]
+            del bucket[self.LOAD:]
+            self.buckets.insert(i + 1, half)
+            self.maxes[i] = bucket[-1]
+            self.maxes.insert(i + 1, half[-1])
+
+    def remove(self, key: tuple[int, int]) -> bool:
+        """
+        키를 지운다
+
+        Returns:
+            bool: 키가 있어서 지웠으면 True
+        """
+        i = bisect_left(self.maxes, key)
+        if i == len(self.buckets):
+            return False
+
+        bucket = self.buckets[i]
+        j = bisect_left(bucket, key)
+        if bucket[j] != key:
+            return False
+
+        del bucket[j]
+        self.length -= 1
+        if bucket:
+            self.maxes[i] = bucket[-1]
+        else:
+            del self.buckets[i]
+            del self.maxes[i]
+        return True
+
+    def move(self, old: tuple[int, int], new: tuple[int, int]) -> None:
+        """
+        카운트가 바뀐 포스터의 키를 옮긴다
+        """
+        if old != new and self.remove(old):
+            self.add(new)
+
+    def after(self, key: tuple[int, int] | None, limit: int, descending: bool) -> list[tuple[int, int]]:
+        """
+        key 다음의 키를 limit + 1개까지 반환 (slice_sorted_keys와 같은 규칙)
+
+        하나를 더 가져와서 다음 페이지가 있는지 알 수 있게 한다
+        """
+        keys = []
+        if descending:
+            i = len(self.buckets) - 1 if key is None else min(bisect_left(self.maxes, key), len(self.buckets) - 1)
+            while i >= 0 and len(keys) <= limit:
+                bucket = self.buckets[i]
+                end = len(bucket) if key is None else bisect_left(bucket, key)
+                keys.extend(bucket[max(0, end - (limit + 1 - len(keys))):end][::-1])
+                i -= 1
+        else:
+            i = 0 if key is None else bisect_right(self.maxes, key)
+            while i < len(self.buckets) and len(keys) <= limit:
+                bucket = self.buckets[i]
+                start = 0 if key is None else bisect_right(bucket, key)
+                keys.extend(bucket[start:start + limit + 1 - len(keys)])
+                i += 1
+        return keys
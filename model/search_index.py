@@ -0,0 +1,172 @@
+import heapq
+import math
+import re
+from array import array
+from collections import Counter
+from operator import itemgetter
+
+
+# ================ 토큰화 ============================
+# 한글은 띄어쓰기와 조사가 붙어 있어서 단어 단위로 자르면 "검색은"과 "검색"이 다른 단어가 된다.
+# 그래서 한글 연속 구간은 NGRAM 글자씩 겹쳐 자른 문자 n-gram으로, 그 밖의 글자/숫자 구간은 단어 그대로 쓴다.
+#   "FastAPI로 검색하기" -> ["fastapi", "로", "검색", "색하", "하기"]
+
+NGRAM = 2
+TOKEN = re.compile(r"[가-힣]+|[^\W가-힣]+")
+
+# 제목의 토큰은 본문보다 이만큼 더 센 것으로 센다
+TITLE_WEIGHT = 2
+
+# BM25 파라미터
+K1 = 1.2
+B = 0.75
+
+
+def tokenize(text: str) -> list[str]:
+    tokens = []
+    for run in TOKEN.findall(text.lower()):
+        if run.isascii() or len(run) <= NGRAM:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + NGRAM] for i in range(len(run) - NGRAM + 1))
+    return tokens
+
+
+def document_terms(title: str, content: str) -> list[str]:
+    """
+    포스터 하나의 색인 토큰 (제목 토큰은 TITLE_WEIGHT번 반복)
+    """
+    return tokenize(title) * TITLE_WEIGHT + tokenize(content)
+
+
+class SearchIndex:
+    """
+    포스터 제목/본문의 역색인 (term -> 그 term이 나온 문서와 빈도), BM25로 순위를 매긴다
+
+    포스터를 색인할 때마다 새 문서 번호(docno)를 받고, 게시 목록(posting)에는 docno와 빈도를
+    typed array로 이어 붙인다. 수정/삭제는 이전 docno에 삭제 표시만 하고(tombstone),
+    삭제된 문서가 살아있는 문서보다 많아지면 compact()로 게시 목록을 다시 채운다.
+    (문서 빈도 df는 정리 전까지 삭제된 문서도 포함한 근사값이다)
+    """
+
+    def __init__(self):
+        # term -> (docno 배열, 빈도 배열)
+        self.postings: dict[str, tuple[array, array]] = {}
+
+        # docno -> post_id / 토큰 수 / 살아있으면 1
+        self.doc_post_id = array("q")
+        self.doc_len = array("i")
+        self.alive = bytearray()
+
+        # post_id -> 현재 docno (없으면 -1), post_id가 단조 증가하므로 배열로 둔다
+        self.docno_of = array("q")
+
+        self.live_count = 0
+        self.total_len = 0
+
+    def __len__(self) -> int:
+        return self.live_count
+
+    def add(self, post_id: int, title: str, content: str) -> None:
+        """
+        포스터를 색인 (이미 색인된 포스터면 이전 내용을 지우고 다시 색인)
+        """
+        self.remove(post_id)
+
+        terms = document_terms(title, content)
+        docno = len(self.doc_post_id)
+        self.doc_post_id.append(post_id)
+        self.doc_len.append(len(terms))
+        self.alive.append(1)
+        self.live_count += 1
+        self.total_len += len(terms)
+
+        if post_id >= len(self.docno_of):
+            self.docno_of.extend([-1] * (post_id + 1 - len(self.docno_of)))
+        self.docno_of[post_id] = docno
+
+        for term, count in Counter(terms).items():
+            posting = self.postings.get(term)
+            if posting is None:
+                posting = self.postings[term] = (array("i"), array("H"))
+            posting[0].append(docno)
+            posting[1].append(min(count, 0xFFFF))
+
+    def remove(self, post_id: int) -> bool:
+        """
+        포스터를 색인에서 지운다
+
+        Returns:
+            bool: 색인되어 있어서 지웠으면 True
+        """
+        if not 0 <= post_id < len(self.docno_of) or self.docno_of[post_id] < 0:
+            return False
+
+        docno = self.docno_of[post_id]
+        self.docno_of[post_id] = -1
+        self.alive[docno] = 0
+        self.live_count -= 1
+        self.total_len -= self.doc_len[docno]
+
+        if self.live_count < len(self.doc_post_id) - self.live_count:
+            self.compact()
+        return True
+
+    def compact(self) -> None:
+        """
+        삭제된 문서를 게시 목록에서 빼고 docno를 다시 매긴다
+        """
+        new_docno = array("i", [-1]) * len(self.doc_post_id)
+        doc_post_id, doc_len = array("q"), array("i")
+        for docno in range(len(self.doc_post_id)):
+            if self.alive[docno]:
+                new_docno[docno] = len(doc_post_id)
+                doc_post_id.append(self.doc_post_id[docno])
+                doc_len.append(self.doc_len[docno])
+
+        postings = {}
+        for term, (docnos, counts) in self.postings.items():
+            kept = [(new_docno[docno], count) for docno, count in zip(docnos, counts) if new_docno[docno] >= 0]
+            if kept:
+                postings[term] = (array("i", map(itemgetter(0), kept)), array("H", map(itemgetter(1), kept)))
+
+        self.postings = postings
+        self.doc_post_id, self.doc_len = doc_post_id, doc_len
+        self.alive = bytearray(b"\x01") * len(doc_post_id)
+        for docno, post_id in enumerate(doc_post_id):
+            self.docno_of[post_id] = docno
+
+    def search(self, query: str, limit: int, offset: int = 0) -> list[tuple[int, float]]:
+        """
+        질의와 관련 있는 포스터를 BM25 점수 순으로 반환
+
+        Args:
+            query (str): 검색어 (포스터와 같은 방식으로 토큰화)
+            limit (int): 가져올 개수
+            offset (int): 건너뛸 개수
+
+        Returns:
+            list[tuple[int, float]]: (post_id, 점수) 목록, 점수가 높은 순
+        """
+        n_docs = self.live_count
+        if n_docs == 0:
+            return []
+        avg_len = self.total_len / n_docs
+
+        alive, doc_len = self.alive, self.doc_len
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            posting = self.postings.get(term)
+            if posting is None:
+                continue
+
+            docnos, counts = posting
+            df = min(len(docnos), n_docs)
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            for docno, count in zip(docnos, counts):
+                if alive[docno]:
+                    norm = K1 * (1 - B + B * doc_len[docno] / avg_len)
+                    scores[docno] = scores.get(docno, 0.0) + idf * count * (K1 + 1) / (count + norm)
+
+        top = heapq.nlargest(offset + limit, scores.items(), key=itemgetter(1))[offset:]
+        return [(self.doc_post_id[docno], score) for docno, score in top]
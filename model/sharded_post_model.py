@@ -0,0 +1,467 @@
+import heapq
+import threading
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from contextlib import ExitStack
+from itertools import islice
+
+from .post_model import PostModel, PostColumns, PostData, PostSummary, posts, slice_sorted_keys, dummy_comment_counts
+from .user_model import UserModel
+from .search_index import SearchIndex
+from .rank_index import RankIndex
+
+
+class PostShard:
+    """
+    포스터 샤드 하나 (열 저장소 + 락)
+    """
+
+    def __init__(self, stride: int):
+        self.lock = threading.Lock()
+        self.columns = PostColumns(stride)
+
+
+class ShardedPostModel(PostModel):
+    """
+    post_id % shard_count로 나눈 샤드에 포스터를 저장하는 PostModel
+
+    샤드마다 락이 따로 있어서(striped lock), 서로 다른 포스터를 바꾸는 스레드는
+    대부분 다른 샤드의 락을 잡고 서로 기다리지 않는다.
+    한 포스터의 변경(좋아요/조회수의 읽고-더하고-쓰기 포함)은 그 샤드의 락 안에서 일어나므로
+    동시에 호출해도 변경이 사라지지 않는다.
+
+    목록/스냅샷처럼 전체를 보는 연산은 모든 샤드의 락을 번호 순서대로 잡는다.
+    """
+
+    # 스스로 동기화하므로 공유 저장소 프로세스에서 전역 락으로 감싸지 않는다
+    THREAD_SAFE = True
+
+    def __init__(self, shard_count: int = 16):
+        self.shards = [PostShard(shard_count) for _ in range(shard_count)]
+
+        # id 발급 락: 샤드 안의 행이 항상 post_id 순서가 되도록
+        # id를 받은 스레드가 샤드 락을 잡은 뒤에 놓는다
+        self.id_lock = threading.Lock()
+        self.next_post_id = 0
+
+        # (posted_date, post_id) 정렬 인덱스는 샤드 전체에 하나 (샤드 락을 잡은 뒤에 잡는다)
+        # 작성/삭제 때 갱신하고, 스냅샷으로 올릴 때는 load_state에서 만든다
+        self.index_lock = threading.Lock()
+        self.date_index: list[tuple[str, int]] = []
+
+        # 작성자별 정렬 인덱스도 샤드 전체에 하나 (샤드 락을 잡은 뒤에 잡는다)
+        self.author_lock = threading.Lock()
+        self.author_index: dict[int, list[tuple[str, int]]] | None = None
+
+        # 검색 역색인도 샤드 전체에 하나 (샤드 락을 잡은 뒤에 잡는다)
+        self.search_lock = threading.Lock()
+        self.search_index: SearchIndex | None = None
+
+        # 인기순 정렬 인덱스도 샤드 전체에 하나 (샤드 락을 잡은 뒤에 잡는다)
+        self.rank_lock = threading.Lock()
+        self.rank_indexes: dict[str, RankIndex] = {}
+
+        for post in posts:
+            self.add_dummy_post(**post)
+
+    def shard_of(self, post_id: int) -> PostShard:
+        return self.shards[post_id % len(self.shards)]
+
+    def all_shards_locked(self) -> ExitStack:
+        """
+        모든 샤드의 락을 번호 순서대로 잡는다 (with 문에서 사용)
+        """
+        stack = ExitStack()
+        for shard in self.shards:
+            stack.enter_context(shard.lock)
+        return stack
+
+    def insert(self, title: str, content: str, image_url: list[str],
+               like: int, view: int, poster_id: int, posted_date: str,
+               poster_nickname: str, comment_count: int = 0) -> int:
+        with self.id_lock:
+            post_id = self.next_post_id
+            self.next_post_id += 1
+            shard = self.shard_of(post_id)
+            shard.lock.acquire()
+
+        try:
+            shard.columns.append(
+                post_id, title, content, image_url, like, view, poster_id, posted_date,
+                comment_count=comment_count,
+                poster_nickname=poster_nickname
+            )
+            self.index_add(posted_date, post_id)
+            self.author_index_add(poster_id, posted_date, post_id)
+            self.search_index_add(post_id, title, content)
+            self.rank_add(post_id, like, view)
+        finally:
+            shard.lock.release()
+        return post_id
+
+    def add_dummy_post(
+            self,
+            title: str,
+            content: str,
+            poster_id: int,
+            image_url: list[str],
+            like: int,
+            view: int,
+            posted_date: str
+        ) -> None:
+        poster_data = UserModel().search_user_by_id(poster_id)
+        if poster_data:
+            self.insert(
+                title, content, image_url, like, view, poster_id, posted_date,
+                poster_nickname=poster_data.nickname,
+                comment_count=dummy_comment_counts[self.next_post_id]
+            )
+
+    def add_post(
+            self,
+            title: str,
+            content: str,
+            poster_id: int,
+            image_url: list[str] = [],
+            poster_nickname: str = ""
+        ) -> int:
+        return self.insert(title, content, image_url, 0, 0, poster_id, "2000-10-11", poster_nickname)
+
+    def get_post_by_id(self, post_id: int) -> PostData | None:
+        shard = self.shard_of(post_id)
+        with shard.lock:
+            row = shard.columns.row(post_id)
+            if row is None:
+                return None
+            return shard.columns.materialize(row)
+
+    def get_posts_by_ids(self, post_ids: Iterable[int]) -> dict[int, PostData]:
+        # 샤드별로 모아서 샤드 락을 한 번씩만 잡는다
+        by_shard: dict[int, set[int]] = {}
+        for post_id in post_ids:
+            by_shard.setdefault(post_id % len(self.shards), set()).add(post_id)
+
+        posts = {}
+        for index, shard_post_ids in by_shard.items():
+            shard = self.shards[index]
+            with shard.lock:
+                for post_id in shard_post_ids:
+                    row = shard.columns.row(post_id)
+                    if row is not None:
+                        posts[post_id] = shard.columns.materialize(row)
+        return posts
+
+    def get_summary_by_id(self, post_id: int) -> PostSummary | None:
+        shard = self.shard_of(post_id)
+        with shard.lock:
+            row = shard.columns.row(post_id)
+            if row is None:
+                return None
+            return shard.columns.summarize(row)
+
+    def edit_post(self, post_id: int, title: str, content: str, image_url: list[str]) -> bool:
+        shard = self.shard_of(post_id)
+        with shard.lock:
+            row = shard.columns.row(post_id)
+            if row is None:
+                return False
+
+            shard.columns.set_content(row, title, content, image_url)
+            self.search_index_add(post_id, title, content)
+            return True
+
+    def update_like(self, post_id: int, delta: int) -> int | None:
+        shard = self.shard_of(post_id)
+        with shard.lock:
+            row = shard.columns.row(post_id)
+            if row is None:
+                return None
+
+            like = shard.columns.like[row]
+            shard.columns.like[row] = like + delta
+            shard.columns.version[row] += 1
+            self.rank_move("like", post_id, like, like + delta)
+            return like + delta
+
+    def update_comment_count(self, post_id: int, delta: int) -> int | None:
+        shard = self.shard_of(post_id)
+        with shard.lock:
+            row = shard.columns.row(post_id)
+            if row is None:
+                return None
+
+            shard.columns.comment_count[row] += delta
+            shard.columns.version[row] += 1
+            return shard.columns.comment_count[row]
+
+    def update_poster_nickname(self, poster_id: int, nickname: str) -> int:
+        updated = 0
+        for post_id in self.author_post_ids(poster_id):
+            shard = self.shard_of(post_id)
+            with shard.lock:
+                row = shard.columns.row(post_id)
+                if row is not None:
+                    shard.columns.poster_nickname[row] = nickname
+                    shard.columns.version[row] += 1
+                    updated += 1
+        return updated
+
+    def increase_view(self, post_id: int) -> int | None:
+        shard = self.shard_of(post_id)
+        with shard.lock:
+            row = shard.columns.row(post_id)
+            if row is None:
+                return None
+
+            view = shard.columns.view[row]
+            shard.columns.view[row] = view + 1
+            self.rank_move("view", post_id, view, view + 1)
+            return view + 1
+
+    def add_views(self, views: list[tuple[int, int]]) -> int:
+        by_shard: dict[int, list[tuple[int, int]]] = {}
+        for post_id, count in views:
+            by_shard.setdefault(post_id % len(self.shards), []).append((post_id, count))
+
+        updated = 0
+        for index, shard_views in by_shard.items():
+            shard = self.shards[index]
+            with shard.lock:
+                for post_id, count in shard_views:
+                    row = shard.columns.row(post_id)
+                    if row is not None:
+                        view = shard.columns.view[row]
+                        shard.columns.view[row] = view + count
+                        self.rank_move("view", post_id, view, view + count)
+                        updated += 1
+        return updated
+
+    def delete_post_by_id(self, post_id: int) -> bool:
+        shard = self.shard_of(post_id)
+        with shard.lock:
+            row = shard.columns.row(post_id)
+            if row is None:
+                return False
+
+            self.index_remove(shard.columns.posted_date[row], post_id)
+            self.author_index_remove(shard.columns.poster_id[row], shard.columns.posted_date[row], post_id)
+            self.search_index_remove(post_id)
+            self.rank_remove(post_id, shard.columns.like[row], shard.columns.view[row])
+            return shard.columns.delete(post_id)
+
+    def get_posts_after(
+            self,
+            key: tuple[str, int] | None,
+            limit: int,
+            descending: bool = False,
+            summary: bool = False
+        ) -> tuple[list[PostData] | list[PostSummary], bool]:
+        with self.index_lock:
+            keys = slice_sorted_keys(self.date_index, key, limit, descending)
+
+        # 키를 자른 뒤에 삭제된 포스터는 건너뛴다
+        fetch = self.get_summary_by_id if summary else self.get_post_by_id
+        posts = [fetch(post_id) for _, post_id in keys[:limit]]
+        return [post for post in posts if post is not None], len(keys) > limit
+
+    def sorted_keys(self) -> list[tuple[str, int]]:
+        return self.date_index
+
+    # 샤드 모델의 정렬 인덱스는 (posted_date, post_id) 키 리스트를 그대로 둔다
+    # (post_id 배열로 두면 이분 탐색 중에 다른 샤드의 열을 그 샤드의 락 없이 읽게 된다)
+    def index_add(self, posted_date: str, post_id: int) -> None:
+        # 해당 샤드의 락 안에서 호출된다
+        with self.index_lock:
+            insort(self.date_index, (posted_date, post_id))
+
+    def index_remove(self, posted_date: str, post_id: int) -> None:
+        with self.index_lock:
+            del self.date_index[bisect_left(self.date_index, (posted_date, post_id))]
+
+    def get_posts_by_poster(
+            self,
+            poster_id: int,
+            key: tuple[str, int] | None,
+            limit: int,
+            descending: bool = False,
+            summary: bool = False
+        ) -> tuple[list[PostData] | list[PostSummary], bool]:
+        self.author_keys(poster_id)
+        with self.author_lock:
+            keys = slice_sorted_keys(self.author_index.get(poster_id, []), key, limit, descending)
+
+        # 키를 자른 뒤에 삭제된 포스터는 건너뛴다
+        fetch = self.get_summary_by_id if summary else self.get_post_by_id
+        posts = [fetch(post_id) for _, post_id in keys[:limit]]
+        return [post for post in posts if post is not None], len(keys) > limit
+
+    def author_keys(self, poster_id: int) -> list[tuple[str, int]]:
+        if self.author_index is None:
+            with self.all_shards_locked(), self.author_lock:
+                if self.author_index is None:
+                    author_index: dict[int, list[tuple[str, int]]] = {}
+                    for columns, row in self.merged_rows():
+                        author_index.setdefault(columns.poster_id[row], []).append(
+                            (columns.posted_date[row], columns.post_id[row])
+                        )
+                    for keys in author_index.values():
+                        keys.sort()
+                    self.author_index = author_index
+        return self.author_index.get(poster_id, [])
+
+    def author_post_ids(self, poster_id: int) -> list[int]:
+        """
+        작성자의 post_id 목록 사본 (락 밖에서 포스터를 하나씩 바꿀 때 사용)
+        """
+        self.author_keys(poster_id)
+        with self.author_lock:
+            return [post_id for _, post_id in self.author_index.get(poster_id, [])]
+
+    def author_index_add(self, poster_id: int, posted_date: str, post_id: int) -> None:
+        # 해당 샤드의 락 안에서 호출된다
+        with self.author_lock:
+            super().author_index_add(poster_id, posted_date, post_id)
+
+    def author_index_remove(self, poster_id: int, posted_date: str, post_id: int) -> None:
+        with self.author_lock:
+            super().author_index_remove(poster_id, posted_date, post_id)
+
+    def get_posts_ranked(
+            self,
+            field: str,
+            key: tuple[int, int] | None,
+            limit: int,
+            descending: bool = True,
+            summary: bool = False
+        ) -> tuple[list[PostData] | list[PostSummary], bool]:
+        rank_index = self.ranked_keys(field)
+        with self.rank_lock:
+            keys = rank_index.after(key, limit, descending)
+
+        # 키를 자른 뒤에 삭제된 포스터는 건너뛴다
+        fetch = self.get_summary_by_id if summary else self.get_post_by_id
+        posts = [fetch(post_id) for _, post_id in keys[:limit]]
+        return [post for post in posts if post is not None], len(keys) > limit
+
+    def ranked_keys(self, field: str) -> RankIndex:
+        if field not in self.rank_indexes:
+            with self.all_shards_locked(), self.rank_lock:
+                if field not in self.rank_indexes:
+                    self.rank_indexes[field] = RankIndex(
+                        (getattr(columns, field)[row], columns.post_id[row]) for columns, row in self.merged_rows()
+                    )
+        return self.rank_indexes[field]
+
+    def rank_add(self, post_id: int, like: int, view: int) -> None:
+        # 해당 샤드의 락 안에서 호출된다
+        with self.rank_lock:
+            super().rank_add(post_id, like, view)
+
+    def rank_remove(self, post_id: int, like: int, view: int) -> None:
+        with self.rank_lock:
+            super().rank_remove(post_id, like, view)
+
+    def rank_move(self, field: str, post_id: int, old: int, new: int) -> None:
+        with self.rank_lock:
+            super().rank_move(field, post_id, old, new)
+
+    def search_posts(self, query: str, limit: int, offset: int = 0) -> list[PostSummary]:
+        search_index = self.built_search_index()
+        with self.search_lock:
+            hits = search_index.search(query, limit, offset)
+
+        # 점수를 매긴 뒤에 삭제된 포스터는 건너뛴다
+        posts = [self.get_summary_by_id(post_id) for post_id, _ in hits]
+        return [post for post in posts if post is not None]
+
+    def built_search_index(self) -> SearchIndex:
+        if self.search_index is None:
+            with self.all_shards_locked(), self.search_lock:
+                if self.search_index is None:
+                    search_index = SearchIndex()
+                    for columns, row in self.merged_rows():
+                        search_index.add(columns.post_id[row], columns.title[row], columns.content[row])
+                    self.search_index = search_index
+        return self.search_index
+
+    def search_index_add(self, post_id: int, title: str, content: str) -> None:
+        # 해당 샤드의 락 안에서 호출된다
+        with self.search_lock:
+            super().search_index_add(post_id, title, content)
+
+    def search_index_remove(self, post_id: int) -> None:
+        with self.search_lock:
+            super().search_index_remove(post_id)
+
+    def merged_rows(self):
+        """
+        모든 샤드의 살아있는 행을 post_id(작성) 순서로 합쳐서 (columns, row)로 순회
+
+        샤드 안의 행은 post_id 순서이므로 k-way merge로 합친다.
+        모든 샤드의 락을 잡은 상태에서만 호출한다.
+        """
+        def rows_of(columns: PostColumns):
+            return ((columns.post_id[row], row, columns) for row in columns.live_rows())
+
+        for _, row, columns in heapq.merge(*(rows_of(shard.columns) for shard in self.shards)):
+            yield columns, row
+
+    def get_posts(self, offset: int, limit: int, summary: bool = False) -> tuple[list[PostData] | list[PostSummary], int]:
+        with self.all_shards_locked():
+            total = sum(len(shard.columns) for shard in self.shards)
+            next_offset = min(total, offset + limit)
+
+            rows = islice(self.merged_rows(), offset, next_offset)
+            if summary:
+                posts = [columns.summarize(row) for columns, row in rows]
+            else:
+                posts = [columns.materialize(row) for columns, row in rows]
+
+        return posts, next_offset if next_offset != total else -1
+
+    def get_like_counts(self) -> dict[int, int]:
+        counts = {}
+        for shard in self.shards:
+            with shard.lock:
+                columns = shard.columns
+                counts.update((columns.post_id[row], columns.like[row]) for row in columns.live_rows())
+        return counts
+
+    def dump_state(self) -> dict:
+        with self.all_shards_locked(), self.index_lock:
+            return {
+                "next_post_id": self.next_post_id,
+                "posts": [
+                    [columns.post_id[row], columns.title[row], columns.content[row], columns.image_url[row],
+                     columns.like[row], columns.view[row], columns.poster_id[row], columns.posted_date[row],
+                     columns.version[row], columns.comment_count[row], columns.poster_nickname[row],
+                     columns.preview[row], columns.thumbnail[row]]
+                    for columns, row in self.merged_rows()
+                ],
+                "date_order": [post_id for _, post_id in self.date_index]
+            }
+
+    def load_state(self, state: dict) -> None:
+        """
+        dump_state로 만든 상태를 샤드에 나눠 담는다
+
+        바이너리 스냅샷의 행도 샤드별로 나눠야 하므로 지연 디코딩 열을 그대로 쓰지 않고 한 번 읽는다
+        """
+        with self.id_lock, self.all_shards_locked():
+            stride = len(self.shards)
+            for shard in self.shards:
+                shard.columns = PostColumns(stride)
+            posted_dates = {}
+            for row in state["posts"]:
+                self.shard_of(row[0]).columns.append(*row)
+                posted_dates[row[0]] = row[7]
+
+            # 어차피 모든 행을 읽었으므로 정렬 인덱스는 여기서 만든다 (date_order가 있으면 정렬하지 않음)
+            order = state.get("date_order")
+            if order is None:
+                self.date_index = sorted((posted_date, post_id) for post_id, posted_date in posted_dates.items())
+            else:
+                self.date_index = [(posted_dates[post_id], post_id) for post_id in order]
+            self.author_index = None
+            self.search_index = None
+            self.rank_indexes = {}
@@ -0,0 +1,168 @@
+import threading
+from multiprocessing.managers import BaseManager
+
+from .user_model import UserModel
+from .post_model import PostModel
+from .comment_model import CommentModel
+from .like_model import LikeModel
+from .like_service import LikeService, reconcile_forever
+from .async_storage import SYNC_METHODS
+
+
+# ================ 공유 저장소 프로세스 ======================
+# uvicorn 워커가 여러 개일 때 모든 워커가 하나의 데이터를 보도록
+# 메모리 모델을 별도의 저장소 프로세스 하나에 두고, 워커는 프록시로 메소드를 호출한다.
+#
+#   export SHARED_STORAGE_AUTHKEY=$(python -c "import secrets; print(secrets.token_hex(32))")
+#   python -m model.shared_storage                 # 저장소 프로세스
+#   STORAGE_BACKEND=shared uvicorn main:app --workers 8
+#
+# 반환값은 pickle로 복사되어 오므로, 워커에서 받은 레코드를 고쳐도 저장소에는 반영되지 않는다.
+# (라우터는 이미 모든 변경을 모델 메소드로 한다)
+
+# POST_SHARDS를 지정하지 않았을 때 저장소 프로세스의 포스터 샤드 수
+# 포스터 호출이 가장 많으므로, 기본값(1)처럼 하나의 락에 몰리지 않게 샤드마다 락을 둔다
+DEFAULT_POST_SHARDS = 16
+
+MODEL_CLASSES = {
+    "user": UserModel,
+    "post": PostModel,
+    "comment": CommentModel,
+    "like": LikeModel,
+}
+
+
+def exposed_methods(cls) -> tuple[str, ...]:
+    # 변환 함수(SYNC_METHODS)는 저장소를 건드리지 않으므로 프록시로 내보내지 않고 워커에서 실행한다
+    return tuple(
+        name for name in dir(cls)
+        if not name.startswith("_") and name not in SYNC_METHODS and callable(getattr(cls, name))
+    )
+
+
+class SerializedModel:
+    """
+    저장소 프로세스 안에서 한 모델의 호출을 그 모델의 락으로 직렬화하는 래퍼
+
+    매니저 서버는 클라이언트 연결마다 스레드를 쓰므로,
+    메모리 모델의 복합 연산(인덱스 갱신, 읽을 때 만드는 지연 인덱스 등)이 섞이지 않도록 한 번에 하나씩 실행한다.
+    모델끼리는 상태를 공유하지 않으므로 락은 모델마다 따로 둔다.
+    """
+
+    def __init__(self, model, lock: threading.Lock):
+        self.model = model
+        self.lock = lock
+
+    def __getattr__(self, name: str):
+        method = getattr(self.model, name)
+
+        def call(*args, **kwargs):
+            with self.lock:
+                return method(*args, **kwargs)
+
+        setattr(self, name, call)
+        return call
+
+
+class StorageManager(BaseManager):
+    """
+    워커 쪽에서 저장소 프로세스에 접속하는 매니저
+    """
+
+
+for model_name, model_class in MODEL_CLASSES.items():
+    StorageManager.register(model_name, exposed=exposed_methods(model_class))
+StorageManager.register("like_service", exposed=exposed_methods(LikeService))
+
+
+def parse_address(address: str) -> tuple[str, int]:
+    host, port = address.rsplit(":", 1)
+    return host, int(port)
+
+
+def require_authkey(authkey: bytes) -> bytes:
+    """
+    인증 키가 비어 있으면 시작하지 않는다
+
+    매니저는 요청을 pickle로 풀기 때문에, 키를 알면 저장소 프로세스 안에서 임의의 코드를 실행할 수 있다.
+    그래서 누구나 아는 기본 키로는 열지도, 접속하지도 않는다.
+    """
+    if not authkey:
+        raise RuntimeError("SHARED_STORAGE_AUTHKEY is not set; set a random secret shared by the storage process and workers")
+    return authkey
+
+
+def connect(address: str, authkey: bytes) -> StorageManager:
+    require_authkey(authkey)
+    manager = StorageManager(address=parse_address(address), authkey=authkey)
+    manager.connect()
+    return manager
+
+
+def make_server(models: dict, address: str, authkey: bytes):
+    """
+    models를 제공하는 저장소 서버를 만든다 (serve_forever()로 실행)
+
+    좋아요 서비스는 저장소 프로세스 안에서 실행해야 멤버십과 좋아요 수가 함께 바뀌므로,
+    여기서 (락으로 감싼) 포스터/좋아요 모델 위에 만들어서 같이 제공한다
+
+    Args:
+        models (dict): 이름 -> 모델 (user, post, comment, like)
+        address (str): "host:port"
+        authkey (bytes): 워커와 공유하는 인증 키 (비어 있으면 RuntimeError)
+    """
+    require_authkey(authkey)
+
+    class ServerManager(BaseManager):
+        pass
+
+    served = {}
+    for name, model in models.items():
+        # 스스로 락을 관리하는 모델(THREAD_SAFE)은 그대로, 나머지는 모델마다 락 하나로 감싼다
+        # (사용자 조회가 댓글/포스터 호출을 기다리지 않는다)
+        if not getattr(model, "THREAD_SAFE", False):
+            model = SerializedModel(model, threading.Lock())
+        served[name] = model
+        ServerManager.register(
+            name,
+            callable=lambda model=model: model,
+            exposed=exposed_methods(MODEL_CLASSES[name])
+        )
+
+    like_service = LikeService(served["post"], served["like"])
+    ServerManager.register(
+        "like_service",
+        callable=lambda: like_service,
+        exposed=exposed_methods(LikeService)
+    )
+
+    return ServerManager(address=parse_address(address), authkey=authkey).get_server()
+
+
+def reconcile_likes(address: str, authkey: bytes, interval: float) -> None:
+    """
+    저장소 프로세스 안에서 좋아요 수 정합성 검사를 주기적으로 실행 (워커 대신 여기서 한 번만)
+    """
+    like_service = connect(address, authkey).like_service()
+    reconcile_forever(like_service, interval)
+
+
+if __name__ == "__main__":
+    import os
+
+    import config
+    from dependencies import get_memory_models
+
+    if "POST_SHARDS" not in os.environ:
+        config.POST_SHARDS = DEFAULT_POST_SHARDS
+
+    server = make_server(get_memory_models(), config.SHARED_STORAGE_ADDRESS, config.SHARED_STORAGE_AUTHKEY)
+    if config.LIKE_RECONCILE_INTERVAL > 0:
+        threading.Thread(
+            target=reconcile_likes,
+            args=(config.SHARED_STORAGE_ADDRESS, config.SHARED_STORAGE_AUTHKEY, config.LIKE_RECONCILE_INTERVAL),
+            name="like-reconcile",
+            daemon=True
+        ).start()
+    print(f"shared storage listening on {config.SHARED_STORAGE_ADDRESS}")
+    server.serve_forever()
@@ -0,0 +1,754 @@
+import json
+import queue
+import sqlite3
+from collections.abc import Iterable
+from contextlib import contextmanager
+
+from .user_model import UserModel, UserData, users
+from .post_model import (
+    PostModel, PostData, PostSummary, posts, PREVIEW_LENGTH, make_preview, make_thumbnail, dummy_comment_counts
+)
+from .comment_model import CommentModel, CommentData, comments
+from .like_model import LikeModel, LikeData, likes
+from .like_service import LikeService
+from .search_index import tokenize, document_terms
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    user_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email TEXT NOT NULL UNIQUE,
+    password TEXT NOT NULL,
+    nickname TEXT NOT NULL UNIQUE,
+    user_profile_image_url TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS posts (
+    post_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    image_url TEXT NOT NULL,
+    like_count INTEGER NOT NULL,
+    view_count INTEGER NOT NULL,
+    poster_id INTEGER NOT NULL,
+    posted_date TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0,
+    comment_count INTEGER NOT NULL DEFAULT 0,
+    poster_nickname TEXT NOT NULL DEFAULT '',
+    preview TEXT NOT NULL DEFAULT '',
+    thumbnail TEXT
+);
+-- 작성자별 목록 (poster_id만으로 찾는 쿼리도 이 인덱스를 쓴다)
+DROP INDEX IF EXISTS idx_posts_poster_id;
+CREATE INDEX IF NOT EXISTS idx_posts_poster_date ON posts (poster_id, posted_date, post_id);
+CREATE INDEX IF NOT EXISTS idx_posts_posted_date ON posts (posted_date, post_id);
+CREATE INDEX IF NOT EXISTS idx_posts_like_count ON posts (like_count, post_id);
+CREATE INDEX IF NOT EXISTS idx_posts_view_count ON posts (view_count, post_id);
+
+-- 제목/본문 검색 색인 (rowid = post_id)
+-- 한글 n-gram 토큰화는 메모리 색인과 같은 tokenize()로 하고, 공백으로 이어서 넣는다
+CREATE VIRTUAL TABLE IF NOT EXISTS posts_search USING fts5(terms, tokenize = 'unicode61 remove_diacritics 0');
+
+CREATE TABLE IF NOT EXISTS comments (
+    comment_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    post_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    comment_date TEXT NOT NULL,
+    comment TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_comments_post_id ON comments (post_id, comment_id);
+
+CREATE TABLE IF NOT EXISTS likes (
+    post_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    UNIQUE (post_id, user_id)
+);
+CREATE INDEX IF NOT EXISTS idx_likes_user_id ON likes (user_id, post_id);
+"""
+
+# sqlite3는 같은 SQL 문자열을 커넥션별로 캐시(prepared statement)하므로
+# 모든 쿼리는 파라미터 바인딩을 쓰는 고정 문자열로 둔다
+USER_COLUMNS = "user_id, email, password, nickname, user_profile_image_url, version"
+POST_COLUMNS = "post_id, title, content, image_url, like_count, view_count, poster_id, posted_date, version"
+COMMENT_COLUMNS = "comment_id, post_id, user_id, comment_date, comment, version"
+# 목록 요약 (본문과 이미지 목록은 읽지 않음)
+SUMMARY_COLUMNS = (
+    "post_id, title, preview, thumbnail, poster_id, poster_nickname, "
+    "like_count, view_count, comment_count, posted_date, version"
+)
+# 인기순 정렬 필드 -> 열 (SQL에 넣는 열 이름은 이 표에 있는 것만)
+RANK_COLUMNS = {"like": "like_count", "view": "view_count"}
+
+# 열이 생기기 전에 만든 DB 파일에 추가할 열: (테이블, 열, 추가하는 SQL, 기존 행을 채우는 SQL)
+MIGRATIONS = [
+    ("users", "version", "ALTER TABLE users ADD COLUMN version INTEGER NOT NULL DEFAULT 0", None),
+    ("posts", "version", "ALTER TABLE posts ADD COLUMN version INTEGER NOT NULL DEFAULT 0", None),
+    ("comments", "version", "ALTER TABLE comments ADD COLUMN version INTEGER NOT NULL DEFAULT 0", None),
+    (
+        "posts", "comment_count",
+        "ALTER TABLE posts ADD COLUMN comment_count INTEGER NOT NULL DEFAULT 0",
+        "UPDATE posts SET comment_count = (SELECT COUNT(*) FROM comments c WHERE c.post_id = posts.post_id)"
+    ),
+    (
+        "posts", "poster_nickname",
+        "ALTER TABLE posts ADD COLUMN poster_nickname TEXT NOT NULL DEFAULT ''",
+        "UPDATE posts SET poster_nickname = "
+        "COALESCE((SELECT nickname FROM users u WHERE u.user_id = posts.poster_id), '')"
+    ),
+    (
+        "posts", "preview",
+        "ALTER TABLE posts ADD COLUMN preview TEXT NOT NULL DEFAULT ''",
+        f"UPDATE posts SET preview = substr(content, 1, {PREVIEW_LENGTH})"
+    ),
+    (
+        "posts", "thumbnail",
+        "ALTER TABLE posts ADD COLUMN thumbnail TEXT",
+        "UPDATE posts SET thumbnail = json_extract(image_url, '$[0]')"
+    ),
+]
+
+
+class SqlitePool:
+    """
+    SQLite 커넥션 풀
+
+    최대 size개의 커넥션을 만들어 돌려쓰며, 모두 사용 중이면 반납될 때까지 기다린다.
+    커넥션은 WAL 모드로 열어서 읽기가 쓰기를 막지 않게 한다.
+    """
+
+    def __init__(self, path: str, size: int = 4, timeout: float = 5.0):
+        self.path = path
+        self.timeout = timeout
+        self.idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(maxsize=size)
+
+        for _ in range(size):
+            self.idle.put(self.connect())
+
+        with self.connection() as conn:
+            conn.executescript(SCHEMA)
+            for table, column, add_sql, fill_sql in MIGRATIONS:
+                if column not in [info[1] for info in conn.execute(f"PRAGMA table_info({table})")]:
+                    conn.execute(add_sql)
+                    if fill_sql is not None:
+                        conn.execute(fill_sql)
+
+            # 검색 색인이 생기기 전에 만든 DB 파일은 포스터를 한 번 색인한다
+            if conn.execute("SELECT 1 FROM posts_search LIMIT 1").fetchone() is None:
+                conn.executemany(
+                    "INSERT INTO posts_search (rowid, terms) VALUES (?, ?)",
+                    [
+                        (post_id, search_terms(title, content))
+                        for post_id, title, content in conn.execute("SELECT post_id, title, content FROM posts")
+                    ]
+                )
+
+    def connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.timeout,
+            check_same_thread=False,
+            cached_statements=256
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """
+        풀에서 커넥션을 빌려서 트랜잭션 안에서 사용하고 반납
+
+        블록이 정상 종료되면 commit, 예외가 나면 rollback 한다
+        """
+        conn = self.idle.get(timeout=self.timeout)
+        try:
+            with conn:
+                yield conn
+        finally:
+            self.idle.put(conn)
+
+    def close(self) -> None:
+        while not self.idle.empty():
+            self.idle.get_nowait().close()
+
+
+def seed_dummy_data(pool: SqlitePool) -> None:
+    """
+    DB가 비어있으면 메모리 모델과 같은 id로 더미 데이터를 넣는다
+    """
+    with pool.connection() as conn:
+        if conn.execute("SELECT 1 FROM users LIMIT 1").fetchone() is not None:
+            return
+
+        conn.executemany(
+            "INSERT INTO users (user_id, email, password, nickname, user_profile_image_url) VALUES (?, ?, ?, ?, ?)",
+            [
+                (user_id, user["email"], user["password"], user["nickname"], user["user_profile_image_url"])
+                for user_id, user in enumerate(users)
+            ]
+        )
+        conn.executemany(
+            "INSERT INTO posts (post_id, title, content, image_url, like_count, view_count, poster_id, posted_date, "
+            "comment_count, poster_nickname, preview, thumbnail) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (post_id, post["title"], post["content"], json.dumps(post["image_url"]),
+                 post["like"], post["view"], post["poster_id"], post["posted_date"],
+                 dummy_comment_counts[post_id], users[post["poster_id"]]["nickname"],
+                 make_preview(post["content"]), make_thumbnail(post["image_url"]))
+                for post_id, post in enumerate(posts)
+            ]
+        )
+        conn.executemany(
+            "INSERT INTO comments (comment_id, post_id, user_id, comment_date, comment) VALUES (?, ?, ?, ?, ?)",
+            [
+                (comment_id, comment["post_id"], comment["user_id"], comment["comment_date"], comment["comment"])
+                for comment_id, comment in enumerate(comments)
+            ]
+        )
+        conn.executemany(
+            "INSERT INTO posts_search (rowid, terms) VALUES (?, ?)",
+            [(post_id, search_terms(post["title"], post["content"])) for post_id, post in enumerate(posts)]
+        )
+        conn.executemany(
+            "INSERT INTO likes (post_id, user_id) VALUES (?, ?)",
+            [(like["post_id"], like["user_id"]) for like in likes]
+        )
+
+
+def search_terms(title: str, content: str) -> str:
+    return " ".join(document_terms(title, content))
+
+
+def row_2_user_data(row: tuple) -> UserData:
+    return UserData(*row)
+
+
+def row_2_post_data(row: tuple) -> PostData:
+    post_id, title, content, image_url, like, view, poster_id, posted_date, version = row
+    return PostData(
+        post_id=post_id,
+        title=title,
+        content=content,
+        image_url=json.loads(image_url),
+        like=like,
+        view=view,
+        poster_id=poster_id,
+        posted_date=posted_date,
+        version=version
+    )
+
+
+def row_2_post_summary(row: tuple) -> PostSummary:
+    return PostSummary(*row)
+
+
+def row_2_comment_data(row: tuple) -> CommentData:
+    return CommentData(*row)
+
+
+class SqliteUserModel(UserModel):
+    """
+    UserModel과 같은 인터페이스를 가진 SQLite 사용자 저장소
+    """
+
+    def __init__(self, pool: SqlitePool):
+        self.pool = pool
+
+    def add_user(self, email: str, password: str, nickname: str, user_profile_image_url: str) -> int:
+        with self.pool.connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO users (email, password, nickname, user_profile_image_url) VALUES (?, ?, ?, ?)",
+                (email, password, nickname, user_profile_image_url)
+            )
+            return cursor.lastrowid
+
+    def search_user_by_nickname(self, nickname: str) -> UserData | None:
+        return self._fetch_one(f"SELECT {USER_COLUMNS} FROM users WHERE nickname = ?", nickname)
+
+    def search_user_by_email(self, email: str) -> UserData | None:
+        return self._fetch_one(f"SELECT {USER_COLUMNS} FROM users WHERE email = ?", email)
+
+    def search_user_by_id(self, user_id: int) -> UserData | None:
+        return self._fetch_one(f"SELECT {USER_COLUMNS} FROM users WHERE user_id = ?", user_id)
+
+    def get_users_by_ids(self, user_ids: Iterable[int]) -> dict[int, UserData]:
+        # id 개수와 상관없이 같은 SQL을 쓰도록 id 목록을 JSON 배열 하나로 바인딩
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                f"SELECT {USER_COLUMNS} FROM users WHERE user_id IN (SELECT value FROM json_each(?))",
+                (json.dumps(sorted(set(user_ids))),)
+            ).fetchall()
+        return {row[0]: row_2_user_data(row) for row in rows}
+
+    def scan_users(self, after: int | None, limit: int) -> list[UserData]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                f"SELECT {USER_COLUMNS} FROM users WHERE user_id > ? ORDER BY user_id LIMIT ?",
+                (-1 if after is None else after, limit)
+            ).fetchall()
+        return [row_2_user_data(row) for row in rows]
+
+    def update_user_profile(self, user_id: int, nickname: str, user_profile_image_url: str) -> bool:
+        with self.pool.connection() as conn:
+            cursor = conn.execute(
+                "UPDATE users SET nickname = ?, user_profile_image_url = ?, version = version + 1 WHERE user_id = ?",
+                (nickname, user_profile_image_url, user_id)
+            )
+            return cursor.rowcount > 0
+
+    def update_password(self, user_id: int, password: str) -> bool:
+        with self.pool.connection() as conn:
+            cursor = conn.execute("UPDATE users SET password = ?, version = version + 1 WHERE user_id = ?", (password, user_id))
+            return cursor.rowcount > 0
+
+    def delete_user_by_user_id(self, user_id: int) -> bool:
+        with self.pool.connection() as conn:
+            cursor = conn.execute("DELETE FROM users WHERE user_id = ?", (user_id,))
+            return cursor.rowcount > 0
+
+    def _fetch_one(self, sql: str, key) -> UserData | None:
+        with self.pool.connection() as conn:
+            row = conn.execute(sql, (key,)).fetchone()
+        return None if row is None else row_2_user_data(row)
+
+
+class SqlitePostModel(PostModel):
+    """
+    PostModel과 같은 인터페이스를 가진 SQLite 포스터 저장소
+    """
+
+    def __init__(self, pool: SqlitePool):
+        self.pool = pool
+
+    def add_dummy_post(
+            self,
+            title: str,
+            content: str,
+            poster_id: int,
+            image_url: list[str],
+            like: int,
+            view: int,
+            posted_date: str
+        ) -> None:
+        with self.pool.connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO posts (title, content, image_url, like_count, view_count, poster_id, posted_date, "
+                "poster_nickname, preview, thumbnail) "
+                "SELECT ?, ?, ?, ?, ?, ?, ?, nickname, ?, ? FROM users WHERE user_id = ?",
+                (title, content, json.dumps(image_url), like, view, poster_id, posted_date,
+                 make_preview(content), make_thumbnail(image_url), poster_id)
+            )
+            if cursor.rowcount > 0:
+                conn.execute(
+                    "INSERT INTO posts_search (rowid, terms) VALUES (?, ?)",
+                    (cursor.lastrowid, search_terms(title, content))
+                )
+
+    def add_post(
+            self,
+            title: str,
+            content: str,
+            poster_id: int,
+            image_url: list[str] = [],
+            poster_nickname: str = ""
+        ) -> int:
+        with self.pool.connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO posts (title, content, image_url, like_count, view_count, poster_id, posted_date, "
+                "poster_nickname, preview, thumbnail) "
+                "VALUES (?, ?, ?, 0, 0, ?, ?, ?, ?, ?)",
+                (title, content, json.dumps(image_url), poster_id, "2000-10-11",
+                 poster_nickname, make_preview(content), make_thumbnail(image_url))
+            )
+            conn.execute(
+                "INSERT INTO posts_search (rowid, terms) VALUES (?, ?)",
+                (cursor.lastrowid, search_terms(title, content))
+            )
+            return cursor.lastrowid
+
+    def get_post_by_id(self, post_id: int) -> PostData | None:
+        with self.pool.connection() as conn:
+            row = conn.execute(f"SELECT {POST_COLUMNS} FROM posts WHERE post_id = ?", (post_id,)).fetchone()
+        return None if row is None else row_2_post_data(row)
+
+    def get_posts_by_ids(self, post_ids: Iterable[int]) -> dict[int, PostData]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                f"SELECT {POST_COLUMNS} FROM posts WHERE post_id IN (SELECT value FROM json_each(?))",
+                (json.dumps(sorted(set(post_ids))),)
+            ).fetchall()
+        return {row[0]: row_2_post_data(row) for row in rows}
+
+    def scan_posts(self, after: int | None, limit: int) -> list[PostData]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                f"SELECT {POST_COLUMNS} FROM posts WHERE post_id > ? ORDER BY post_id LIMIT ?",
+                (-1 if after is None else after, limit)
+            ).fetchall()
+        return [row_2_post_data(row) for row in rows]
+
+    def get_summary_by_id(self, post_id: int) -> PostSummary | None:
+        with self.pool.connection() as conn:
+            row = conn.execute(f"SELECT {SUMMARY_COLUMNS} FROM posts WHERE post_id = ?", (post_id,)).fetchone()
+        return None if row is None else row_2_post_summary(row)
+
+    def edit_post(self, post_id: int, title: str, content: str, image_url: list[str]) -> bool:
+        with self.pool.connection() as conn:
+            cursor = conn.execute(
+                "UPDATE posts SET title = ?, content = ?, image_url = ?, preview = ?, thumbnail = ?, "
+                "version = version + 1 WHERE post_id = ?",
+                (title, content, json.dumps(image_url), make_preview(content), make_thumbnail(image_url), post_id)
+            )
+            if cursor.rowcount == 0:
+                return False
+            conn.execute("UPDATE posts_search SET terms = ? WHERE rowid = ?", (search_terms(title, content), post_id))
+            return True
+
+    def update_like(self, post_id: int, delta: int) -> int | None:
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "UPDATE posts SET like_count = like_count + ?, version = version + 1 WHERE post_id = ? RETURNING like_count",
+                (delta, post_id)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def update_comment_count(self, post_id: int, delta: int) -> int | None:
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "UPDATE posts SET comment_count = comment_count + ?, version = version + 1 "
+                "WHERE post_id = ? RETURNING comment_count",
+                (delta, post_id)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def update_poster_nickname(self, poster_id: int, nickname: str) -> int:
+        with self.pool.connection() as conn:
+            cursor = conn.execute(
+                "UPDATE posts SET poster_nickname = ?, version = version + 1 WHERE poster_id = ?",
+                (nickname, poster_id)
+            )
+            return cursor.rowcount
+
+    def increase_view(self, post_id: int) -> int | None:
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "UPDATE posts SET view_count = view_count + 1 WHERE post_id = ? RETURNING view_count",
+                (post_id,)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def add_views(self, views: list[tuple[int, int]]) -> int:
+        with self.pool.connection() as conn:
+            cursor = conn.executemany(
+                "UPDATE posts SET view_count = view_count + ? WHERE post_id = ?",
+                [(count, post_id) for post_id, count in views]
+            )
+            return cursor.rowcount
+
+    def delete_post_by_id(self, post_id: int) -> bool:
+        with self.pool.connection() as conn:
+            cursor = conn.execute("DELETE FROM posts WHERE post_id = ?", (post_id,))
+            conn.execute("DELETE FROM posts_search WHERE rowid = ?", (post_id,))
+            return cursor.rowcount > 0
+
+    def get_posts(self, offset: int, limit: int, summary: bool = False) -> tuple[list[PostData] | list[PostSummary], int]:
+        columns, convert = (SUMMARY_COLUMNS, row_2_post_summary) if summary else (POST_COLUMNS, row_2_post_data)
+        with self.pool.connection() as conn:
+            total = conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+            rows = conn.execute(
+                f"SELECT {columns} FROM posts ORDER BY post_id LIMIT ? OFFSET ?",
+                (limit, offset)
+            ).fetchall()
+
+        next_offset = min(total, offset + limit)
+        return [convert(row) for row in rows], next_offset if next_offset != total else -1
+
+    def get_posts_after(
+            self,
+            key: tuple[str, int] | None,
+            limit: int,
+            descending: bool = False,
+            summary: bool = False
+        ) -> tuple[list[PostData] | list[PostSummary], bool]:
+        # (posted_date, post_id) 인덱스를 따라 key 다음부터 읽는다 (row value 비교)
+        columns, convert = (SUMMARY_COLUMNS, row_2_post_summary) if summary else (POST_COLUMNS, row_2_post_data)
+        if descending:
+            order = "ORDER BY posted_date DESC, post_id DESC"
+            where = "WHERE (posted_date, post_id) < (?, ?) "
+        else:
+            order = "ORDER BY posted_date, post_id"
+            where = "WHERE (posted_date, post_id) > (?, ?) "
+
+        with self.pool.connection() as conn:
+            if key is None:
+                rows = conn.execute(f"SELECT {columns} FROM posts {order} LIMIT ?", (limit + 1,)).fetchall()
+            else:
+                rows = conn.execute(
+                    f"SELECT {columns} FROM posts {where}{order} LIMIT ?", (*key, limit + 1)
+                ).fetchall()
+
+        return [convert(row) for row in rows[:limit]], len(rows) > limit
+
+    def get_posts_by_poster(
+            self,
+            poster_id: int,
+            key: tuple[str, int] | None,
+            limit: int,
+            descending: bool = False,
+            summary: bool = False
+        ) -> tuple[list[PostData] | list[PostSummary], bool]:
+        # (poster_id, posted_date, post_id) 인덱스에서 작성자의 구간만 읽는다
+        columns, convert = (SUMMARY_COLUMNS, row_2_post_summary) if summary else (POST_COLUMNS, row_2_post_data)
+        if descending:
+            order = "ORDER BY posted_date DESC, post_id DESC"
+            where = "AND (posted_date, post_id) < (?, ?) "
+        else:
+            order = "ORDER BY posted_date, post_id"
+            where = "AND (posted_date, post_id) > (?, ?) "
+
+        with self.pool.connection() as conn:
+            if key is None:
+                rows = conn.execute(
+                    f"SELECT {columns} FROM posts WHERE poster_id = ? {order} LIMIT ?", (poster_id, limit + 1)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    f"SELECT {columns} FROM posts WHERE poster_id = ? {where}{order} LIMIT ?",
+                    (poster_id, *key, limit + 1)
+                ).fetchall()
+
+        return [convert(row) for row in rows[:limit]], len(rows) > limit
+
+    def get_posts_ranked(
+            self,
+            field: str,
+            key: tuple[int, int] | None,
+            limit: int,
+            descending: bool = True,
+            summary: bool = False
+        ) -> tuple[list[PostData] | list[PostSummary], bool]:
+        # (like_count|view_count, post_id) 인덱스를 따라 key 다음부터 읽는다 (인덱스는 SQLite가 쓰기마다 갱신)
+        count_column = RANK_COLUMNS[field]
+        columns, convert = (SUMMARY_COLUMNS, row_2_post_summary) if summary else (POST_COLUMNS, row_2_post_data)
+        if descending:
+            order = f"ORDER BY {count_column} DESC, post_id DESC"
+            where = f"WHERE ({count_column}, post_id) < (?, ?) "
+        else:
+            order = f"ORDER BY {count_column}, post_id"
+            where = f"WHERE ({count_column}, post_id) > (?, ?) "
+
+        with self.pool.connection() as conn:
+            if key is None:
+                rows = conn.execute(f"SELECT {columns} FROM posts {order} LIMIT ?", (limit + 1,)).fetchall()
+            else:
+                rows = conn.execute(
+                    f"SELECT {columns} FROM posts {where}{order} LIMIT ?", (*key, limit + 1)
+                ).fetchall()
+
+        return [convert(row) for row in rows[:limit]], len(rows) > limit
+
+    def search_posts(self, query: str, limit: int, offset: int = 0) -> list[PostSummary]:
+        # 검색어 토큰 중 하나라도 들어간 포스터를 FTS5의 bm25() 순서로 (값이 작을수록 관련도가 높음)
+        terms = sorted(set(tokenize(query)))
+        if not terms:
+            return []
+
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                f"SELECT {SUMMARY_COLUMNS} FROM posts_search JOIN posts ON posts.post_id = posts_search.rowid "
+                "WHERE posts_search MATCH ? ORDER BY bm25(posts_search) LIMIT ? OFFSET ?",
+                (" OR ".join(f'"{term}"' for term in terms), limit, offset)
+            ).fetchall()
+        return [row_2_post_summary(row) for row in rows]
+
+    def get_like_counts(self) -> dict[int, int]:
+        with self.pool.connection() as conn:
+            return dict(conn.execute("SELECT post_id, like_count FROM posts").fetchall())
+
+
+class SqliteCommentModel(CommentModel):
+    """
+    CommentModel과 같은 인터페이스를 가진 SQLite 댓글 저장소
+    """
+
+    def __init__(self, pool: SqlitePool):
+        self.pool = pool
+
+    def add_dummy_comment(self, post_id: int, user_id: int, comment_date: str, comment: str) -> None:
+        self.add_comment(post_id, user_id, comment_date, comment)
+
+    def add_comment(self, post_id: int, user_id: int, comment_date: str, comment: str) -> int:
+        with self.pool.connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO comments (post_id, user_id, comment_date, comment) VALUES (?, ?, ?, ?)",
+                (post_id, user_id, comment_date, comment)
+            )
+            return cursor.lastrowid
+
+    def get_comment_by_comment_id(self, comment_id: int) -> CommentData | None:
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                f"SELECT {COMMENT_COLUMNS} FROM comments WHERE comment_id = ?", (comment_id,)
+            ).fetchone()
+        return None if row is None else row_2_comment_data(row)
+
+    def edit_comment(self, comment_id: int, comment: str, comment_date: str) -> bool:
+        with self.pool.connection() as conn:
+            cursor = conn.execute(
+                "UPDATE comments SET comment = ?, comment_date = ?, version = version + 1 WHERE comment_id = ?",
+                (comment, comment_date, comment_id)
+            )
+            return cursor.rowcount > 0
+
+    def delete_comment_by_comment_id(self, comment_id: int) -> bool:
+        with self.pool.connection() as conn:
+            cursor = conn.execute("DELETE FROM comments WHERE comment_id = ?", (comment_id,))
+            return cursor.rowcount > 0
+
+    def scan_comments(self, after: int | None, limit: int) -> list[CommentData]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                f"SELECT {COMMENT_COLUMNS} FROM comments WHERE comment_id > ? ORDER BY comment_id LIMIT ?",
+                (-1 if after is None else after, limit)
+            ).fetchall()
+        return [row_2_comment_data(row) for row in rows]
+
+    def get_comments_by_post_id(self, post_id: int) -> list[CommentData]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                f"SELECT {COMMENT_COLUMNS} FROM comments WHERE post_id = ? ORDER BY comment_id", (post_id,)
+            ).fetchall()
+        return [row_2_comment_data(row) for row in rows]
+
+    def get_comments_after(self, post_id: int, after: int | None, limit: int) -> tuple[list[CommentData], bool]:
+        # (post_id, comment_id) 인덱스를 따라 after 다음부터 읽는다 (처음부터면 -1 다음)
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                f"SELECT {COMMENT_COLUMNS} FROM comments WHERE post_id = ? AND comment_id > ? "
+                "ORDER BY comment_id LIMIT ?",
+                (post_id, -1 if after is None else after, limit + 1)
+            ).fetchall()
+        return [row_2_comment_data(row) for row in rows[:limit]], len(rows) > limit
+
+    def count_comments_by_post_id(self, post_id: int) -> int:
+        with self.pool.connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM comments WHERE post_id = ?", (post_id,)).fetchone()[0]
+
+
+class SqliteLikeModel(LikeModel):
+    """
+    LikeModel과 같은 인터페이스를 가진 SQLite 좋아요 저장소
+    """
+
+    def __init__(self, pool: SqlitePool):
+        self.pool = pool
+
+    def add_dummy_like(self, post_id: int, user_id: int) -> bool:
+        return self.add_like(post_id, user_id)
+
+    def add_like(self, post_id: int, user_id: int) -> bool:
+        with self.pool.connection() as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO likes (post_id, user_id) VALUES (?, ?)", (post_id, user_id)
+            )
+            return cursor.rowcount > 0
+
+    def delete_like(self, post_id: int, user_id: int) -> bool:
+        with self.pool.connection() as conn:
+            cursor = conn.execute("DELETE FROM likes WHERE post_id = ? AND user_id = ?", (post_id, user_id))
+            return cursor.rowcount > 0
+
+    def has_liked(self, post_id: int, user_id: int) -> bool:
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM likes WHERE post_id = ? AND user_id = ?", (post_id, user_id)
+            ).fetchone()
+        return row is not None
+
+    def get_likers_by_post_id(self, post_id: int) -> list[int]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT user_id FROM likes WHERE post_id = ? ORDER BY rowid", (post_id,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_liked_post_ids_by_user_id(self, user_id: int) -> list[int]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT post_id FROM likes WHERE user_id = ? ORDER BY rowid", (user_id,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def count_likes_by_post_id(self, post_id: int) -> int:
+        with self.pool.connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM likes WHERE post_id = ?", (post_id,)).fetchone()[0]
+
+    def count_likes_by_post(self) -> dict[int, int]:
+        with self.pool.connection() as conn:
+            return dict(conn.execute("SELECT post_id, COUNT(*) FROM likes GROUP BY post_id").fetchall())
+
+    def get_likes_by_post_ids(self, post_ids: list[int]) -> list[LikeData]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT likes.post_id, likes.user_id FROM json_each(?) AS ids "
+                "JOIN likes ON likes.post_id = ids.value ORDER BY ids.key, likes.rowid",
+                (json.dumps(post_ids),)
+            ).fetchall()
+        return [LikeData(post_id, user_id) for post_id, user_id in rows]
+
+
+class SqliteLikeService(LikeService):
+    """
+    LikeService와 같은 인터페이스를 가진 SQLite 좋아요 서비스
+
+    멤버십과 좋아요 수를 한 트랜잭션에서 바꾸므로 여러 프로세스가 같은 파일을 써도 어긋나지 않는다
+    """
+
+    def __init__(self, pool: SqlitePool):
+        self.pool = pool
+
+    def like(self, post_id: int, user_id: int) -> int | None:
+        with self.pool.connection() as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO likes (post_id, user_id) "
+                "SELECT ?, ? WHERE EXISTS (SELECT 1 FROM posts WHERE post_id = ?)",
+                (post_id, user_id, post_id)
+            )
+            if cursor.rowcount == 0:
+                return None
+            return conn.execute(
+                "UPDATE posts SET like_count = like_count + 1, version = version + 1 WHERE post_id = ? RETURNING like_count", (post_id,)
+            ).fetchone()[0]
+
+    def unlike(self, post_id: int, user_id: int) -> int | None:
+        with self.pool.connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM likes WHERE post_id = ? AND user_id = ? "
+                "AND EXISTS (SELECT 1 FROM posts WHERE post_id = ?)",
+                (post_id, user_id, post_id)
+            )
+            if cursor.rowcount == 0:
+                return None
+            return conn.execute(
+                "UPDATE posts SET like_count = like_count - 1, version = version + 1 WHERE post_id = ? RETURNING like_count", (post_id,)
+            ).fetchone()[0]
+
+    def reconcile(self) -> dict[int, tuple[int, int]]:
+        with self.pool.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            drift = {
+                post_id: (stored, actual)
+                for post_id, stored, actual in conn.execute(
+                    "SELECT p.post_id, p.like_count, COUNT(l.user_id) FROM posts p "
+                    "LEFT JOIN likes l ON l.post_id = p.post_id "
+                    "GROUP BY p.post_id HAVING p.like_count != COUNT(l.user_id)"
+                ).fetchall()
+            }
+            conn.executemany(
+                "UPDATE posts SET like_count = ?, version = version + 1 WHERE post_id = ?",
+                [(actual, post_id) for post_id, (_, actual) in drift.items()]
+            )
+        return drift
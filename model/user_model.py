@@ -1,3 +1,6 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+
 from pydantic import BaseModel, Field
 
 class UserPublic(BaseModel):
@@ -7,15 +10,26 @@ class UserPublic(BaseModel):
     user_profile_image_url: str = Field(...)
 
 
-class UserData(BaseModel):
+@dataclass(slots=True)
+class UserData:
     """
     DB에 저장되는 사용자 정보
+
+    저장용 레코드라 검증 없이 생성되며, 외부로 나갈 때는 UserPublic으로 변환한다
     """
-    user_id: int = Field(...)
-    email: str = Field(..., description="사용자 이메일")
-    password: str = Field(..., description="사용자 비밀번호")
-    nickname: str = Field(..., description="사용자 닉네임")
-    user_profile_image_url: str = Field(..., description="사용자 프로필 이미지")
+    user_id: int
+    email: str                      # 사용자 이메일
+    password: str                   # 사용자 비밀번호
+    nickname: str                   # 사용자 닉네임
+    user_profile_image_url: str     # 사용자 프로필 이미지
+    version: int = 0                # 수정할 때마다 1 증가 (ETag에 사용)
+
+
+# 탈퇴한 사용자 대신 보여주는 작성자 (게시글/댓글은 남기고 작성자만 가린다)
+DELETED_USER_NICKNAME = "탈퇴한 사용자"
+DELETED_USER = UserData(
+    user_id=-1, email="", password="", nickname=DELETED_USER_NICKNAME, user_profile_image_url=""
+)
 
 users = [
     {"email": "test@example.com", "password": "Test1234!", "nickname": "test", "user_profile_image_url": "http" },
@@ -25,25 +39,38 @@ users = [
 ]
 
 class UserModel:
+    # 상태를 바꾸는 메소드 (작업 로그에 기록됨)
+    MUTATIONS = ("add_user", "update_user_profile", "update_password", "delete_user_by_user_id")
+
     def __init__(self):
-        self.db = []
+        # user_id -> UserData (삽입 순서 유지)
+        self.db: dict[int, UserData] = {}
+
+        # 보조 인덱스: email / nickname -> user_id
+        self.email_index: dict[str, int] = {}
+        self.nickname_index: dict[str, int] = {}
+
+        # 삭제 후에도 id가 재사용되지 않도록 단조 증가하는 id
+        self.next_user_id = 0
 
         for user in users:
             self.add_user(**user)
 
     def add_user(self, email: str, password: str, nickname: str, user_profile_image_url: str) -> int:
-        next_user_id = len(self.db)
-        self.db.append(
-            UserData(
-                user_id=next_user_id,
-                email=email,
-                password=password,
-                nickname=nickname,
-                user_profile_image_url=user_profile_image_url
-            )
+        user_id = self.next_user_id
+        self.next_user_id += 1
+
+        self.db[user_id] = UserData(
+            user_id=user_id,
+            email=email,
+            password=password,
+            nickname=nickname,
+            user_profile_image_url=user_profile_image_url
         )
+        self.email_index[email] = user_id
+        self.nickname_index[nickname] = user_id
 
-        return next_user_id
+        return user_id
 
 
     def search_user_by_nickname(self, nickname: str) -> UserData | None:
@@ -58,10 +85,10 @@ class UserModel:
                 해당 닉네임이 있으면 UserData, 없으면 None
         """
 
-        for user_data in self.db:
-            if user_data.nickname == nickname:
-                return user_data
-        return None
+        user_id = self.nickname_index.get(nickname)
+        if user_id is None:
+            return None
+        return self.db[user_id]
 
 
     def search_user_by_email(self, email: str) -> UserData | None:
@@ -74,10 +101,10 @@ class UserModel:
         Returns:
             UserData | None: DB에 사용자가 있으면 유저 데이터 반환
         """
-        for user_data in self.db:
-            if user_data.email == email:
-                return user_data
-        return None
+        user_id = self.email_index.get(email)
+        if user_id is None:
+            return None
+        return self.db[user_id]
 
 
     def search_user_by_id(self, user_id: int) -> UserData | None:
@@ -90,13 +117,47 @@ class UserModel:
         Returns:
             UserData | None: DB에 사용자가 있으면 유저 데이터 반환
         """
-        for user_data in self.db:
-            if user_data.user_id == user_id:
-                return user_data
-        return None
+        return self.db.get(user_id)
+
+
+    def get_users_by_ids(self, user_ids: Iterable[int]) -> dict[int, UserData]:
+        """
+        여러 사용자를 한 번에 조회 (댓글 작성자처럼 같은 사용자가 여러 번 나올 때 한 번씩만 찾는다)
+
+        Args:
+            user_ids (Iterable[int]): 조회할 user_id 목록 (중복 가능)
+
+        Returns:
+            dict[int, UserData]: user_id -> 유저 데이터, 없는 사용자는 빠진다
+        """
+        return {user_id: self.db[user_id] for user_id in set(user_ids) if user_id in self.db}
 
 
-    def user_data_2_user_public(self, data: UserData) -> UserPublic:
+    def scan_users(self, after: int | None, limit: int) -> list[UserData]:
+        """
+        user_id 순서로 after 다음의 사용자를 limit개 조회 (전체 내보내기용)
+
+        id는 단조 증가하므로 after 다음 id부터 차례로 찾는다 (삭제된 id만큼만 더 본다)
+
+        Args:
+            after (int | None): 이전 묶음의 마지막 user_id, None이면 처음부터
+            limit (int): 가져올 개수
+
+        Returns:
+            list[UserData]: user_id 순 유저 데이터 (limit개보다 적으면 마지막 묶음)
+        """
+        users = []
+        user_id = 0 if after is None else after + 1
+        while len(users) < limit and user_id < self.next_user_id:
+            user_data = self.db.get(user_id)
+            if user_data is not None:
+                users.append(user_data)
+            user_id += 1
+        return users
+
+
+    @staticmethod
+    def user_data_2_user_public(data: UserData) -> UserPublic:
         """
         DB에서 가져온 데이터를 민감한 정보를 제외한 외부로 전송한 가는 데이터로 변경
 
@@ -114,13 +175,88 @@ class UserModel:
         )
 
 
+    def update_user_profile(self, user_id: int, nickname: str, user_profile_image_url: str) -> bool:
+        """
+        닉네임과 프로필 이미지를 수정하고 닉네임 인덱스를 갱신
+
+        Args:
+            user_id (int): 수정할 사용자 id
+            nickname (str): 새 닉네임
+            user_profile_image_url (str): 새 프로필 이미지
+
+        Returns:
+            bool: 사용자가 있어서 수정했으면 True
+        """
+        user_data = self.db.get(user_id)
+        if user_data is None:
+            return False
+
+        if user_data.nickname != nickname:
+            del self.nickname_index[user_data.nickname]
+            self.nickname_index[nickname] = user_id
+
+        user_data.nickname = nickname
+        user_data.user_profile_image_url = user_profile_image_url
+        user_data.version += 1
+        return True
+
+
+    def update_password(self, user_id: int, password: str) -> bool:
+        """
+        사용자의 비밀번호를 변경
+
+        Args:
+            user_id (int): 변경할 사용자 id
+            password (str): 새 비밀번호
+
+        Returns:
+            bool: 사용자가 있어서 변경했으면 True
+        """
+        user_data = self.db.get(user_id)
+        if user_data is None:
+            return False
+
+        user_data.password = password
+        user_data.version += 1
+        return True
+
+
     def delete_user_by_user_id(self, user_id: int) -> bool:
-        for idx, user in enumerate(self.db):
-            if user.user_id == user_id:
-                del self.db[idx]
-                return True
-        
-        return False
+        user_data = self.db.pop(user_id, None)
+        if user_data is None:
+            return False
+
+        del self.email_index[user_data.email]
+        del self.nickname_index[user_data.nickname]
+        return True
+
+    def dump_state(self) -> dict:
+        """
+        스냅샷에 저장할 상태를 JSON으로 바꿀 수 있는 형태로 반환
+        """
+        return {
+            "next_user_id": self.next_user_id,
+            "users": [
+                [user.user_id, user.email, user.password, user.nickname, user.user_profile_image_url, user.version]
+                for user in self.db.values()
+            ]
+        }
+
+    def load_state(self, state: dict) -> None:
+        """
+        dump_state로 만든 상태로 DB와 인덱스를 다시 만든다
+        """
+        self.db = {}
+        self.email_index = {}
+        self.nickname_index = {}
+
+        for row in state["users"]:
+            user_data = UserData(*row)
+            self.db[user_data.user_id] = user_data
+            self.email_index[user_data.email] = user_data.user_id
+            self.nickname_index[user_data.nickname] = user_data.user_id
+
+        self.next_user_id = state["next_user_id"]
 
     def authenticate_user(self, email: str, password: str) -> UserData | None:
         """
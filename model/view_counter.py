@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from typing import Callable
+
+from .async_storage import AsyncPostStorage
+
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCounter:
+    """
+    포스터 조회수 증가를 메모리에 모았다가 한 번에 저장소에 반영하는 집계기 (write-behind)
+
+    조회할 때마다 저장소에 쓰지 않고 post_id별 증가분만 더해두고,
+    flush_interval초마다(서버의 백그라운드 태스크) 또는 모인 증가분이 flush_threshold를 넘으면
+    add_views 한 번으로 저장소에 반영한다.
+    조회 응답은 저장된 조회수에 아직 반영되지 않은 증가분을 더해서 보여준다.
+
+    모든 메소드는 이벤트 루프에서만 호출하므로 락이 필요 없다.
+    (워커마다 집계기가 따로 있어서, 다른 워커의 반영 전 증가분은 보이지 않는다)
+    """
+
+    def __init__(
+            self,
+            post_db: AsyncPostStorage,
+            flush_threshold: int = 1000,
+            on_flush: Callable[[list[tuple[int, int]]], None] | None = None
+        ):
+        """
+        Args:
+            post_db (AsyncPostStorage): 조회수를 반영할 저장소
+            flush_threshold (int): 모인 증가분이 이만큼이면 바로 반영
+            on_flush: 반영에 성공한 (post_id, 증가분) 목록을 받는 함수 (캐시의 조회수 갱신 등)
+        """
+        self.post_db = post_db
+        self.flush_threshold = flush_threshold
+        self.on_flush = on_flush
+
+        # 아직 반영하지 않은 증가분 (post_id -> 증가분)
+        self.pending: dict[int, int] = {}
+        self.pending_total = 0
+        # 반영 중인 증가분 (반영이 끝날 때까지 조회에 더해준다)
+        self.flushing: dict[int, int] = {}
+
+    async def increase(self, post_id: int) -> None:
+        """
+        포스터의 조회수를 1 증가 (모인 증가분이 flush_threshold 이상이면 바로 반영)
+
+        Args:
+            post_id (int): 조회한 post_id
+        """
+        self.pending[post_id] = self.pending.get(post_id, 0) + 1
+        self.pending_total += 1
+        if self.pending_total >= self.flush_threshold and not self.flushing:
+            await self.flush()
+
+    def pending_views(self, post_id: int) -> int:
+        """
+        아직 저장소에 반영되지 않은 조회수 증가분
+        """
+        return self.pending.get(post_id, 0) + self.flushing.get(post_id, 0)
+
+    async def flush(self) -> None:
+        """
+        모인 증가분을 저장소에 한 번에 반영
+
+        반영에 실패하면 증가분을 다시 모아두고 다음 반영 때 다시 시도한다
+        """
+        if not self.pending or self.flushing:
+            return
+
+        self.flushing, self.pending = self.pending, {}
+        self.pending_total = 0
+        views = list(self.flushing.items())
+        try:
+            await self.post_db.add_views(views)
+        except Exception:
+            logger.exception("failed to flush %d buffered view counts", len(views))
+            for post_id, count in views:
+                self.pending[post_id] = self.pending.get(post_id, 0) + count
+                self.pending_total += count
+        else:
+            if self.on_flush is not None:
+                self.on_flush(views)
+        finally:
+            self.flushing = {}
+
+    async def flush_periodically(self, interval: float) -> None:
+        """
+        interval초마다 flush (서버 이벤트 루프의 백그라운드 태스크에서 사용)
+        """
+        while True:
+            await asyncio.sleep(interval)
+            await self.flush()
@@ -0,0 +1,67 @@
+import secrets
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+import config
+from dependencies import (
+    UserModelDep,
+    PostModelDep,
+    CommentModelDep,
+    LikeModelDep,
+    ViewCounterDep
+)
+from model.export import ENTITIES, export_ndjson
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"]
+)
+
+
+def check_admin_token(token: str | None) -> None:
+    # ADMIN_TOKEN을 설정하지 않았으면 관리자 API는 항상 막는다
+    if not config.ADMIN_TOKEN or token is None or not secrets.compare_digest(
+        token.encode("utf-8"), config.ADMIN_TOKEN.encode("utf-8")
+    ):
+        raise HTTPException(
+            status_code=403,
+            detail="관리자 권한이 없습니다."
+        )
+
+# ================ 데이터 내보내기 ==================
+@router.get("/export")
+async def export_data(
+        user_db: UserModelDep,
+        post_db: PostModelDep,
+        comment_db: CommentModelDep,
+        like_db: LikeModelDep,
+        view_counter: ViewCounterDep,
+        x_admin_token: Annotated[str | None, Header()] = None,
+        entities: Annotated[list[Literal["users", "posts", "comments", "likes"]] | None, Query()] = None,
+        gzip: bool = False
+    ):
+    check_admin_token(x_admin_token)
+
+    try:
+        # 모아둔 조회수도 내보내기에 들어가도록 먼저 반영
+        await view_counter.flush()
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail="fail to export"
+        )
+
+    # 묶음 단위로 읽는 대로 보내므로 응답 전체를 메모리에 만들지 않는다
+    body = export_ndjson(
+        user_db, post_db, comment_db, like_db,
+        entities=ENTITIES if entities is None else tuple(entities),
+        compress=gzip
+    )
+    filename = "export.ndjson.gz" if gzip else "export.ndjson"
+    return StreamingResponse(
+        body,
+        media_type="application/gzip" if gzip else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
@@ -1,23 +1,46 @@
-from fastapi import APIRouter, HTTPException
-
-from dependencies import PostModelDep, UserModelDep, CommentModelDep, LikeModelDep
+import logging
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Query, Response
+
+from dependencies import (
+    PostModelDep,
+    UserModelDep,
+    CommentModelDep,
+    LikeModelDep,
+    LikeServiceDep,
+    ViewCounterDep,
+    PostCacheDep
+)
 
 from schemas.post import(
     UplaodPostRequest,
     UplaodPostResponse,
     PostResponse,
     PostListResponse,
+    PostSearchResponse,
+    CommentListResponse,
+    BatchGetPostsRequest,
+    BatchGetPostsResponse,
+    BatchPostResult,
+    PostWithAuthor,
     DeletePostRequest,
     DeletePostResponse,
     EditPostRequest,
     EditPostResponse
 )
 
+from model.user_model import DELETED_USER
+
+from schemas.cursor import encode_cursor, decode_cursor
+from schemas.etag import IfNoneMatch, make_etag, etag_matches, not_modified
+
 from schemas.like import(
     LikePostRequest,
     LikePostResponse,
     UnlikePostRequest,
-    UnlikePostResponse
+    UnlikePostResponse,
+    LikeListResponse
 )
 
 from schemas.comment import(
@@ -35,15 +58,36 @@ router = APIRouter(
     tags=["Posts"]
 )
 
+logger = logging.getLogger(__name__)
+
+# 게시글 상세에 담는 댓글 수 / 댓글 목록 한 페이지의 최대 댓글 수
+COMMENT_PAGE_SIZE = 20
+COMMENT_PAGE_MAX = 100
+
+# 게시글 목록 한 페이지의 기본/최대 개수
+POST_PAGE_SIZE = 20
+POST_PAGE_MAX = 100
+
+# 인기순 목록의 sort 값 -> 저장소 정렬 필드
+SORT_FIELDS = {"likes": "like", "views": "view"}
+
+# 검색 결과 한 페이지의 기본/최대 개수
+SEARCH_PAGE_SIZE = 20
+SEARCH_PAGE_MAX = 100
+
 # ================ 게시글 작성 =================
 @router.post("", status_code=200)
-async def upload_post(upload_post_request: UplaodPostRequest, post_db: PostModelDep):
+async def upload_post(upload_post_request: UplaodPostRequest, post_db: PostModelDep, user_db: UserModelDep):
     try:
-        new_post_id = post_db.add_post(
+        # 작성자 닉네임은 목록 요약에 같이 저장
+        poster = await user_db.search_user_by_id(upload_post_request.poster_id)
+
+        new_post_id = await post_db.add_post(
             title=upload_post_request.title,
             content=upload_post_request.content,
             poster_id=upload_post_request.poster_id,
-            image_url=upload_post_request.image_url
+            image_url=upload_post_request.image_url,
+            poster_nickname="" if poster is None else poster.nickname
         )
     except Exception as e:
         raise HTTPException(
@@ -56,45 +100,272 @@ async def upload_post(upload_post_request: UplaodPostRequest, post_db: PostModel
         message="post_success"
     )
 
+# ================ 게시글 검색 =================
+# /{post_id}보다 먼저 등록해야 "search"가 post_id로 잡히지 않는다
+@router.get("/search", status_code=200)
+async def search_posts(
+        q: str,
+        post_db: PostModelDep,
+        view_counter: ViewCounterDep,
+        limit: int = Query(SEARCH_PAGE_SIZE, ge=1, le=SEARCH_PAGE_MAX),
+        offset: int = Query(0, ge=0)
+    ):
+    try:
+        posts = await post_db.search_posts(q, limit, offset)
+        for post in posts:
+            post.view += view_counter.pending_views(post.post_id)
+    except Exception:
+        logger.exception("failed to search posts")
+        raise HTTPException(
+            status_code=500,
+        )
+
+    return PostSearchResponse(
+        message="search_posts_success",
+        data=[post_db.post_summary_2_summary_public(post) for post in posts]
+    )
+
+# ================ 게시글 여러 개 보기 =================
+# 클라이언트가 id를 알고 있는 게시글을 한 번에 새로 받는다 (조회수는 올리지 않고, 댓글은 담지 않음)
+@router.post(":batchGet", status_code=200)
+async def batch_get_posts(batch_get_request: BatchGetPostsRequest, post_db: PostModelDep, user_db: UserModelDep, view_counter: ViewCounterDep):
+    try:
+        # 게시글과 작성자를 각각 한 번에 조회 (같은 게시글/작성자는 한 번만)
+        posts = await post_db.get_posts_by_ids(batch_get_request.post_ids)
+        users = await user_db.get_users_by_ids({post.poster_id for post in posts.values()})
+
+        found = {}
+        for post_id, post in posts.items():
+            # 탈퇴한 작성자의 게시글은 남아있으므로 작성자만 가린다
+            poster = users.get(post.poster_id, DELETED_USER)
+            post.view += view_counter.pending_views(post_id)
+            found[post_id] = PostWithAuthor(
+                **post_db.post_data_2_post_public(post).model_dump(),
+                poster_nickname=poster.nickname,
+                poster_image=poster.user_profile_image_url
+            )
+
+    except Exception:
+        logger.exception("failed to batch get posts")
+        raise HTTPException(
+            status_code=500,
+        )
+
+    return BatchGetPostsResponse(
+        message="batch_get_posts_success",
+        data=[
+            BatchPostResult(post_id=post_id, found=post_id in found, post=found.get(post_id))
+            for post_id in batch_get_request.post_ids
+        ]
+    )
+
 # ================ 게시글 보기 =================
 @router.get("/{post_id}", status_code=200)
-async def get_post(post_id: int, post_db: PostModelDep, user_db: UserModelDep, coomment_db: CommentModelDep):
-    try:
-        post_data = post_db.get_post_by_id(post_id)
-        post_data.view += 1
+async def get_post(post_id: int, post_db: PostModelDep, user_db: UserModelDep, comment_db: CommentModelDep, view_counter: ViewCounterDep, post_cache: PostCacheDep, response: Response, if_none_match: IfNoneMatch = None):
+    # 캐시된 응답은 조회수만 최신 값으로 바꿔서 돌려준다
+    cached, generation = post_cache.get(post_id)
+    if cached is not None:
+        body, etag_key, view = cached.response, cached.etag_key, cached.view
+    else:
+        try:
+            post_data = await post_db.get_post_by_id(post_id)
+            if post_data is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail="존재하지 않는 게시글 입니다."
+                )
+
+            # 댓글은 첫 페이지만 (댓글이 아무리 많아도 응답 크기가 일정)
+            raw_comments, has_more = await comment_db.get_comments_after(post_id, None, COMMENT_PAGE_SIZE)
+            comment_count = await comment_db.count_comments_by_post_id(post_id)
+
+            # 작성자와 댓글 작성자를 한 번에 조회 (같은 사용자는 한 번만)
+            users = await user_db.get_users_by_ids(
+                {post_data.poster_id, *(comment.user_id for comment in raw_comments)}
+            )
+            # 탈퇴한 사용자의 게시글/댓글은 남기고 작성자만 DELETED_USER로 가린다
+            poster_data = users.get(post_data.poster_id, DELETED_USER)
+            comments = comment_db.comments_2_comment_public(raw_comments, users)
+            comment_versions = [
+                (comment.comment_id, comment.version, comment.user_id, users.get(comment.user_id, DELETED_USER).version)
+                for comment in raw_comments
+            ]
+
+        except HTTPException as he:
+            raise he
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=500
+            )
 
-        poster_data = user_db.search_user_by_id(post_data.poster_id)
+        body = PostResponse(
+            message="success_get_post",
+            title=post_data.title,
+            content=post_data.content,
+            image_url=post_data.image_url,
+            posted_date=post_data.posted_date,
+            poster_image=poster_data.user_profile_image_url,
+            poster_nickname=poster_data.nickname,
+            like=post_data.like,
+            view=post_data.view,
+            comment=comments,
+            comment_count=comment_count,
+            comment_next=comment_cursor(raw_comments, has_more)
+        )
+        # 응답에 들어간 포스터, 작성자, 댓글, 댓글 작성자의 version (조회수 제외)
+        etag_key = make_etag(
+            post_id, post_data.version, poster_data.user_id, poster_data.version, comment_count, comment_versions
+        )
+        view = post_data.view
+        post_cache.put(
+            post_id,
+            generation,
+            body,
+            view=view,
+            user_ids={post_data.poster_id, *(comment.user_id for comment in raw_comments)},
+            etag_key=etag_key
+        )
 
-        raw_comments = coomment_db.get_comments_by_post_id(post_id)
+    # 클라이언트가 가진 응답이 최신이면 조회수를 올리지 않고 304
+    view += view_counter.pending_views(post_id)
+    etag = make_etag(etag_key, view)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    # 조회수는 바로 쓰지 않고 모아서 반영 (응답에는 반영 전 증가분을 더해서 보여줌)
+    await view_counter.increase(post_id)
+    view += 1
+
+    response.headers["ETag"] = make_etag(etag_key, view)
+    return body.model_copy(update={"view": view})
+
+# ================ 댓글 목록 ===================
+@router.get("/{post_id}/comments", status_code=200)
+async def get_comments(
+        post_id: int,
+        post_db: PostModelDep,
+        user_db: UserModelDep,
+        comment_db: CommentModelDep,
+        cursor: str | None = None,
+        limit: int = Query(COMMENT_PAGE_SIZE, ge=1, le=COMMENT_PAGE_MAX)
+    ):
+    # comment_id 순서로 커서 다음 페이지 (게시글 상세의 comment_next부터 이어서 읽음)
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_comment_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail="올바르지 않은 커서입니다."
+            )
 
-        comments = []
-        for comment in raw_comments:
-            comments.append(coomment_db.comment_data_2_comment_public(comment))
+    try:
+        if await post_db.get_post_by_id(post_id) is None:
+            raise HTTPException(
+                status_code=404
+            )
+
+        raw_comments, has_more = await comment_db.get_comments_after(post_id, after, limit)
+        users = await user_db.get_users_by_ids({comment.user_id for comment in raw_comments})
+
+    except HTTPException as he:
+        raise he
 
     except Exception as e:
         raise HTTPException(
             status_code=500
         )
-    
-    return PostResponse(
-        message="success_get_post",
-        title=post_data.title,
-        content=post_data.content,
-        image_url=post_data.image_url,
-        posted_date=post_data.posted_date,
-        poster_image=poster_data.user_profile_image_url,
-        poster_nickname=poster_data.nickname,
-        like=post_data.like,
-        view=post_data.view,
-        comment=comments
+
+    return CommentListResponse(
+        message="get_comments_success",
+        data=comment_db.comments_2_comment_public(raw_comments, users),
+        next=comment_cursor(raw_comments, has_more)
     )
 
+
+def comment_cursor(comments: list, has_more: bool) -> str | None:
+    """
+    받은 댓글 페이지의 다음 페이지 커서 (더 없으면 None)
+    """
+    if not has_more or not comments:
+        return None
+    return encode_cursor([comments[-1].comment_id], "asc", "next")
+
+
+def decode_comment_cursor(cursor: str) -> int:
+    """
+    comment_cursor로 만든 커서의 마지막 comment_id
+
+    Raises:
+        ValueError: 커서가 올바르지 않을 때 (게시글 목록 커서 등)
+    """
+    key, _, direction = decode_cursor(cursor)
+    if len(key) != 1 or type(key[0]) is not int or direction != "next":
+        raise ValueError("invalid comment cursor")
+    return key[0]
+
 # ================ 게시글 목록 ==================
 @router.get("", status_code=200)
-async def get_postlist(post_db: PostModelDep, offset: int = 0, limit:int = 20):
+async def get_postlist(
+        post_db: PostModelDep,
+        view_counter: ViewCounterDep,
+        response: Response,
+        offset: int | None = Query(None, ge=0),
+        limit: int = Query(POST_PAGE_SIZE, ge=1, le=POST_PAGE_MAX),
+        cursor: str | None = None,
+        order: Literal["asc", "desc"] | None = None,
+        sort: Literal["date", "likes", "views"] = "date",
+        fields: Literal["summary", "full"] = "summary",
+        if_none_match: IfNoneMatch = None
+    ):
+    # 커서 방식: sort=date(기본)면 (posted_date, post_id), likes/views면 (좋아요/조회수, post_id) 순서로
+    # 커서 다음/이전 페이지 (정렬 기본값은 작성순은 오름차순, 인기순은 내림차순)
+    # offset을 주면 기존 offset 방식 (작성 순서, 호환용)
+    key, direction = None, "next"
+    if cursor is not None:
+        try:
+            key, order, direction = decode_cursor(cursor)
+            sort = cursor_sort(key)
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail="올바르지 않은 커서입니다."
+            )
+    elif offset is not None and sort != "date":
+        raise HTTPException(
+            status_code=400,
+            detail="인기순 목록은 커서 방식만 지원합니다."
+        )
+    if order is None:
+        order = "asc" if sort == "date" else "desc"
 
     try:
-        posts, next_offset = post_db.get_posts(offset, limit)
+        # 목록 요약은 쓸 때 미리 만들어둔 열만 읽는다 (본문/이미지 목록/작성자 조회 없음)
+        summary = fields == "summary"
+        if offset is not None and cursor is None:
+            posts, next_page = await post_db.get_posts(offset, limit, summary=summary)
+            prev_page = None
+        else:
+            # 이전 페이지는 반대 순서로 읽어서 뒤집는다
+            descending = (order == "desc") != (direction == "prev")
+            if sort == "date":
+                posts, has_more = await post_db.get_posts_after(
+                    None if key is None else tuple(key), limit, descending=descending, summary=summary
+                )
+            else:
+                posts, has_more = await post_db.get_posts_ranked(
+                    SORT_FIELDS[sort], None if key is None else tuple(key[1:]), limit,
+                    descending=descending, summary=summary
+                )
+            if direction == "prev":
+                posts.reverse()
+            next_page, prev_page = page_cursors(posts, key, sort, order, direction, has_more)
+
+        # 저장소에서 받은 사본에 아직 반영되지 않은 조회수를 더함
+        for post in posts:
+            post.view += view_counter.pending_views(post.post_id)
 
     except Exception as e:
         print(e)
@@ -102,28 +373,90 @@ async def get_postlist(post_db: PostModelDep, offset: int = 0, limit:int = 20):
             status_code=500,
         )
 
+    # 페이지의 포스터가 그대로면 변환/직렬화 없이 304
+    etag = make_etag(fields, sort, next_page, prev_page, [(post.post_id, post.version, post.view) for post in posts])
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
     return PostListResponse(
         message="get_postlist_success",
-        data=posts,
-        next=next_offset
+        data=[
+            post_db.post_summary_2_summary_public(post) if summary else post_db.post_data_2_post_public(post)
+            for post in posts
+        ],
+        next=next_page,
+        prev=prev_page
     )
 
+
+def sort_key(sort: str, post) -> list:
+    """
+    커서에 담는 포스터의 정렬 키 (인기순은 어느 정렬의 커서인지도 앞에 담는다)
+    """
+    if sort == "date":
+        return [post.posted_date, post.post_id]
+    return [sort, getattr(post, SORT_FIELDS[sort]), post.post_id]
+
+
+def cursor_sort(key: list) -> str:
+    """
+    커서 키가 어느 정렬의 키인지 (sort_key의 반대)
+
+    Raises:
+        ValueError: 키 모양이 어느 정렬에도 맞지 않을 때
+    """
+    if len(key) == 2 and type(key[0]) is str and type(key[1]) is int:
+        return "date"
+    if len(key) == 3 and key[0] in SORT_FIELDS and all(type(part) is int for part in key[1:]):
+        return key[0]
+    raise ValueError("invalid post cursor")
+
+
+def page_cursors(posts: list, key: list | None, sort: str, order: str, direction: str, has_more: bool) -> tuple[str | None, str | None]:
+    """
+    받은 페이지의 다음/이전 페이지 커서
+
+    Args:
+        posts (list): 이번 페이지 포스터 (화면 순서)
+        key (list | None): 요청 커서의 키 (첫 페이지면 None)
+        sort (str): date / likes / views
+        order (str): asc / desc
+        direction (str): 요청 커서의 방향 (next / prev)
+        has_more (bool): 읽은 방향으로 포스터가 더 있는지
+
+    Returns:
+        tuple[str | None, str | None]: (다음 페이지 커서, 이전 페이지 커서)
+    """
+    first = sort_key(sort, posts[0]) if posts else key
+    last = sort_key(sort, posts[-1]) if posts else key
+
+    if direction == "next":
+        has_next, has_prev = has_more, key is not None
+    else:
+        has_next, has_prev = key is not None, has_more
+
+    next_page = encode_cursor(last, order, "next") if has_next and last is not None else None
+    prev_page = encode_cursor(first, order, "prev") if has_prev and first is not None else None
+    return next_page, prev_page
+
 # ================ 게시글 삭제 =================
 @router.delete("/{post_id}", status_code=200)
-async def delete_post(post_id: int, delete_post_request: DeletePostRequest, post_db: PostModelDep, user_db: UserModelDep):
+async def delete_post(post_id: int, delete_post_request: DeletePostRequest, post_db: PostModelDep, user_db: UserModelDep, post_cache: PostCacheDep):
     try:
-        post = post_db.get_post_by_id(post_id)
-        user = user_db.search_user_by_id(delete_post_request.user_id)
+        post = await post_db.get_post_by_id(post_id)
+        user = await user_db.search_user_by_id(delete_post_request.user_id)
 
         if post is None or user is None:
             raise HTTPException(
                 status_code=404
             )
         
-        if not post_db.delete_post_by_id(post_id):
+        if not await post_db.delete_post_by_id(post_id):
             raise HTTPException(
                 status_code=400
             )
+        post_cache.invalidate(post_id)
         
     except HTTPException as he:
         raise he
@@ -139,16 +472,16 @@ async def delete_post(post_id: int, delete_post_request: DeletePostRequest, post
 
 # ================ 게시글 수정 =================
 @router.patch("/{post_id}", status_code=200)
-async def edit_post(post_id: int, edit_post_request: EditPostRequest, post_db: PostModelDep, user_db: UserModelDep):
+async def edit_post(post_id: int, edit_post_request: EditPostRequest, post_db: PostModelDep, user_db: UserModelDep, post_cache: PostCacheDep):
     try:
-        post = post_db.get_post_by_id(post_id)
+        post = await post_db.get_post_by_id(post_id)
         if post is None:
             raise HTTPException(
                 status_code=404,
                 detail="존재하지 않는 게시글 입니다."
             )
         
-        user = user_db.search_user_by_id(edit_post_request.user_id)
+        user = await user_db.search_user_by_id(edit_post_request.user_id)
         if user is None:
             raise HTTPException(
                 status_code=404,
@@ -161,9 +494,13 @@ async def edit_post(post_id: int, edit_post_request: EditPostRequest, post_db: P
                 detail="게시글 작성자가 아니라서 수정할 수 없습니다."
             )
         
-        post.title = edit_post_request.title
-        post.content = edit_post_request.content
-        post.image_url = edit_post_request.image_url
+        await post_db.edit_post(
+            post_id=post_id,
+            title=edit_post_request.title,
+            content=edit_post_request.content,
+            image_url=edit_post_request.image_url
+        )
+        post_cache.invalidate(post_id)
     
     except HTTPException as he:
         raise he
@@ -179,24 +516,24 @@ async def edit_post(post_id: int, edit_post_request: EditPostRequest, post_db: P
 
 #================= 좋아요 =====================
 @router.post("/{post_id}/like", status_code=200)
-async def like_post(post_id: int, like_post_requset: LikePostRequest, post_db: PostModelDep, user_db: UserModelDep, like_db: LikeModelDep):
+async def like_post(post_id: int, like_post_requset: LikePostRequest, post_db: PostModelDep, user_db: UserModelDep, like_service: LikeServiceDep, post_cache: PostCacheDep):
     
     try:
-        post = post_db.get_post_by_id(post_id)
-        user = user_db.search_user_by_id(like_post_requset.user_id)
+        post = await post_db.get_post_by_id(post_id)
+        user = await user_db.search_user_by_id(like_post_requset.user_id)
 
         if post is None or user is None:
             raise HTTPException(
                 status_code=404
             )
 
-        if not like_db.add_like(post_id=post_id, user_id=like_post_requset.user_id):
+        # 좋아요 추가와 좋아요 수 증가를 한 번에
+        if await like_service.like(post_id=post_id, user_id=like_post_requset.user_id) is None:
             raise HTTPException(
                 status_code=400,
                 detail="이미 좋아요를 눌렀습니다."
             ) 
-    
-        post.like += 1
+        post_cache.invalidate(post_id)
     
     except HTTPException as he:
         raise he
@@ -211,25 +548,49 @@ async def like_post(post_id: int, like_post_requset: LikePostRequest, post_db: P
         message="like_success"
     )
 
+# ================ 좋아요 목록 =================
+@router.get("/{post_id}/likes", status_code=200)
+async def get_post_likes(post_id: int, post_db: PostModelDep, like_db: LikeModelDep):
+    try:
+        if await post_db.get_post_by_id(post_id) is None:
+            raise HTTPException(
+                status_code=404
+            )
+
+        likers = await like_db.get_likers_by_post_id(post_id)
+
+    except HTTPException as he:
+        raise he
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500
+        )
+
+    return LikeListResponse(
+        message="get_likes_success",
+        user_id=likers,
+        count=len(likers)
+    )
+
 # ================ 좋아요 취소 =================
 @router.delete("/{post_id}/like", status_code=200)
-async def unlike_post(post_id: int, like_post_requset: UnlikePostRequest, post_db: PostModelDep, user_db: UserModelDep, like_db: LikeModelDep):
+async def unlike_post(post_id: int, like_post_requset: UnlikePostRequest, post_db: PostModelDep, user_db: UserModelDep, like_service: LikeServiceDep, post_cache: PostCacheDep):
     try:
-        post = post_db.get_post_by_id(post_id)
-        user = user_db.search_user_by_id(like_post_requset.user_id)
+        post = await post_db.get_post_by_id(post_id)
+        user = await user_db.search_user_by_id(like_post_requset.user_id)
 
         if post is None or user is None:
             raise HTTPException(
                 status_code=404
             )
 
-        if not like_db.delete_like(post_id=post_id, user_id=like_post_requset.user_id):
+        if await like_service.unlike(post_id=post_id, user_id=like_post_requset.user_id) is None:
             raise HTTPException(
                 status_code=400,
                 detail="좋아요를 누르지 않았습니다."
             )
-        
-        post.like -= 1
+        post_cache.invalidate(post_id)
 
     except HTTPException as he:
         raise he
@@ -245,10 +606,10 @@ async def unlike_post(post_id: int, like_post_requset: UnlikePostRequest, post_d
 
 # ================ 댓글 작성 ===================
 @router.post("/{post_id}/comment", status_code=200)
-async def write_comment(post_id: int, comment_write_request: CommentWriteRequest, post_db: PostModelDep, user_db: UserModelDep, comment_db: CommentModelDep):
+async def write_comment(post_id: int, comment_write_request: CommentWriteRequest, post_db: PostModelDep, user_db: UserModelDep, comment_db: CommentModelDep, post_cache: PostCacheDep):
     try:
-        post = post_db.get_post_by_id(post_id)
-        user = user_db.search_user_by_id(comment_write_request.user_id)
+        post = await post_db.get_post_by_id(post_id)
+        user = await user_db.search_user_by_id(comment_write_request.user_id)
 
         if post is None or user is None:
             raise HTTPException(
@@ -257,7 +618,9 @@ async def write_comment(post_id: int, comment_write_request: CommentWriteRequest
         
         time_stamp = "2001"
 
-        comment_id = comment_db.add_comment(post_id, comment_write_request.user_id, time_stamp, comment_write_request.comment)
+        comment_id = await comment_db.add_comment(post_id, comment_write_request.user_id, time_stamp, comment_write_request.comment)
+        await post_db.update_comment_count(post_id, 1)
+        post_cache.invalidate(post_id)
         
     except HTTPException as he:
         raise he
@@ -274,17 +637,17 @@ async def write_comment(post_id: int, comment_write_request: CommentWriteRequest
 
 # ================ 댓글 수정 ===================
 @router.patch("/{post_id}/comment", status_code=200)
-async def write_comment(post_id: int, comment_write_request: CommentEditRequest, post_db: PostModelDep, user_db: UserModelDep, comment_db: CommentModelDep):
+async def write_comment(post_id: int, comment_write_request: CommentEditRequest, post_db: PostModelDep, user_db: UserModelDep, comment_db: CommentModelDep, post_cache: PostCacheDep):
     try:
-        post = post_db.get_post_by_id(post_id)
-        user = user_db.search_user_by_id(comment_write_request.user_id)
+        post = await post_db.get_post_by_id(post_id)
+        user = await user_db.search_user_by_id(comment_write_request.user_id)
 
         if post is None or user is None:
             raise HTTPException(
                 status_code=404
             )
         
-        comment = comment_db.get_comment_by_comment_id(comment_write_request.comment_id)
+        comment = await comment_db.get_comment_by_comment_id(comment_write_request.comment_id)
 
         if comment is None or comment.post_id != post_id:
             raise HTTPException(
@@ -294,8 +657,8 @@ async def write_comment(post_id: int, comment_write_request: CommentEditRequest,
         
         time_stamp = "2001"
 
-        comment.comment = comment_write_request.comment
-        comment.comment_date = time_stamp
+        await comment_db.edit_comment(comment_write_request.comment_id, comment_write_request.comment, time_stamp)
+        post_cache.invalidate(post_id)
 
     except HTTPException as he:
         raise he
@@ -311,21 +674,26 @@ async def write_comment(post_id: int, comment_write_request: CommentEditRequest,
 
 # ================ 댓글 삭제 ===================
 @router.delete("/{post_id}/comment", status_code=200)
-async def delete_comment(post_id: int, comment_delete_request: CommentDeleteRequest, post_db:PostModelDep, user_db: UserModelDep, comment_db: CommentModelDep):
+async def delete_comment(post_id: int, comment_delete_request: CommentDeleteRequest, post_db:PostModelDep, user_db: UserModelDep, comment_db: CommentModelDep, post_cache: PostCacheDep):
     try:
-        post = post_db.get_post_by_id(post_id)
-        user = user_db.search_user_by_id(comment_delete_request.user_id)
+        post = await post_db.get_post_by_id(post_id)
+        user = await user_db.search_user_by_id(comment_delete_request.user_id)
 
         if post is None or user is None:
             raise HTTPException(
                 status_code=404
             )
         
-        if not comment_db.delete_comment_by_comment_id(comment_delete_request.comment_id):
+        # 댓글이 실제로 달린 게시글의 캐시를 지우기 위해 먼저 조회
+        comment = await comment_db.get_comment_by_comment_id(comment_delete_request.comment_id)
+
+        if not await comment_db.delete_comment_by_comment_id(comment_delete_request.comment_id):
             raise HTTPException(
                 status_code=400,
                 detail="댓글 삭제에 실패하였습니다."
             )
+        await post_db.update_comment_count(comment.post_id, -1)
+        post_cache.invalidate(comment.post_id)
         
     except HTTPException as he:
         raise he
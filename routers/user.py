@@ -1,15 +1,26 @@
-from fastapi import APIRouter, HTTPException
+from typing import Literal
 
-from dependencies import UserModelDep
+from fastapi import APIRouter, HTTPException, Query, Response
+
+from dependencies import UserModelDep, PostModelDep, PostCacheDep, ViewCounterDep
+
+from model.user_model import DELETED_USER_NICKNAME
 
 from schemas.auth import SignupRequest, SignupResponse, LoginRequest, LoginResponse 
 from schemas.profile import (
     UserEditRequest, UserEditResponse, 
     PasswordChangeRequest, PasswordChangeResponse, UserProfileResponse
 )
+from schemas.post import AuthorPostListResponse
+from schemas.cursor import encode_cursor, decode_cursor
+from schemas.etag import IfNoneMatch, make_etag, etag_matches, not_modified
 
 BASE_IMAGE_URL = "http://base.image.com"
 
+# 작성자별 게시글 목록 한 페이지의 기본/최대 개수
+AUTHOR_PAGE_SIZE = 20
+AUTHOR_PAGE_MAX = 100
+
 router = APIRouter(
     prefix="/users",
     tags=["Users"]
@@ -18,14 +29,14 @@ router = APIRouter(
 # ================= 회원가입 =========================
 @router.post("/signup", status_code=201)
 async def signup(signup_request: SignupRequest, user_db: UserModelDep):
-    if user_db.search_user_by_nickname(signup_request.nickname) is not None:
+    if await user_db.search_user_by_nickname(signup_request.nickname) is not None:
         raise HTTPException(
             status_code=409,
             detail="nickname already in use."
         )
 
     try:
-        user_data =  user_db.search_user_by_email(signup_request.email)
+        user_data =  await user_db.search_user_by_email(signup_request.email)
 
         if user_data is not None:
             raise HTTPException(
@@ -33,7 +44,7 @@ async def signup(signup_request: SignupRequest, user_db: UserModelDep):
                 detail="Email already in use."
             )
 
-        user_id = user_db.add_user(
+        user_id = await user_db.add_user(
             email=signup_request.email,
             password=signup_request.password,
             nickname=signup_request.nickname,
@@ -64,7 +75,7 @@ async def signup(signup_request: SignupRequest, user_db: UserModelDep):
 async def login(login_request: LoginRequest, user_db: UserModelDep):
     # 형식 검증: 솔직히 이건 프런트의 몫이다.
 
-    user_data = user_db.authenticate_user(login_request.email, login_request.password)
+    user_data = await user_db.authenticate_user(login_request.email, login_request.password)
     # 디비에서 이메일 검색
     if user_data is None:
         raise HTTPException(status_code=403, detail="fail login")
@@ -78,9 +89,15 @@ async def login(login_request: LoginRequest, user_db: UserModelDep):
 
 # ================= 회원 정보 조회 ====================
 @router.get("/{user_id}/profile")
-async def get_profile(user_id: int, user_db: UserModelDep):
+async def get_profile(user_id: int, user_db: UserModelDep, response: Response, if_none_match: IfNoneMatch = None):
     try:
-        user_data = user_db.search_user_by_id(user_id)
+        user_data = await user_db.search_user_by_id(user_id)
+
+        if user_data is None:
+            raise HTTPException(
+                status_code=404,
+                detail="사용자를 찾을 수 없습니다."
+            )
     except HTTPException as he:
         raise he
     except Exception as e:
@@ -89,17 +106,90 @@ async def get_profile(user_id: int, user_db: UserModelDep):
             detail=str(e)
         )
 
+    etag = make_etag(user_data.user_id, user_data.version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
     return UserProfileResponse(
         image_url=user_data.user_profile_image_url,
         email=user_data.email,
         nickname=user_data.nickname
     )
 
+# ================ 작성한 게시글 목록 ==================
+@router.get("/{user_id}/posts")
+async def get_user_posts(
+        user_id: int,
+        user_db: UserModelDep,
+        post_db: PostModelDep,
+        view_counter: ViewCounterDep,
+        cursor: str | None = None,
+        limit: int = Query(AUTHOR_PAGE_SIZE, ge=1, le=AUTHOR_PAGE_MAX),
+        order: Literal["asc", "desc"] = "desc"
+    ):
+    # 작성자별 (posted_date, post_id) 인덱스를 커서 다음부터 읽는다 (기본은 최신순)
+    key = None
+    if cursor is not None:
+        try:
+            key, order = decode_author_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail="올바르지 않은 커서입니다."
+            )
+
+    try:
+        if await user_db.search_user_by_id(user_id) is None:
+            raise HTTPException(
+                status_code=404,
+                detail="사용자를 찾을 수 없습니다."
+            )
+
+        posts, has_more = await post_db.get_posts_by_poster(
+            user_id, key, limit, descending=order == "desc", summary=True
+        )
+        next_page = (
+            encode_cursor([posts[-1].posted_date, posts[-1].post_id], order, "next")
+            if has_more and posts else None
+        )
+
+        for post in posts:
+            post.view += view_counter.pending_views(post.post_id)
+
+    except HTTPException as he:
+        raise he
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=str(e)
+        )
+
+    return AuthorPostListResponse(
+        message="get_user_posts_success",
+        data=[post_db.post_summary_2_summary_public(post) for post in posts],
+        next=next_page
+    )
+
+
+def decode_author_cursor(cursor: str) -> tuple[tuple[str, int], str]:
+    """
+    작성자별 목록 커서의 (posted_date, post_id)와 정렬
+
+    Raises:
+        ValueError: 커서가 올바르지 않을 때 (댓글 커서 등)
+    """
+    key, order, direction = decode_cursor(cursor)
+    if len(key) != 2 or type(key[0]) is not str or type(key[1]) is not int or direction != "next":
+        raise ValueError("invalid author cursor")
+    return tuple(key), order
+
 # ================ 회원 정보 수정 =====================
 @router.patch("/{user_id}/profile")
-async def edit_profile(user_id:int, edit_user_request: UserEditRequest, user_db: UserModelDep):
+async def edit_profile(user_id:int, edit_user_request: UserEditRequest, user_db: UserModelDep, post_db: PostModelDep, post_cache: PostCacheDep):
     try:
-        user = user_db.search_user_by_id(user_id)
+        user = await user_db.search_user_by_id(user_id)
 
         if user is None:
             raise HTTPException(
@@ -107,7 +197,7 @@ async def edit_profile(user_id:int, edit_user_request: UserEditRequest, user_db:
                 detail="사용자를 찾을 수 없습니다."
             )
         
-        same_nickname_user = user_db.search_user_by_nickname(edit_user_request.nickname)
+        same_nickname_user = await user_db.search_user_by_nickname(edit_user_request.nickname)
 
         if same_nickname_user:
             raise HTTPException(
@@ -115,8 +205,20 @@ async def edit_profile(user_id:int, edit_user_request: UserEditRequest, user_db:
                 detail="중복되는 닉네임입니다."
             )
         
-        user.nickname = edit_user_request.nickname
-        user.user_profile_image_url = edit_user_request.image_url
+        await user_db.update_user_profile(
+            user_id=user_id,
+            nickname=edit_user_request.nickname,
+            user_profile_image_url=(
+                edit_user_request.image_url
+                if edit_user_request.image_url is not None
+                else user.user_profile_image_url
+            )
+        )
+        # 목록 요약에 저장된 작성자 닉네임을 바꾸고
+        # 작성자/댓글 작성자로 닉네임과 이미지가 들어간 게시글 응답을 지운다
+        if edit_user_request.nickname != user.nickname:
+            await post_db.update_poster_nickname(user_id, edit_user_request.nickname)
+        post_cache.invalidate_user(user_id)
     
     except HTTPException as he:
         raise he
@@ -135,7 +237,7 @@ async def edit_profile(user_id:int, edit_user_request: UserEditRequest, user_db:
 @router.patch("/{user_id}/password")
 async def change_passwd(user_id: int, password_change_request: PasswordChangeRequest, user_db: UserModelDep):
     try:
-        user = user_db.search_user_by_id(user_id)
+        user = await user_db.search_user_by_id(user_id)
 
         if user is None:
             raise HTTPException(
@@ -143,7 +245,7 @@ async def change_passwd(user_id: int, password_change_request: PasswordChangeReq
                 detail="사용자를 찾을 수 없습니다."
             )
         
-        user.password = password_change_request.password
+        await user_db.update_password(user_id, password_change_request.password)
     
     except HTTPException as he:
         raise he
@@ -160,9 +262,9 @@ async def change_passwd(user_id: int, password_change_request: PasswordChangeReq
 
 # ================ 회원탈퇴 =========================
 @router.delete("/{user_id}")
-async def delete_user(user_id: int, user_db: UserModelDep):
+async def delete_user(user_id: int, user_db: UserModelDep, post_db: PostModelDep, post_cache: PostCacheDep):
     try:
-        user = user_db.search_user_by_id(user_id)
+        user = await user_db.search_user_by_id(user_id)
 
         if user is None:
             raise HTTPException(
@@ -170,11 +272,14 @@ async def delete_user(user_id: int, user_db: UserModelDep):
                 detail="사용자를 찾을 수 없습니다."
             )
         
-        if not user_db.delete_user_by_user_id(user_id):
+        if not await user_db.delete_user_by_user_id(user_id):
             raise HTTPException(
                 status_code=400,
                 detail="사용자를 삭제할 수 없습니다."
             )
+        # 게시글/댓글/좋아요는 남기고, 목록 요약에 저장된 작성자 닉네임만 가린다
+        await post_db.update_poster_nickname(user_id, DELETED_USER_NICKNAME)
+        post_cache.invalidate_user(user_id)
     
     except HTTPException as he:
         raise he
@@ -0,0 +1,32 @@
+import base64
+import binascii
+import json
+
+
+# ================ 페이지 커서 ========================
+# 클라이언트에는 내용을 알 수 없는(opaque) 문자열로 주고,
+# 서버는 다음 페이지를 찾을 위치(정렬 키)와 정렬/방향을 담아둔다.
+#   {"key": [...], "order": "asc" | "desc", "dir": "next" | "prev"}
+
+def encode_cursor(key: list, order: str, direction: str) -> str:
+    payload = json.dumps({"key": key, "order": order, "dir": direction}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[list, str, str]:
+    """
+    encode_cursor로 만든 커서를 (key, order, direction)으로 되돌린다
+
+    Raises:
+        ValueError: 커서가 올바르지 않을 때
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        key, order, direction = payload["key"], payload["order"], payload["dir"]
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as e:
+        raise ValueError("invalid cursor") from e
+
+    if not isinstance(key, list) or order not in ("asc", "desc") or direction not in ("next", "prev"):
+        raise ValueError("invalid cursor")
+    return key, order, direction
@@ -0,0 +1,45 @@
+import hashlib
+from typing import Annotated
+
+from fastapi import Header, Response
+
+
+# ================ 조건부 GET (ETag) ========================
+# 저장소의 각 항목(사용자, 포스터, 댓글)은 수정될 때마다 version이 1씩 올라간다.
+# 응답을 만드는 데 쓴 항목들의 (id, version)으로 강한(strong) ETag를 만들고,
+# 클라이언트가 보낸 If-None-Match와 같으면 본문을 만들지 않고 304를 돌려준다.
+
+# 라우터에서 If-None-Match 헤더를 받는 파라미터 타입
+IfNoneMatch = Annotated[str | None, Header()]
+
+
+def make_etag(*parts) -> str:
+    """
+    응답을 만든 항목들의 (id, version) 등으로 ETag를 만든다
+
+    Args:
+        parts: 응답이 바뀌면 함께 바뀌는 값들 (repr이 안정적인 int/str/tuple)
+
+    Returns:
+        str: 따옴표로 감싼 ETag (예: "3f2a...")
+    """
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    If-None-Match 헤더에 etag가 들어있는지 (RFC 9110의 약한 비교, "*"는 항상 일치)
+    """
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
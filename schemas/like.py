@@ -10,4 +10,9 @@ class UnlikePostRequest(BaseModel):
     user_id: int = Field(...)
 
 class UnlikePostResponse(BaseModel):
-    message: str = Field(...)
\ No newline at end of file
+    message: str = Field(...)
+
+class LikeListResponse(BaseModel):
+    message: str = Field(...)
+    user_id: list[int] = Field(...)
+    count: int = Field(...)
@@ -1,7 +1,7 @@
 from pydantic import BaseModel, Field
 
 from model.comment_model import CommentPublic
-from model.post_model import PostData
+from model.post_model import PostPublic, PostSummaryPublic
 
 class UplaodPostRequest(BaseModel):
     title: str = Field(...)
@@ -23,12 +23,58 @@ class PostResponse(BaseModel):
     poster_nickname: str
     like: int
     view: int
+    # 댓글은 첫 페이지만 담고, 나머지는 GET /posts/{post_id}/comments로 comment_next부터 읽는다
     comment: list[CommentPublic]
+    comment_count: int = 0
+    comment_next: str | None = None
 
 class PostListResponse(BaseModel):
     message: str = Field(...)
-    data: list[PostData] = Field(...)
-    next: int = Field(...)
+    # fields=summary(기본)면 목록 요약, fields=full이면 본문까지 담은 포스터
+    data: list[PostSummaryPublic] | list[PostPublic] = Field(...)
+    # 커서 방식: 다음/이전 페이지 커서 (없으면 None)
+    # offset 방식(호환용): 다음 offset (마지막 페이지면 -1)
+    next: str | int | None = Field(...)
+    prev: str | None = None
+
+class PostSearchResponse(BaseModel):
+    message: str = Field(...)
+    # 관련도(BM25) 높은 순
+    data: list[PostSummaryPublic] = Field(...)
+
+class AuthorPostListResponse(BaseModel):
+    message: str = Field(...)
+    data: list[PostSummaryPublic] = Field(...)
+    # 다음 페이지 커서 (마지막 페이지면 None)
+    next: str | None = Field(...)
+
+class CommentListResponse(BaseModel):
+    message: str = Field(...)
+    data: list[CommentPublic] = Field(...)
+    # 다음 페이지 커서 (마지막 페이지면 None)
+    next: str | None = Field(...)
+
+
+# 한 번에 조회할 수 있는 최대 게시글 수
+BATCH_GET_MAX = 100
+
+class BatchGetPostsRequest(BaseModel):
+    # 요청 순서대로 결과를 돌려준다 (같은 id가 여러 번 있어도 됨)
+    post_ids: list[int] = Field(..., min_length=1, max_length=BATCH_GET_MAX)
+
+class PostWithAuthor(PostPublic):
+    poster_nickname: str
+    poster_image: str
+
+class BatchPostResult(BaseModel):
+    post_id: int
+    # 없거나 삭제된 게시글이면 False이고 post는 None
+    found: bool
+    post: PostWithAuthor | None = None
+
+class BatchGetPostsResponse(BaseModel):
+    message: str = Field(...)
+    data: list[BatchPostResult] = Field(...)
 
 
 class DeletePostRequest(BaseModel):
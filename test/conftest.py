@@ -0,0 +1,40 @@
+import pytest
+
+from model.user_model import UserModel
+from model.post_model import PostModel
+from model.sharded_post_model import ShardedPostModel
+from model.comment_model import CommentModel
+from model.like_model import LikeModel
+from model.sqlite_model import (
+    SqlitePool,
+    SqliteUserModel,
+    SqlitePostModel,
+    SqliteCommentModel,
+    SqliteLikeModel,
+    seed_dummy_data
+)
+
+
+@pytest.fixture(params=["memory", "sharded", "sqlite"])
+def models(request, tmp_path):
+    """
+    저장소 구현별(메모리 / 샤드 메모리 / SQLite) 모델 네 개 (user_db, post_db, comment_db, like_db)
+
+    SQLite는 임시 파일에 더미 데이터를 넣어서 메모리 모델과 같은 상태로 시작한다
+    """
+    if request.param == "sqlite":
+        pool = SqlitePool(str(tmp_path / "test.db"), size=2)
+        seed_dummy_data(pool)
+        yield {
+            "user_db": SqliteUserModel(pool), "post_db": SqlitePostModel(pool),
+            "comment_db": SqliteCommentModel(pool), "like_db": SqliteLikeModel(pool)
+        }
+        pool.close()
+    else:
+        post_db = ShardedPostModel(shard_count=3) if request.param == "sharded" else PostModel()
+        yield {"user_db": UserModel(), "post_db": post_db, "comment_db": CommentModel(), "like_db": LikeModel()}
+
+
+@pytest.fixture
+def post_db(models):
+    return models["post_db"]
@@ -0,0 +1,48 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from model.async_storage import InMemoryAdapter, ThreadPoolAdapter
+from model.user_model import UserModel
+
+
+class ThreadRecordingUserModel(UserModel):
+    def search_user_by_id(self, user_id: int):
+        self.thread = threading.current_thread()
+        return super().search_user_by_id(user_id)
+
+
+class TestAsyncStorage:
+    """비동기 저장소 어댑터 테스트"""
+
+    def test_in_memory_adapter_runs_on_loop(self):
+        """메모리 어댑터는 이벤트 루프 스레드에서 바로 실행된다"""
+        model = ThreadRecordingUserModel()
+        storage = InMemoryAdapter(model)
+
+        user = asyncio.run(storage.search_user_by_id(0))
+
+        assert user.nickname == "test"
+        assert model.thread is threading.main_thread()
+
+
+    def test_thread_pool_adapter_runs_off_loop(self):
+        """스레드 풀 어댑터는 풀의 스레드에서 실행된다"""
+        model = ThreadRecordingUserModel()
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="storage") as executor:
+            storage = ThreadPoolAdapter(model, executor)
+
+            user = asyncio.run(storage.search_user_by_id(1))
+
+        assert user.nickname == "user"
+        assert model.thread.name.startswith("storage")
+
+
+    def test_public_conversion_stays_sync(self):
+        """*_2_*_public 변환 함수는 await 없이 호출한다"""
+        model = UserModel()
+        storage = InMemoryAdapter(model)
+
+        public = storage.user_data_2_user_public(model.search_user_by_id(0))
+
+        assert public.email == "test@example.com"
@@ -0,0 +1,101 @@
+from fastapi.testclient import TestClient
+
+from main import app
+from model.user_model import DELETED_USER_NICKNAME
+from schemas.cursor import encode_cursor
+
+
+client = TestClient(app)
+
+
+class TestPostsByPoster:
+    """작성자별 인덱스 테스트"""
+
+    def test_pages_one_author(self, post_db):
+        """한 작성자의 포스터만 (posted_date, post_id) 순서로 나눠 읽는다"""
+        expected = sorted(
+            (post.posted_date, post.post_id)
+            for post in post_db.get_posts(0, 100)[0]
+            if post.poster_id == 1
+        )
+        new_post_id = post_db.add_post("내 글", "본문", poster_id=1, image_url=[], poster_nickname="user")
+        expected.insert(0, ("2000-10-11", new_post_id))
+
+        seen, key, has_more = [], None, True
+        while has_more:
+            posts, has_more = post_db.get_posts_by_poster(1, key, 2, summary=True)
+            seen += posts
+            key = (posts[-1].posted_date, posts[-1].post_id)
+
+        assert [(post.posted_date, post.post_id) for post in seen] == expected
+        assert {post.poster_id for post in seen} == {1}
+
+        posts, _ = post_db.get_posts_by_poster(1, None, 1, descending=True)
+        assert posts[0].post_id == expected[-1][1]
+        assert post_db.get_posts_by_poster(12345, None, 10) == ([], False)
+
+
+class TestUserPostsAPI:
+    """GET /users/{user_id}/posts 테스트"""
+
+    def signup(self, email: str, nickname: str) -> int:
+        return client.post("/users/signup", json={
+            "email": email, "password": "Author1234!", "nickname": nickname
+        }).json()["user_id"]
+
+
+    def test_lists_author_posts_with_cursor(self):
+        """작성한 게시글만 최신순으로 커서를 따라 읽는다"""
+        user_id = self.signup("author@example.com", "author")
+        post_ids = [
+            client.post("/posts", json={
+                "title": f"작성자 글 {i}", "content": "본문", "image_url": [], "poster_id": user_id
+            }).json()["new_post_id"]
+            for i in range(5)
+        ]
+
+        seen = []
+        params = {"limit": 2}
+        while True:
+            body = client.get(f"/users/{user_id}/posts", params=params).json()
+            seen += body["data"]
+            if body["next"] is None:
+                break
+            params = {"limit": 2, "cursor": body["next"]}
+
+        assert [post["post_id"] for post in seen] == post_ids[::-1]
+        assert all(post["poster_nickname"] == "author" for post in seen)
+
+
+    def test_delete_user_keeps_posts(self):
+        """탈퇴해도 게시글/댓글은 남고 작성자만 가려지며, 댓글 수와 댓글 목록이 맞는다"""
+        user_id = self.signup("leaver@example.com", "leaver")
+        post_id = client.post("/posts", json={
+            "title": "떠나는 글", "content": "본문", "image_url": [], "poster_id": user_id
+        }).json()["new_post_id"]
+        client.post(f"/posts/{post_id}/comment", json={"user_id": user_id, "comment": "남기는 댓글"})
+        client.post(f"/posts/{post_id}/comment", json={"user_id": 1, "comment": "답글"})
+        etag = client.get(f"/posts/{post_id}").headers["etag"]
+
+        assert client.delete(f"/users/{user_id}").status_code == 200
+
+        assert client.get(f"/users/{user_id}/posts").status_code == 404
+        response = client.get(f"/posts/{post_id}", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        body = response.json()
+        assert body["poster_nickname"] == DELETED_USER_NICKNAME
+        assert [comment["commenter_nickname"] for comment in body["comment"]] == [DELETED_USER_NICKNAME, "user"]
+        assert body["comment_count"] == len(body["comment"]) == 2
+
+        posts = client.get("/posts", params={"offset": 0, "limit": 100}).json()["data"]
+        assert [post["poster_nickname"] for post in posts if post["post_id"] == post_id] == [DELETED_USER_NICKNAME]
+        batch = client.post("/posts:batchGet", json={"post_ids": [post_id]}).json()["data"][0]
+        assert batch["found"] and batch["post"]["poster_nickname"] == DELETED_USER_NICKNAME
+
+
+    def test_invalid_cursor(self):
+        """다른 목록의 커서나 잘못된 커서는 400"""
+        assert client.get("/users/0/posts", params={"cursor": "nope"}).status_code == 400
+        for key in ([5], ["likes", 1, 2]):
+            cursor = encode_cursor(key, "desc", "next")
+            assert client.get("/users/0/posts", params={"cursor": cursor}).status_code == 400
@@ -0,0 +1,51 @@
+from fastapi.testclient import TestClient
+
+from main import app
+from schemas.post import BATCH_GET_MAX
+
+
+client = TestClient(app)
+
+
+class TestGetPostsByIds:
+    """여러 포스터 한 번에 조회 테스트"""
+
+    def test_returns_existing_posts_once(self, post_db):
+        """중복 id는 한 번만, 없는 id와 삭제된 id는 빠진다"""
+        post_db.delete_post_by_id(4)
+
+        posts = post_db.get_posts_by_ids([1, 5, 1, 4, 12345])
+
+        assert sorted(posts) == [1, 5]
+        assert posts[5] == post_db.get_post_by_id(5)
+        assert post_db.get_posts_by_ids([]) == {}
+
+
+class TestBatchGetAPI:
+    """POST /posts:batchGet 테스트"""
+
+    def test_request_order_and_not_found(self):
+        """요청 순서대로, 없는 게시글은 found=False로 돌려준다"""
+        response = client.post("/posts:batchGet", json={"post_ids": [7, 12345, 2, 7]})
+        assert response.status_code == 200
+
+        data = response.json()["data"]
+        assert [item["post_id"] for item in data] == [7, 12345, 2, 7]
+        assert [item["found"] for item in data] == [True, False, True, True]
+        assert data[1]["post"] is None
+
+        detail = client.get("/posts/2").json()
+        post = client.post("/posts:batchGet", json={"post_ids": [2]}).json()["data"][0]["post"]
+        assert (post["title"], post["poster_nickname"], post["poster_image"]) == (
+            detail["title"], detail["poster_nickname"], detail["poster_image"]
+        )
+        # 여러 개 보기는 조회수를 올리지 않는다
+        assert post["view"] == detail["view"]
+
+
+    def test_request_size_limits(self):
+        """id가 없거나 BATCH_GET_MAX개를 넘으면 422"""
+        assert client.post("/posts:batchGet", json={"post_ids": []}).status_code == 422
+        too_many = list(range(BATCH_GET_MAX + 1))
+        assert client.post("/posts:batchGet", json={"post_ids": too_many}).status_code == 422
+        assert client.post("/posts:batchGet", json={"post_ids": too_many[:-1]}).status_code == 200
@@ -0,0 +1,105 @@
+from model.binary_snapshot import write_binary_snapshot, read_binary_snapshot, LazyStrings
+from model.journal import Journal
+from model.user_model import UserModel
+from model.post_model import PostModel
+from model.comment_model import CommentModel
+from model.like_model import LikeModel
+
+
+def make_models() -> dict:
+    return {"user": UserModel(), "post": PostModel(), "comment": CommentModel(), "like": LikeModel()}
+
+
+class TestBinarySnapshot:
+    """바이너리 스냅샷 테스트"""
+
+    def test_round_trip(self, tmp_path):
+        """바이너리 스냅샷으로 저장하고 읽으면 모든 모델 상태가 같다"""
+        models = make_models()
+        models["post"].edit_post(3, "수정된 제목", "본문", ["a.jpg", "b.jpg"])
+        models["post"].delete_post_by_id(1)
+        path = str(tmp_path / "snapshot")
+        states = {name: model.dump_state() for name, model in models.items()}
+        write_binary_snapshot(path, {"seq": 7, "models": states})
+
+        snapshot = read_binary_snapshot(path)
+        restored = make_models()
+        for name, model in restored.items():
+            model.load_state(snapshot["models"][name])
+
+        assert snapshot["seq"] == 7
+        for name, model in restored.items():
+            assert model.dump_state() == states[name]
+
+
+    def test_post_columns_stay_lazy(self, tmp_path):
+        """포스터 문자열 열은 지연 디코딩 열로 올라오고, 수정/추가가 가능하다"""
+        path = str(tmp_path / "snapshot")
+        write_binary_snapshot(path, {"seq": 0, "models": {"post": PostModel().dump_state()}})
+
+        post_db = PostModel()
+        post_db.load_state(read_binary_snapshot(path)["models"]["post"])
+
+        assert isinstance(post_db.columns.title, LazyStrings)
+        assert post_db.columns.title.overlay == {}
+        assert post_db.get_post_by_id(0).image_url[0] == "https://example.com/images/fastapi1.jpg"
+
+        assert post_db.edit_post(0, "new", "body", [])
+        assert post_db.update_like(0, 1) == 16
+        new_id = post_db.add_post("added", "content", poster_id=1)
+        assert post_db.get_post_by_id(0).title == "new"
+        assert post_db.get_post_by_id(new_id).title == "added"
+
+
+    def test_date_order_skips_decoding(self, monkeypatch, tmp_path):
+        """정렬 인덱스는 스냅샷의 정수 배열로 올라와서, 첫 커서 페이지가 작성일을 모두 디코딩하지 않는다"""
+        source = PostModel()
+        for i in range(200):
+            source.add_post(f"글 {i}", "본문", poster_id=i % 4)
+        source.delete_post_by_id(5)
+        path = str(tmp_path / "snapshot")
+        write_binary_snapshot(path, {"seq": 0, "models": {"post": source.dump_state()}})
+
+        post_db = PostModel()
+        post_db.load_state(read_binary_snapshot(path)["models"]["post"])
+
+        decoded = []
+        lazy_getitem = LazyStrings.__getitem__
+        monkeypatch.setattr(LazyStrings, "__getitem__", lambda self, row: decoded.append(row) or lazy_getitem(self, row))
+        posts, has_more = post_db.get_posts_after(None, 3, summary=True)
+        assert has_more and len(decoded) < 50
+
+        # 커서 이동, 작성, 삭제 뒤에도 다시 만든 인덱스와 같은 순서
+        key = (posts[-1].posted_date, posts[-1].post_id)
+        assert [post.post_id for post in post_db.get_posts_after(key, 2)[0]] == [
+            post.post_id for post in source.get_posts_after(key, 2)[0]
+        ]
+        post_db.add_post("new", "body", poster_id=1)
+        post_db.delete_post_by_id(0)
+        order = list(post_db.sorted_keys())
+        post_db.date_index = None
+        assert list(post_db.sorted_keys()) == order
+
+
+    def test_journal_with_binary_snapshot(self, tmp_path):
+        """저널이 바이너리 스냅샷 + 로그 꼬리로 복구하고, 모델은 처음 접근할 때 올라온다"""
+        def open_journal():
+            return Journal(
+                str(tmp_path), make_models(), snapshot_interval=3600,
+                write_snapshot=write_binary_snapshot, read_snapshot=read_binary_snapshot
+            )
+
+        journal = open_journal()
+        journal.proxies["post"].add_post("before", "snapshot", poster_id=0)
+        journal.snapshot()
+        after_id = journal.proxies["post"].add_post("after", "snapshot", poster_id=0)
+        journal.proxies["user"].add_user("new@example.com", "New1234!", "newbie", "http")
+        journal.close()
+
+        recovered = open_journal()
+        assert recovered.loaded == set()
+        posts, _ = recovered.proxies["post"].get_posts(0, 100)
+        assert [post.title for post in posts][-2:] == ["before", "after"]
+        assert recovered.loaded == {"post"}
+        assert recovered.proxies["user"].search_user_by_nickname("newbie") is not None
+        assert recovered.proxies["post"].next_post_id == after_id + 1
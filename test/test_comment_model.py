@@ -0,0 +1,53 @@
+from model.comment_model import CommentModel
+from model.user_model import UserModel, DELETED_USER_NICKNAME
+
+
+class TestCommentModelIndex:
+    """CommentModel 포스터별 인덱스 테스트"""
+
+    def test_dummy_comments_indexed_by_post(self):
+        """더미 댓글이 포스터별로 작성 순서대로 묶인다"""
+        comment_db = CommentModel()
+
+        thread = comment_db.get_comments_by_post_id(0)
+
+        assert [comment.user_id for comment in thread] == [1, 3]
+        assert comment_db.get_comments_by_post_id(12345) == []
+
+
+    def test_delete_comment_updates_thread(self):
+        """삭제한 댓글은 id 조회와 포스터 댓글 목록에서 모두 빠진다"""
+        comment_db = CommentModel()
+        comment_id = comment_db.add_comment(8, 0, "2001", "first")
+
+        assert comment_db.delete_comment_by_comment_id(comment_id)
+        assert comment_db.get_comment_by_comment_id(comment_id) is None
+        assert comment_db.get_comments_by_post_id(8) == []
+        assert not comment_db.delete_comment_by_comment_id(comment_id)
+
+
+    def test_comment_id_not_reused_after_delete(self):
+        """삭제 후 추가한 댓글은 새로운 id를 받는다"""
+        comment_db = CommentModel()
+        last_id = comment_db.add_comment(1, 0, "2001", "a")
+        comment_db.delete_comment_by_comment_id(0)
+
+        new_id = comment_db.add_comment(1, 0, "2001", "b")
+
+        assert new_id == last_id + 1
+        assert [comment.comment for comment in comment_db.get_comments_by_post_id(1)][-2:] == ["a", "b"]
+
+
+    def test_comments_2_comment_public_masks_missing_commenter(self):
+        """작성자를 찾지 못한(탈퇴한) 댓글도 빼지 않고 DELETED_USER로 가려서 순서대로 변환한다"""
+        comment_db = CommentModel()
+        user_db = UserModel()
+        comment_db.add_comment(0, 2, "2001", "by admin")
+        thread = comment_db.get_comments_by_post_id(0)
+        user_db.delete_user_by_user_id(3)
+
+        public = comment_db.comments_2_comment_public(thread, user_db.get_users_by_ids(c.user_id for c in thread))
+
+        assert [(c.commenter_nickname, c.comment) for c in public] == [
+            ("user", thread[0].comment), (DELETED_USER_NICKNAME, thread[1].comment), ("admin", "by admin")
+        ]
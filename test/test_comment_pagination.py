@@ -0,0 +1,73 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from model.comment_model import CommentModel
+from model.sqlite_model import SqlitePool, SqliteCommentModel, seed_dummy_data
+
+
+client = TestClient(app)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def comment_db(request, tmp_path):
+    if request.param == "memory":
+        yield CommentModel()
+    else:
+        pool = SqlitePool(str(tmp_path / "test.db"), size=2)
+        seed_dummy_data(pool)
+        yield SqliteCommentModel(pool)
+        pool.close()
+
+
+class TestCommentsAfter:
+    """comment_id 커서 댓글 조회 테스트"""
+
+    def test_pages_and_count(self, comment_db):
+        """after 다음의 댓글을 limit개씩 읽고, 삭제한 댓글은 건너뛴다"""
+        comment_ids = [comment_db.add_comment(8, 0, "2001", str(i)) for i in range(5)]
+        comment_db.delete_comment_by_comment_id(comment_ids[2])
+
+        comments, has_more = comment_db.get_comments_after(8, None, 2)
+        assert [comment.comment for comment in comments] == ["0", "1"]
+        assert has_more
+
+        comments, has_more = comment_db.get_comments_after(8, comments[-1].comment_id, 2)
+        assert [comment.comment for comment in comments] == ["3", "4"]
+        assert not has_more
+
+        assert comment_db.count_comments_by_post_id(8) == 4
+        assert comment_db.get_comments_after(12345, None, 2) == ([], False)
+
+
+class TestCommentListAPI:
+    """GET /posts/{post_id}/comments 테스트"""
+
+    def test_detail_embeds_first_page(self):
+        """게시글 상세는 첫 페이지와 전체 개수만 담고, comment_next부터 이어서 읽는다"""
+        for i in range(25):
+            client.post("/posts/3/comment", json={"user_id": 2, "comment": f"thread {i}"})
+
+        detail = client.get("/posts/3").json()
+        assert len(detail["comment"]) == 20
+        assert detail["comment_count"] == 26
+
+        rest = []
+        cursor = detail["comment_next"]
+        while cursor is not None:
+            body = client.get("/posts/3/comments", params={"cursor": cursor, "limit": 4}).json()
+            rest += body["data"]
+            cursor = body["next"]
+
+        comments = [comment["comment"] for comment in detail["comment"] + rest]
+        assert len(comments) == 26
+        assert comments[-1] == "thread 24"
+
+
+    def test_invalid_cursor_and_missing_post(self):
+        """게시글 목록 커서나 잘못된 커서는 400, 없는 게시글은 404"""
+        post_cursor = client.get("/posts", params={"limit": 1}).json()["next"]
+
+        assert client.get("/posts/3/comments", params={"cursor": post_cursor}).status_code == 400
+        assert client.get("/posts/3/comments", params={"cursor": "nope"}).status_code == 400
+        assert client.get("/posts/12345/comments").status_code == 404
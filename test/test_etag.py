@@ -0,0 +1,112 @@
+import sqlite3
+
+from fastapi.testclient import TestClient
+
+from main import app
+from model.sqlite_model import SqlitePool, SqliteUserModel
+from schemas.etag import etag_matches
+
+
+client = TestClient(app)
+
+
+class TestVersion:
+    """수정할 때 올라가는 version 테스트"""
+
+    def test_post_version_bumped_on_mutation(self, post_db):
+        """내용 수정과 좋아요는 version을 올리고 조회수는 올리지 않는다"""
+        assert post_db.get_post_by_id(1).version == 0
+
+        post_db.edit_post(1, "t", "c", [])
+        post_db.update_like(1, 1)
+        post_db.add_views([(1, 5)])
+
+        assert post_db.get_post_by_id(1).version == 2
+
+
+    def test_sqlite_adds_version_column(self, tmp_path):
+        """version 열이 없던 DB 파일도 열면 열이 추가된다"""
+        path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE users (user_id INTEGER PRIMARY KEY AUTOINCREMENT, email TEXT NOT NULL UNIQUE, "
+            "password TEXT NOT NULL, nickname TEXT NOT NULL UNIQUE, user_profile_image_url TEXT NOT NULL)"
+        )
+        conn.execute("INSERT INTO users VALUES (0, 'old@example.com', 'pw', 'old', 'http')")
+        conn.commit()
+        conn.close()
+
+        pool = SqlitePool(path, size=1)
+        user_db = SqliteUserModel(pool)
+        assert user_db.search_user_by_id(0).version == 0
+        user_db.update_password(0, "new")
+        assert user_db.search_user_by_id(0).version == 1
+        pool.close()
+
+
+class TestEtagMatches:
+    """If-None-Match 비교 테스트"""
+
+    def test_list_weak_and_star(self):
+        assert etag_matches('"a", "b"', '"b"')
+        assert etag_matches('W/"b"', '"b"')
+        assert etag_matches("*", '"b"')
+        assert not etag_matches('"a"', '"b"')
+        assert not etag_matches(None, '"b"')
+
+
+class TestConditionalGetAPI:
+    """ETag / If-None-Match 조건부 GET 테스트"""
+
+    def test_post_not_modified_skips_view(self):
+        """같은 ETag면 304이고 조회수도 올리지 않는다"""
+        first = client.get("/posts/8")
+        etag = first.headers["ETag"]
+
+        response = client.get("/posts/8", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+        # 304 사이에 조회수가 그대로라서 다음 요청의 조회수는 하나만 올라간다
+        assert client.get("/posts/8").json()["view"] == first.json()["view"] + 1
+
+
+    def test_post_etag_changes_on_comment_edit(self):
+        """댓글이 수정되면 ETag가 바뀌어서 새 응답을 받는다"""
+        comment_id = client.post("/posts/6/comment", json={"user_id": 1, "comment": "before"}).json()["comment_id"]
+        etag = client.get("/posts/6").headers["ETag"]
+        client.patch("/posts/6/comment", json={"user_id": 1, "comment_id": comment_id, "comment": "after"})
+
+        response = client.get("/posts/6", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert "after" in [comment["comment"] for comment in response.json()["comment"]]
+
+
+    def test_list_not_modified_until_change(self):
+        """목록의 포스터가 그대로면 304, 좋아요가 바뀌면 200"""
+        params = {"offset": 0, "limit": 3}
+        etag = client.get("/posts", params=params).headers["ETag"]
+        assert client.get("/posts", params=params, headers={"If-None-Match": etag}).status_code == 304
+
+        client.post("/posts/2/like", json={"user_id": 0})
+
+        response = client.get("/posts", params=params, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+
+    def test_profile_not_modified_until_edit(self):
+        """프로필이 그대로면 304, 수정하면 200"""
+        user_id = client.post("/users/signup", json={
+            "email": "etag@example.com", "password": "Etag1234!", "nickname": "etagger"
+        }).json()["user_id"]
+        etag = client.get(f"/users/{user_id}/profile").headers["ETag"]
+        assert client.get(f"/users/{user_id}/profile", headers={"If-None-Match": etag}).status_code == 304
+
+        client.patch(f"/users/{user_id}/profile", json={"nickname": "etagged"})
+
+        response = client.get(f"/users/{user_id}/profile", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["nickname"] == "etagged"
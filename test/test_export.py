@@ -0,0 +1,101 @@
+import asyncio
+import gzip
+import json
+
+from fastapi.testclient import TestClient
+
+import config
+from main import app
+from model.async_storage import InMemoryAdapter
+from model.export import export_ndjson
+
+
+client = TestClient(app)
+
+
+def read_export(models: dict, **kwargs) -> list[bytes]:
+    async def collect():
+        storages = {name: InMemoryAdapter(model) for name, model in models.items()}
+        return [chunk async for chunk in export_ndjson(**storages, **kwargs)]
+    return asyncio.run(collect())
+
+
+class TestScan:
+    """id 순서 묶음 조회 테스트"""
+
+    def test_scan_skips_deleted(self, models):
+        """삭제된 id는 건너뛰고 after 다음부터 limit개씩 읽는다"""
+        post_db, comment_db = models["post_db"], models["comment_db"]
+        post_db.delete_post_by_id(3)
+        comment_db.delete_comment_by_comment_id(1)
+
+        assert [post.post_id for post in post_db.scan_posts(None, 4)] == [0, 1, 2, 4]
+        assert [post.post_id for post in post_db.scan_posts(8, 4)] == [9]
+        assert [comment.comment_id for comment in comment_db.scan_comments(None, 2)] == [0, 2]
+        assert [user.user_id for user in models["user_db"].scan_users(2, 10)] == [3]
+
+
+    def test_likes_by_post_ids(self, models):
+        """요청한 포스터 순서대로 그 포스터의 좋아요를 돌려준다"""
+        likes = models["like_db"].get_likes_by_post_ids([9, 0, 4])
+        assert [(like.post_id, like.user_id) for like in likes] == [(9, 1), (9, 3), (0, 1), (0, 2)]
+
+
+class TestExportNdjson:
+    """NDJSON 내보내기 테스트"""
+
+    def test_every_entity_in_small_chunks(self, models):
+        """모든 엔티티를 한 줄에 하나씩, 묶음마다 한 덩어리로 내보내고 비밀번호는 뺀다"""
+        chunks = read_export(models, batch_size=3)
+        records = [json.loads(line) for line in b"".join(chunks).decode("utf-8").splitlines()]
+
+        counts = {}
+        for record in records:
+            counts[record["type"]] = counts.get(record["type"], 0) + 1
+        assert counts == {"user": 4, "post": 10, "comment": 10, "like": 10}
+        assert [record["type"] for record in records][:5] == ["user"] * 4 + ["post"]
+        assert all("password" not in record for record in records)
+
+        # 전체를 한 번에 만들지 않고 묶음마다 흘려보낸다 (좋아요는 포스터 3개 묶음마다)
+        assert len(chunks) > 10
+        assert max(chunk.count(b"\n") for chunk in chunks if b'"type": "like"' not in chunk) <= 3
+
+
+    def test_gzip_and_entity_filter(self, models):
+        """gzip으로 압축해도 같은 내용이고, 고른 엔티티만 내보낸다"""
+        plain = b"".join(read_export(models, entities=("posts", "likes")))
+        compressed = b"".join(read_export(models, entities=("posts", "likes"), compress=True))
+
+        assert gzip.decompress(compressed) == plain
+        types = {json.loads(line)["type"] for line in plain.splitlines()}
+        assert types == {"post", "like"}
+
+
+class TestExportAPI:
+    """GET /admin/export 테스트"""
+
+    def test_requires_admin_token(self, monkeypatch):
+        """토큰이 없거나 다르면 403, ADMIN_TOKEN을 비워두면 항상 403"""
+        monkeypatch.setattr(config, "ADMIN_TOKEN", "")
+        assert client.get("/admin/export", headers={"X-Admin-Token": ""}).status_code == 403
+
+        monkeypatch.setattr(config, "ADMIN_TOKEN", "secret")
+        assert client.get("/admin/export").status_code == 403
+        assert client.get("/admin/export", headers={"X-Admin-Token": "wrong"}).status_code == 403
+
+
+    def test_streams_ndjson_and_gzip(self, monkeypatch):
+        """NDJSON으로, gzip=true면 gzip 파일로 받는다"""
+        monkeypatch.setattr(config, "ADMIN_TOKEN", "secret")
+        headers = {"X-Admin-Token": "secret"}
+
+        response = client.get("/admin/export", headers=headers, params={"entities": ["users"]})
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        users = [json.loads(line) for line in response.text.splitlines()]
+        assert users and {user["type"] for user in users} == {"user"}
+
+        response = client.get("/admin/export", headers=headers, params={"gzip": "true"})
+        assert response.headers["content-type"] == "application/gzip"
+        types = {json.loads(line)["type"] for line in gzip.decompress(response.content).splitlines()}
+        assert types == {"user", "post", "comment", "like"}
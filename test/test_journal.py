@@ -0,0 +1,107 @@
+import os
+
+from model.journal import Journal
+from model.user_model import UserModel
+from model.post_model import PostModel
+from model.comment_model import CommentModel
+from model.like_model import LikeModel
+
+
+def open_journal(directory) -> Journal:
+    models = {"user": UserModel(), "post": PostModel(), "comment": CommentModel(), "like": LikeModel()}
+    # 테스트에서는 스냅샷 스레드가 끼어들지 않도록 주기를 길게 둔다
+    return Journal(str(directory), models, fsync_interval=0.01, snapshot_interval=3600)
+
+
+def mutate(journal: Journal) -> int:
+    users = journal.proxies["user"]
+    posts = journal.proxies["post"]
+    comments = journal.proxies["comment"]
+    likes = journal.proxies["like"]
+
+    user_id = users.add_user("new@example.com", "New1234!", "newbie", "http")
+    users.update_user_profile(user_id, "renamed", "http://img")
+    post_id = posts.add_post("title", "content", poster_id=user_id, image_url=["a.jpg"])
+    posts.update_like(post_id, 1)
+    posts.increase_view(post_id)
+    posts.add_views([(post_id, 2), (12345, 5)])
+    posts.delete_post_by_id(0)
+    comments.add_comment(post_id, user_id, "2001", "hello")
+    likes.add_like(post_id, user_id)
+    return post_id
+
+
+def assert_recovered(journal: Journal, post_id: int) -> None:
+    users = journal.proxies["user"]
+    posts = journal.proxies["post"]
+
+    assert users.search_user_by_nickname("renamed").user_profile_image_url == "http://img"
+    post = posts.get_post_by_id(post_id)
+    assert (post.like, post.view, post.image_url) == (1, 3, ["a.jpg"])
+    assert posts.get_post_by_id(0) is None
+    assert journal.proxies["comment"].get_comments_by_post_id(post_id)[0].comment == "hello"
+    assert journal.proxies["like"].has_liked(post_id, users.search_user_by_nickname("renamed").user_id)
+    # 복구 후 새로 받는 id가 기존 id와 겹치지 않는다
+    assert posts.next_post_id == post_id + 1
+
+
+class TestJournal:
+    """작업 로그 / 스냅샷 복구 테스트"""
+
+    def test_replay_log(self, tmp_path):
+        """스냅샷 없이 로그만으로 복구"""
+        journal = open_journal(tmp_path)
+        post_id = mutate(journal)
+        journal.close()
+
+        assert_recovered(open_journal(tmp_path), post_id)
+
+
+    def test_snapshot_plus_tail(self, tmp_path):
+        """스냅샷 + 이후 로그로 복구하고, 스냅샷 이전 로그는 지워진다"""
+        journal = open_journal(tmp_path)
+        journal.proxies["user"].add_user("first@example.com", "New1234!", "first", "http")
+        journal.snapshot()
+        post_id = mutate(journal)
+        journal.close()
+
+        assert not os.path.exists(tmp_path / "oplog.old")
+        recovered = open_journal(tmp_path)
+        assert recovered.proxies["user"].search_user_by_nickname("first") is not None
+        assert_recovered(recovered, post_id)
+
+
+    def test_failed_mutation_not_logged(self, tmp_path):
+        """실패한 변경은 기록하지 않는다"""
+        journal = open_journal(tmp_path)
+        assert not journal.proxies["like"].add_like(0, 1)
+        assert journal.proxies["post"].update_like(12345, 1) is None
+        journal.close()
+
+        assert open_journal(tmp_path).seq == 0
+
+
+    def test_torn_tail_ignored(self, tmp_path):
+        """쓰다가 잘린 마지막 로그 줄은 무시한다"""
+        journal = open_journal(tmp_path)
+        post_id = mutate(journal)
+        journal.close()
+        with open(tmp_path / "oplog", "a", encoding="utf-8") as f:
+            f.write('{"seq": 99, "model": "po')
+
+        assert_recovered(open_journal(tmp_path), post_id)
+
+
+    def test_interrupted_snapshot(self, tmp_path):
+        """스냅샷을 쓰다 죽어서 이전 로그가 남아 있어도 복구된다"""
+        journal = open_journal(tmp_path)
+        post_id = mutate(journal)
+        journal.close()
+        os.replace(tmp_path / "oplog", tmp_path / "oplog.old")
+
+        recovered = open_journal(tmp_path)
+        assert_recovered(recovered, post_id)
+        recovered.snapshot()
+        recovered.close()
+
+        assert_recovered(open_journal(tmp_path), post_id)
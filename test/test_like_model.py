@@ -0,0 +1,169 @@
+import asyncio
+import threading
+
+from fastapi.testclient import TestClient
+
+from main import app
+from model.async_storage import InMemoryAdapter
+from model.like_model import LikeModel
+from model.like_service import LikeService, reconcile_once
+from model.post_cache import PostCache
+from model.post_model import PostModel
+from schemas.post import PostResponse
+
+
+client = TestClient(app)
+
+
+class TestLikeModelIndex:
+    """LikeModel 멤버십 / 인접 인덱스 테스트"""
+
+    def test_duplicate_like_rejected(self):
+        """같은 사용자의 중복 좋아요는 거부된다"""
+        like_db = LikeModel()
+
+        assert like_db.add_like(4, 3)
+        assert not like_db.add_like(4, 3)
+        assert like_db.has_liked(4, 3)
+
+
+    def test_indexes_follow_add_and_delete(self):
+        """좋아요 추가/취소가 포스터별, 사용자별 인덱스에 반영된다"""
+        like_db = LikeModel()
+        like_db.add_like(4, 3)
+
+        assert like_db.get_likers_by_post_id(4) == [3]
+        assert 4 in like_db.get_liked_post_ids_by_user_id(3)
+
+        assert like_db.delete_like(4, 3)
+        assert not like_db.has_liked(4, 3)
+        assert like_db.get_likers_by_post_id(4) == []
+        assert 4 not in like_db.get_liked_post_ids_by_user_id(3)
+        assert not like_db.delete_like(4, 3)
+
+
+    def test_dummy_likes(self):
+        """더미 좋아요가 누른 순서대로 조회된다"""
+        like_db = LikeModel()
+
+        assert like_db.get_likers_by_post_id(0) == [1, 2]
+        assert like_db.get_liked_post_ids_by_user_id(0) == [1, 5, 3]
+        assert like_db.count_likes_by_post_id(9) == 2
+
+
+class TestLikeService:
+    """좋아요 멤버십과 좋아요 수를 함께 바꾸는 서비스 테스트"""
+
+    def test_like_and_unlike_update_counter(self):
+        """좋아요/취소가 멤버십과 좋아요 수를 함께 바꾸고, 실패하면 둘 다 그대로다"""
+        post_db = PostModel()
+        like_service = LikeService(post_db, LikeModel())
+
+        assert like_service.like(4, 3) == 64
+        assert like_service.like(4, 3) is None
+        assert like_service.unlike(4, 3) == 63
+        assert like_service.unlike(4, 3) is None
+        assert post_db.get_post_by_id(4).like == 63
+
+
+    def test_like_on_deleted_post_is_rolled_back(self):
+        """없는 포스터에 누른 좋아요는 멤버십에 남지 않는다"""
+        like_db = LikeModel()
+        like_service = LikeService(PostModel(), like_db)
+
+        assert like_service.like(12345, 3) is None
+        assert not like_db.has_liked(12345, 3)
+
+
+    def test_reconcile_reports_and_fixes_drift(self):
+        """정합성 검사가 더미 데이터의 어긋난 좋아요 수를 멤버십 기준으로 고치고 보고한다"""
+        post_db = PostModel()
+        like_db = LikeModel()
+        like_service = LikeService(post_db, like_db)
+
+        drift = like_service.reconcile()
+
+        assert drift[0] == (15, 2)
+        assert drift[4] == (63, 0)
+        assert post_db.get_like_counts() == {
+            post_id: like_db.count_likes_by_post_id(post_id) for post_id in range(10)
+        }
+        assert like_service.reconcile() == {}
+
+
+    def test_reconcile_invalidates_cached_posts(self):
+        """정합성 검사로 좋아요 수를 고친 포스터만 캐시된 상세 응답을 지운다"""
+        post_db = PostModel()
+        like_service = LikeService(post_db, LikeModel())
+        new_post_id = post_db.add_post("좋아요 없음", "본문", poster_id=0)
+        post_cache = PostCache()
+        for post_id in (0, new_post_id):
+            _, generation = post_cache.get(post_id)
+            body = PostResponse(
+                message="success_get_post", title="t", content="c", image_url=[], posted_date="2024",
+                poster_image="http", poster_nickname="test", like=post_db.get_post_by_id(post_id).like, view=0, comment=[]
+            )
+            post_cache.put(post_id, generation, body, view=0, user_ids={0}, etag_key="")
+
+        drift = asyncio.run(reconcile_once(InMemoryAdapter(like_service), post_cache))
+
+        assert 0 in drift and new_post_id not in drift
+        assert post_cache.get(0)[0] is None
+        assert post_cache.get(new_post_id)[0] is not None
+
+
+    def test_concurrent_likes_do_not_drift(self):
+        """여러 스레드가 같은 포스터에 좋아요/취소를 섞어도 좋아요 수가 멤버십과 같다"""
+        post_db = PostModel()
+        like_db = LikeModel()
+        like_service = LikeService(post_db, like_db)
+        like_service.reconcile()
+
+        def worker(user_id: int):
+            for i in range(500):
+                if i % 2 == 0:
+                    like_service.like(7, user_id)
+                else:
+                    like_service.unlike(7, user_id % 4)
+
+        threads = [threading.Thread(target=worker, args=(user_id,)) for user_id in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert post_db.get_post_by_id(7).like == like_db.count_likes_by_post_id(7)
+        assert like_service.reconcile() == {}
+
+
+class TestLikeListAPI:
+    """좋아요 목록 API 테스트"""
+
+    def test_get_post_likes(self):
+        response = client.get("/posts/9/likes")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "message": "get_likes_success",
+            "user_id": [1, 3],
+            "count": 2
+        }
+
+
+    def test_get_post_likes_missing_post(self):
+        response = client.get("/posts/12345/likes")
+
+        assert response.status_code == 404
+
+
+    def test_like_api_updates_count(self):
+        """좋아요 API가 포스터의 좋아요 수를 함께 바꾼다"""
+        before = client.get("/posts/8").json()["like"]
+
+        response = client.post("/posts/8/like", json={"user_id": 2})
+        assert response.status_code == 200
+        assert client.post("/posts/8/like", json={"user_id": 2}).status_code == 400
+        assert client.get("/posts/8").json()["like"] == before + 1
+
+        assert client.request("DELETE", "/posts/8/like", json={"user_id": 2}).status_code == 200
+        assert client.get("/posts/8").json()["like"] == before
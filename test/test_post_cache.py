@@ -0,0 +1,128 @@
+from fastapi.testclient import TestClient
+
+from main import app
+from dependencies import get_post_cache
+from model.post_cache import PostCache
+from schemas.post import PostResponse
+
+
+client = TestClient(app)
+
+
+def make_response(title: str = "title", content: str = "content") -> PostResponse:
+    return PostResponse(
+        message="success_get_post",
+        title=title,
+        content=content,
+        image_url=[],
+        posted_date="2024",
+        poster_image="http",
+        poster_nickname="test",
+        like=0,
+        view=0,
+        comment=[]
+    )
+
+
+class TestPostCache:
+    """게시글 상세 응답 캐시 테스트"""
+
+    def test_lru_eviction_by_size(self):
+        """크기 합이 상한을 넘으면 가장 오래 안 쓴 응답부터 내보낸다"""
+        size = len(make_response().model_dump_json())
+        post_cache = PostCache(max_bytes=size * 2)
+
+        for post_id in range(2):
+            _, generation = post_cache.get(post_id)
+            post_cache.put(post_id, generation, make_response(), view=0, user_ids={0}, etag_key="")
+        post_cache.get(0)
+        _, generation = post_cache.get(2)
+        post_cache.put(2, generation, make_response(), view=0, user_ids={0}, etag_key="")
+
+        assert list(post_cache.entries) == [0, 2]
+        assert post_cache.total_bytes == size * 2
+        assert post_cache.posts_by_user == {0: {0, 2}}
+
+
+    def test_put_after_invalidation_is_dropped(self):
+        """응답을 만드는 사이에 무효화가 있었으면 낡은 응답을 담지 않는다"""
+        post_cache = PostCache()
+        _, generation = post_cache.get(1)
+        post_cache.invalidate(1)
+        post_cache.put(1, generation, make_response(), view=0, user_ids={0}, etag_key="")
+
+        assert post_cache.get(1)[0] is None
+
+
+    def test_invalidate_user(self):
+        """사용자가 들어간 응답만 지운다"""
+        post_cache = PostCache()
+        for post_id, user_ids in ((1, {0, 5}), (2, {1}), (3, {5})):
+            _, generation = post_cache.get(post_id)
+            post_cache.put(post_id, generation, make_response(), view=0, user_ids=user_ids, etag_key="")
+
+        post_cache.invalidate_user(5)
+
+        assert list(post_cache.entries) == [2]
+        assert 5 not in post_cache.posts_by_user and 0 not in post_cache.posts_by_user
+
+
+    def test_add_views_keeps_entry(self):
+        """반영된 조회수는 캐시를 지우지 않고 더한다"""
+        post_cache = PostCache()
+        _, generation = post_cache.get(1)
+        post_cache.put(1, generation, make_response(), view=10, user_ids={0}, etag_key="")
+
+        post_cache.add_views([(1, 3), (2, 1)])
+
+        assert post_cache.get(1)[0].view == 13
+
+
+class TestPostCacheAPI:
+    """게시글 상세 API 캐시 무효화 테스트"""
+
+    def test_hit_keeps_views_live(self):
+        """캐시된 응답도 조회수는 매번 올라간다"""
+        first = client.get("/posts/7").json()
+        hits = get_post_cache().hits
+        second = client.get("/posts/7").json()
+
+        assert get_post_cache().hits == hits + 1
+        assert second["view"] == first["view"] + 1
+        assert {**second, "view": first["view"]} == first
+
+
+    def test_edit_comment_and_like_invalidate(self):
+        """게시글 수정, 댓글 작성, 좋아요가 캐시된 응답에 바로 보인다"""
+        client.get("/posts/5")
+        client.patch("/posts/5", json={"user_id": 2, "title": "cached?", "content": "no", "image_url": []})
+        assert client.get("/posts/5").json()["title"] == "cached?"
+
+        comments = len(client.get("/posts/5").json()["comment"])
+        client.post("/posts/5/comment", json={"user_id": 1, "comment": "fresh"})
+        assert len(client.get("/posts/5").json()["comment"]) == comments + 1
+
+        like = client.get("/posts/5").json()["like"]
+        client.post("/posts/5/like", json={"user_id": 3})
+        assert client.get("/posts/5").json()["like"] == like + 1
+
+
+    def test_profile_edit_invalidates_commented_posts(self):
+        """댓글 작성자의 닉네임을 바꾸면 그 댓글이 있는 게시글 응답이 바뀐다"""
+        user_id = client.post("/users/signup", json={
+            "email": "cache@example.com", "password": "Cache1234!", "nickname": "cacher"
+        }).json()["user_id"]
+        client.post("/posts/4/comment", json={"user_id": user_id, "comment": "hi"})
+        assert "cacher" in [c["commenter_nickname"] for c in client.get("/posts/4").json()["comment"]]
+
+        client.patch(f"/users/{user_id}/profile", json={"nickname": "renamed"})
+
+        nicknames = [c["commenter_nickname"] for c in client.get("/posts/4").json()["comment"]]
+        assert "renamed" in nicknames and "cacher" not in nicknames
+
+
+    def test_missing_post_is_404(self):
+        """없는 게시글은 댓글/좋아요 목록처럼 404이고 캐시에 남지 않는다"""
+        for path in ("/posts/12345", "/posts/12345/comments", "/posts/12345/likes"):
+            assert client.get(path).status_code == 404
+        assert get_post_cache().get(12345)[0] is None
@@ -0,0 +1,144 @@
+import threading
+
+from model.post_model import PostModel
+from model.sharded_post_model import ShardedPostModel
+
+
+class TestPostModelStore:
+    """PostModel 저장소 테스트"""
+
+    def test_post_id_not_reused_after_delete(self):
+        """삭제 후 추가한 포스터는 살아있는 포스터와 id가 겹치지 않는다"""
+        post_db = PostModel()
+        first_id = post_db.add_post("a", "a", poster_id=0)
+        assert post_db.delete_post_by_id(first_id - 1)
+
+        new_id = post_db.add_post("b", "b", poster_id=0)
+
+        assert new_id != first_id
+        assert post_db.get_post_by_id(first_id).title == "a"
+        assert post_db.get_post_by_id(new_id).title == "b"
+
+
+    def test_delete_missing_post(self):
+        """없는 포스터 삭제는 실패한다"""
+        post_db = PostModel()
+
+        assert not post_db.delete_post_by_id(12345)
+
+
+    def test_edit_post(self):
+        """포스터 수정"""
+        post_db = PostModel()
+
+        assert post_db.edit_post(0, "new title", "new content", ["img"])
+        post = post_db.get_post_by_id(0)
+        assert (post.title, post.content, post.image_url) == ("new title", "new content", ["img"])
+        assert not post_db.edit_post(12345, "x", "x", [])
+
+
+    def test_get_posts_keeps_order(self):
+        """삭제가 있어도 목록은 작성 순서를 유지한다"""
+        post_db = PostModel()
+        post_db.delete_post_by_id(1)
+
+        posts, next_offset = post_db.get_posts(0, 3)
+
+        assert [post.post_id for post in posts] == [0, 2, 3]
+        assert next_offset == 3
+
+        posts, next_offset = post_db.get_posts(6, 20)
+        assert [post.post_id for post in posts] == [7, 8, 9]
+        assert next_offset == -1
+
+
+class TestPostColumns:
+    """PostModel 열 저장소 테스트"""
+
+    def test_counters_persist(self):
+        """좋아요/조회수 변경이 저장소에 반영된다"""
+        post_db = PostModel()
+
+        assert post_db.update_like(0, 1) == 16
+        assert post_db.update_like(0, -2) == 14
+        assert post_db.increase_view(0) == 235
+        post = post_db.get_post_by_id(0)
+        assert (post.like, post.view) == (14, 235)
+        assert post_db.update_like(12345, 1) is None
+        assert post_db.increase_view(12345) is None
+
+
+    def test_compaction_keeps_lookup(self):
+        """삭제가 많아 열을 압축해도 남은 포스터를 그대로 조회한다"""
+        post_db = PostModel()
+        for post_id in range(8):
+            post_db.delete_post_by_id(post_id)
+
+        assert len(post_db.columns.post_id) < 10
+        assert post_db.get_post_by_id(3) is None
+        assert post_db.get_post_by_id(9).title.startswith("성능 최적화 팁")
+        assert post_db.update_like(8, 1) == 35
+
+        posts, next_offset = post_db.get_posts(0, 20)
+        assert [post.post_id for post in posts] == [8, 9]
+        assert next_offset == -1
+
+
+class TestShardedPostModel:
+    """샤드 포스터 저장소 테스트"""
+
+    def test_same_results_as_post_model(self):
+        """샤드로 나눠도 조회/목록/삭제 결과는 PostModel과 같다"""
+        post_db = PostModel()
+        sharded_db = ShardedPostModel(shard_count=4)
+        for db in (post_db, sharded_db):
+            db.add_post("new", "new", poster_id=1)
+            db.delete_post_by_id(2)
+            db.update_like(5, 3)
+
+        for offset in range(0, 12, 5):
+            assert sharded_db.get_posts(offset, 5) == post_db.get_posts(offset, 5)
+        assert sharded_db.get_post_by_id(10) == post_db.get_post_by_id(10)
+        assert sharded_db.get_post_by_id(2) is None
+
+
+    def test_state_round_trip(self):
+        """dump_state / load_state 후에도 같은 포스터와 id 카운터를 가진다"""
+        sharded_db = ShardedPostModel(shard_count=4)
+        sharded_db.delete_post_by_id(0)
+        sharded_db.edit_post(3, "edited", "edited", [])
+
+        restored = ShardedPostModel(shard_count=3)
+        restored.load_state(sharded_db.dump_state())
+
+        assert restored.get_posts(0, 20) == sharded_db.get_posts(0, 20)
+        assert restored.add_post("x", "x", poster_id=0) == sharded_db.next_post_id
+
+
+    def test_concurrent_writers_lose_no_updates(self):
+        """여러 스레드가 동시에 좋아요/조회수/작성을 해도 변경이 사라지지 않는다"""
+        sharded_db = ShardedPostModel(shard_count=4)
+        before = {post.post_id: (post.like, post.view) for post in sharded_db.get_posts(0, 10)[0]}
+        new_ids = []
+
+        def writer(thread: int):
+            for i in range(2000):
+                post_id = (thread + i) % 10
+                sharded_db.update_like(post_id, 1)
+                sharded_db.increase_view(post_id)
+            for _ in range(50):
+                new_ids.append(sharded_db.add_post("t", "t", poster_id=0))
+
+        threads = [threading.Thread(target=writer, args=(thread,)) for thread in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for post_id, (like, view) in before.items():
+            post = sharded_db.get_post_by_id(post_id)
+            assert (post.like - like, post.view - view) == (1600, 1600)
+
+        posts, _ = sharded_db.get_posts(0, 1000)
+        assert sorted(new_ids) == list(range(10, 410))
+        assert [post.post_id for post in posts] == list(range(410))
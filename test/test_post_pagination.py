@@ -0,0 +1,101 @@
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+client = TestClient(app)
+
+
+def walk(list_pages, **params) -> list[int]:
+    """커서를 따라 끝까지 읽은 post_id 목록"""
+    post_ids = []
+    params = {"limit": 3, **params}
+    while True:
+        body = list_pages(params)
+        post_ids += [post["post_id"] for post in body["data"]]
+        if body["next"] is None:
+            return post_ids
+        params = {"limit": 3, "cursor": body["next"]}
+
+
+class TestPostsAfter:
+    """(posted_date, post_id) 커서 조회 테스트"""
+
+    def test_ascending_and_descending(self, post_db):
+        """오름차순/내림차순으로 키 다음의 포스터를 가져온다"""
+        posts, has_more = post_db.get_posts_after(None, 4)
+        assert [post.post_id for post in posts] == [0, 1, 2, 3]
+        assert has_more
+
+        last = posts[-1]
+        posts, has_more = post_db.get_posts_after((last.posted_date, last.post_id), 10)
+        assert [post.post_id for post in posts] == [4, 5, 6, 7, 8, 9]
+        assert not has_more
+
+        posts, _ = post_db.get_posts_after(None, 3, descending=True)
+        assert [post.post_id for post in posts] == [9, 8, 7]
+        posts, has_more = post_db.get_posts_after((posts[-1].posted_date, posts[-1].post_id), 10, descending=True)
+        assert [post.post_id for post in posts] == [6, 5, 4, 3, 2, 1, 0]
+        assert not has_more
+
+
+    def test_stable_across_deletes_and_inserts(self, post_db):
+        """페이지 사이에 삭제/추가가 있어도 남은 포스터를 건너뛰거나 반복하지 않는다"""
+        posts, _ = post_db.get_posts_after(None, 3)
+        last = posts[-1]
+
+        post_db.delete_post_by_id(1)
+        post_db.delete_post_by_id(3)
+        new_id = post_db.add_post("new", "new", poster_id=0)
+
+        posts, _ = post_db.get_posts_after((last.posted_date, last.post_id), 3)
+        assert [post.post_id for post in posts] == [4, 5, 6]
+
+        # 새 포스터는 작성일(2000-10-11) 순서대로 맨 앞에 온다
+        posts, _ = post_db.get_posts_after(None, 1)
+        assert posts[0].post_id == new_id
+
+
+class TestPostListCursorAPI:
+    """GET /posts 커서 페이지네이션 테스트"""
+
+    def list_pages(self, params: dict) -> dict:
+        response = client.get("/posts", params=params)
+        assert response.status_code == 200
+        return response.json()
+
+    def test_walk_forward_and_back(self):
+        """next 커서로 끝까지, prev 커서로 처음까지 같은 순서로 오간다"""
+        forward = walk(self.list_pages)
+        assert forward == walk(self.list_pages, order="desc")[::-1]
+
+        first = self.list_pages({"limit": 3})
+        assert first["prev"] is None
+        second = self.list_pages({"limit": 3, "cursor": first["next"]})
+        assert [post["post_id"] for post in second["data"]] == forward[3:6]
+
+        back = self.list_pages({"limit": 3, "cursor": second["prev"]})
+        assert [post["post_id"] for post in back["data"]] == forward[:3]
+        assert back["prev"] is None
+        assert back["next"] is not None
+
+
+    def test_offset_mode_kept(self):
+        """offset을 주면 기존처럼 작성 순서와 정수 next를 돌려준다"""
+        body = self.list_pages({"offset": 0, "limit": 2})
+
+        assert [post["post_id"] for post in body["data"]] == [0, 1]
+        assert body["next"] == 2
+
+
+    def test_invalid_cursor(self):
+        """올바르지 않은 커서는 400"""
+        response = client.get("/posts", params={"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
+
+
+    def test_out_of_range_offset_and_limit(self):
+        """offset이 음수이거나 limit이 범위를 벗어나면 500이 아니라 422"""
+        for params in ({"offset": -1}, {"limit": -1}, {"limit": 0}, {"offset": 0, "limit": -1}, {"limit": 101}):
+            assert client.get("/posts", params=params).status_code == 422
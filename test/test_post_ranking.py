@@ -0,0 +1,126 @@
+import random
+
+from fastapi.testclient import TestClient
+
+from main import app
+from model.rank_index import RankIndex
+from schemas.cursor import encode_cursor
+
+
+client = TestClient(app)
+
+
+class TestRankIndex:
+    """버킷 정렬 인덱스 테스트"""
+
+    def test_matches_sorted_list(self, monkeypatch):
+        """넣고/빼고/옮긴 뒤에도 정렬 리스트와 같은 순서로 잘라준다"""
+        monkeypatch.setattr(RankIndex, "LOAD", 4)
+        rng = random.Random(0)
+        counts = {post_id: rng.randrange(20) for post_id in range(50)}
+        index = RankIndex((count, post_id) for post_id, count in counts.items())
+
+        for post_id in range(50, 80):
+            counts[post_id] = rng.randrange(20)
+            index.add((counts[post_id], post_id))
+        for post_id in rng.sample(sorted(counts), 20):
+            assert index.remove((counts.pop(post_id), post_id))
+        for post_id in rng.sample(sorted(counts), 30):
+            new = counts[post_id] + rng.randrange(-3, 10)
+            index.move((counts[post_id], post_id), (new, post_id))
+            counts[post_id] = new
+
+        expected = sorted((count, post_id) for post_id, count in counts.items())
+        assert len(index) == len(expected)
+        assert index.after(None, len(expected), False) == expected
+        assert index.after(None, 5, True) == expected[::-1][:6]
+
+        key = expected[17]
+        assert index.after(key, 10, False) == expected[18:29]
+        assert index.after(key, 10, True) == expected[6:17][::-1]
+        assert not index.remove((-1, -1))
+
+
+class TestPostsRanked:
+    """저장소별 인기순 조회 테스트"""
+
+    def test_like_rank_follows_updates(self, post_db):
+        """좋아요가 바뀌거나 포스터가 삭제되면 인기순이 바로 바뀐다"""
+        posts, _ = post_db.get_posts_ranked("like", None, 3)
+        assert [post.like for post in posts] == sorted((post.like for post in posts), reverse=True)
+        top = posts[0]
+
+        post_db.update_like(posts[2].post_id, top.like + 1)
+        posts, _ = post_db.get_posts_ranked("like", None, 3)
+        assert posts[1].post_id == top.post_id
+
+        post_db.delete_post_by_id(posts[0].post_id)
+        posts, _ = post_db.get_posts_ranked("like", None, 1)
+        assert posts[0].post_id == top.post_id
+
+
+    def test_view_rank_pages(self, post_db):
+        """조회수 순서로 키 다음부터 이어서 읽으면 빠짐없이 한 번씩 나온다"""
+        post_db.add_views([(3, 100000)])
+        post_db.increase_view(3)
+
+        seen, key, has_more = [], None, True
+        while has_more:
+            posts, has_more = post_db.get_posts_ranked("view", key, 3, summary=True)
+            seen += posts
+            key = (posts[-1].view, posts[-1].post_id)
+
+        assert seen[0].post_id == 3
+        assert [(post.view, post.post_id) for post in seen] == sorted(
+            ((post.view, post.post_id) for post in seen), reverse=True
+        )
+        assert len({post.post_id for post in seen}) == len(seen) == 10
+
+
+class TestPopularFeedAPI:
+    """GET /posts?sort=likes|views 테스트"""
+
+    def test_likes_feed_cursor_pages(self):
+        """좋아요 순으로 다음/이전 페이지를 오간다"""
+        first = client.get("/posts", params={"sort": "likes", "limit": 4}).json()
+        likes = [post["like"] for post in first["data"]]
+        assert likes == sorted(likes, reverse=True)
+        assert first["prev"] is None
+
+        second = client.get("/posts", params={"cursor": first["next"], "limit": 4}).json()
+        assert second["data"][0]["like"] <= likes[-1]
+
+        back = client.get("/posts", params={"cursor": second["prev"], "limit": 4}).json()
+        assert [post["post_id"] for post in back["data"]] == [post["post_id"] for post in first["data"]]
+
+
+    def test_like_moves_post_up(self):
+        """좋아요를 누르면 인기순 위치가 바로 바뀐다"""
+        def post_ids() -> list[int]:
+            posts = client.get("/posts", params={"sort": "likes", "limit": 100}).json()["data"]
+            return [post["post_id"] for post in posts]
+
+        older, newer = (
+            client.post("/posts", json={
+                "title": title, "content": "본문", "image_url": [], "poster_id": 0
+            }).json()["new_post_id"]
+            for title in ("먼저 쓴 글", "나중에 쓴 글")
+        )
+
+        # 좋아요 수가 같으면 post_id가 큰(나중에 쓴) 포스터가 먼저
+        ranked = post_ids()
+        assert ranked.index(newer) < ranked.index(older)
+
+        client.post(f"/posts/{older}/like", json={"user_id": 1})
+        ranked = post_ids()
+        assert ranked.index(older) < ranked.index(newer)
+
+
+    def test_invalid_sort_requests(self):
+        """인기순에 offset을 주거나, 게시글 목록 커서가 아니면 400"""
+        assert client.get("/posts", params={"sort": "likes", "offset": 0}).status_code == 400
+        assert client.get("/posts", params={"sort": "stars"}).status_code == 422
+
+        for key in ([5], ["stars", 1, 2], ["likes", "1", 2]):
+            cursor = encode_cursor(key, "desc", "next")
+            assert client.get("/posts", params={"cursor": cursor}).status_code == 400
@@ -0,0 +1,94 @@
+import sqlite3
+
+from fastapi.testclient import TestClient
+
+from main import app
+from model.post_model import PREVIEW_LENGTH
+from model.sqlite_model import SqlitePool, SqlitePostModel
+
+
+client = TestClient(app)
+
+
+class TestPostSummary:
+    """목록 요약 열 테스트"""
+
+    def test_dummy_summary(self, post_db):
+        """더미 포스터의 요약에 작성자 닉네임과 댓글 수가 들어있다"""
+        posts, _ = post_db.get_posts(0, 3, summary=True)
+
+        assert [post.poster_nickname for post in posts] == ["test", "user", "admin"]
+        assert [post.comment_count for post in posts] == [2, 1, 1]
+        assert posts[0].thumbnail == "https://example.com/images/fastapi1.jpg"
+        assert posts[2].thumbnail is None
+        assert len(posts[0].preview) == PREVIEW_LENGTH
+
+
+    def test_summary_updated_on_write(self, post_db):
+        """수정, 댓글 수 변경, 닉네임 변경이 요약에 바로 반영된다"""
+        post_id = post_db.add_post("t", "x" * 500, poster_id=0, image_url=["a.jpg", "b.jpg"], poster_nickname="test")
+        post_db.edit_post(post_id, "t2", "short", [])
+        post_db.update_comment_count(post_id, 1)
+
+        assert post_db.update_poster_nickname(0, "renamed") == 4
+
+        summary = post_db.get_summary_by_id(post_id)
+        assert (summary.title, summary.preview, summary.thumbnail) == ("t2", "short", None)
+        assert (summary.comment_count, summary.poster_nickname, summary.version) == (1, "renamed", 3)
+
+        # 새 포스터는 작성일(2000-10-11) 순서대로 맨 앞에 온다
+        posts, _ = post_db.get_posts_after(None, 1, summary=True)
+        assert posts[0].poster_nickname == "renamed"
+
+
+    def test_sqlite_backfills_summary_columns(self, tmp_path):
+        """요약 열이 없던 DB 파일은 열을 추가하면서 기존 행을 채운다"""
+        path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            "CREATE TABLE users (user_id INTEGER PRIMARY KEY AUTOINCREMENT, email TEXT NOT NULL UNIQUE, "
+            "password TEXT NOT NULL, nickname TEXT NOT NULL UNIQUE, user_profile_image_url TEXT NOT NULL);"
+            "CREATE TABLE posts (post_id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, "
+            "content TEXT NOT NULL, image_url TEXT NOT NULL, like_count INTEGER NOT NULL, "
+            "view_count INTEGER NOT NULL, poster_id INTEGER NOT NULL, posted_date TEXT NOT NULL);"
+            "CREATE TABLE comments (comment_id INTEGER PRIMARY KEY AUTOINCREMENT, post_id INTEGER NOT NULL, "
+            "user_id INTEGER NOT NULL, comment_date TEXT NOT NULL, comment TEXT NOT NULL);"
+            "INSERT INTO users VALUES (0, 'old@example.com', 'pw', 'old', 'http');"
+            "INSERT INTO posts VALUES (0, 'title', 'content', '[\"a.jpg\"]', 0, 0, 0, '2024');"
+            "INSERT INTO comments VALUES (0, 0, 0, '2024', 'hi');"
+        )
+        conn.close()
+
+        pool = SqlitePool(path, size=1)
+        summary = SqlitePostModel(pool).get_summary_by_id(0)
+        pool.close()
+
+        assert (summary.preview, summary.thumbnail) == ("content", "a.jpg")
+        assert (summary.poster_nickname, summary.comment_count) == ("old", 1)
+
+
+class TestPostListSummaryAPI:
+    """GET /posts 목록 요약 테스트"""
+
+    def test_list_returns_summary_by_default(self):
+        """기본은 요약, fields=full이면 본문까지 돌려준다"""
+        summary = client.get("/posts", params={"offset": 0, "limit": 1}).json()["data"][0]
+        full = client.get("/posts", params={"offset": 0, "limit": 1, "fields": "full"}).json()["data"][0]
+
+        assert "content" not in summary and "image_url" not in summary
+        assert summary["preview"] == full["content"][:PREVIEW_LENGTH]
+        assert summary["poster_nickname"] == "test"
+
+
+    def test_comment_count_follows_writes(self):
+        """댓글 작성/삭제가 목록의 댓글 수에 반영된다"""
+        def comment_count() -> int:
+            posts = client.get("/posts", params={"offset": 0, "limit": 10}).json()["data"]
+            return next(post["comment_count"] for post in posts if post["post_id"] == 9)
+
+        before = comment_count()
+        comment_id = client.post("/posts/9/comment", json={"user_id": 0, "comment": "count me"}).json()["comment_id"]
+        assert comment_count() == before + 1
+
+        client.request("DELETE", "/posts/9/comment", json={"user_id": 0, "comment_id": comment_id})
+        assert comment_count() == before
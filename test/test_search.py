@@ -0,0 +1,122 @@
+import sqlite3
+
+from fastapi.testclient import TestClient
+
+from main import app
+from model.search_index import SearchIndex, tokenize
+from model.sqlite_model import SqlitePool, SqlitePostModel
+
+
+client = TestClient(app)
+
+
+class TestTokenize:
+    """검색 토큰화 테스트"""
+
+    def test_hangul_bigrams_and_words(self):
+        """한글은 2글자씩 겹쳐 자르고, 영문/숫자는 소문자 단어 그대로"""
+        assert tokenize("FastAPI로 검색하기") == ["fastapi", "로", "검색", "색하", "하기"]
+        assert tokenize("Python 3.11") == ["python", "3", "11"]
+        assert tokenize("!!") == []
+
+
+class TestSearchIndex:
+    """역색인 BM25 테스트"""
+
+    def test_rank_and_remove(self):
+        """제목에 나온 포스터가 먼저 오고, 지운 포스터는 나오지 않는다"""
+        index = SearchIndex()
+        index.add(0, "점심 메뉴", "오늘은 검색 이야기")
+        index.add(1, "검색 엔진", "역색인으로 만든다")
+        index.add(2, "저녁", "아무 말")
+
+        assert [post_id for post_id, _ in index.search("검색", 10)] == [1, 0]
+
+        assert index.remove(1)
+        assert not index.remove(1)
+        assert [post_id for post_id, _ in index.search("검색", 10)] == [0]
+        assert len(index) == 2
+
+
+    def test_compact_keeps_results(self):
+        """삭제가 많아져 게시 목록을 정리해도 남은 포스터는 그대로 검색된다"""
+        index = SearchIndex()
+        for post_id in range(10):
+            index.add(post_id, f"글 {post_id}", "공통 본문")
+        for post_id in range(7):
+            index.remove(post_id)
+
+        assert len(index.doc_post_id) < 10
+        assert sorted(post_id for post_id, _ in index.search("공통", 10)) == [7, 8, 9]
+
+
+class TestSearchPosts:
+    """저장소별 search_posts 테스트"""
+
+    def test_index_follows_writes(self, post_db):
+        """작성/수정/삭제가 검색 결과에 바로 반영된다"""
+        post_id = post_db.add_post("역색인 실험", "한국어 검색을 해보자", poster_id=0, image_url=[], poster_nickname="test")
+        assert [post.post_id for post in post_db.search_posts("역색인", 10)] == [post_id]
+
+        post_db.edit_post(post_id, "제목 변경", "내용 변경", [])
+        assert post_db.search_posts("역색인", 10) == []
+        assert [post.post_id for post in post_db.search_posts("변경", 10)] == [post_id]
+
+        post_db.delete_post_by_id(post_id)
+        assert post_db.search_posts("변경", 10) == []
+
+
+    def test_title_match_ranks_first_and_pages(self, post_db):
+        """제목에 검색어가 있는 포스터가 먼저 오고, limit/offset으로 나눠 읽는다"""
+        body_id = post_db.add_post("잡담", "오늘 본 양자역학 책", poster_id=0, image_url=[], poster_nickname="test")
+        title_id = post_db.add_post("양자역학 입문", "잡담", poster_id=0, image_url=[], poster_nickname="test")
+
+        posts = post_db.search_posts("양자역학", 10)
+        assert [post.post_id for post in posts] == [title_id, body_id]
+        assert posts[0].poster_nickname == "test"
+
+        assert [post.post_id for post in post_db.search_posts("양자역학", 1, 1)] == [body_id]
+        assert post_db.search_posts("!!", 10) == []
+
+
+    def test_sqlite_backfills_search_index(self, tmp_path):
+        """검색 색인이 없던 DB 파일은 열 때 기존 포스터를 색인한다"""
+        path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            "CREATE TABLE posts (post_id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, "
+            "content TEXT NOT NULL, image_url TEXT NOT NULL, like_count INTEGER NOT NULL, "
+            "view_count INTEGER NOT NULL, poster_id INTEGER NOT NULL, posted_date TEXT NOT NULL);"
+            "INSERT INTO posts VALUES (0, '오래된 글', '백필 확인', '[]', 0, 0, 0, '2024');"
+        )
+        conn.close()
+
+        pool = SqlitePool(path, size=1)
+        posts = SqlitePostModel(pool).search_posts("백필", 10)
+        pool.close()
+
+        assert [post.post_id for post in posts] == [0]
+
+
+class TestSearchAPI:
+    """GET /posts/search 테스트"""
+
+    def test_search_endpoint(self):
+        """검색 결과는 목록 요약 형태로 관련도 순서대로 온다"""
+        new_post_id = client.post("/posts", json={
+            "title": "엔드포인트 시험", "content": "본문", "image_url": [], "poster_id": 0
+        }).json()["new_post_id"]
+
+        response = client.get("/posts/search", params={"q": "엔드포인트"})
+        assert response.status_code == 200
+
+        # 본문에 "API 엔드포인트"가 있는 더미 포스터(8)보다 제목에 있는 새 포스터가 먼저
+        data = response.json()["data"]
+        assert [post["post_id"] for post in data] == [new_post_id, 8]
+        assert "content" not in data[0]
+
+
+    def test_search_validation(self):
+        """검색어가 없거나 limit이 범위를 벗어나면 422"""
+        assert client.get("/posts/search").status_code == 422
+        assert client.get("/posts/search", params={"q": "a", "limit": 0}).status_code == 422
@@ -0,0 +1,121 @@
+import asyncio
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from model.async_storage import ThreadPoolAdapter
+from model.shared_storage import make_server, connect, exposed_methods
+from model.user_model import UserModel
+from model.post_model import PostModel
+from model.comment_model import CommentModel
+from model.like_model import LikeModel
+
+
+AUTHKEY = b"test"
+
+
+@pytest.fixture(scope="module")
+def address():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    address = f"127.0.0.1:{port}"
+
+    models = {"user": UserModel(), "post": PostModel(), "comment": CommentModel(), "like": LikeModel()}
+    server = make_server(models, address, AUTHKEY)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return address
+
+
+class TestSharedStorage:
+    """공유 저장소 프로세스 테스트"""
+
+    def test_workers_see_same_data(self, address):
+        """한 워커의 변경이 다른 워커에서 바로 보인다"""
+        worker_a = connect(address, AUTHKEY)
+        worker_b = connect(address, AUTHKEY)
+
+        post_id = worker_a.post().add_post("shared", "content", 0, [])
+        assert worker_a.like().add_like(post_id, 1)
+
+        assert worker_b.post().get_post_by_id(post_id).title == "shared"
+        assert not worker_b.like().add_like(post_id, 1)
+        assert worker_b.like().get_likers_by_post_id(post_id) == [1]
+
+
+    def test_concurrent_adds_get_unique_ids(self, address):
+        """여러 스레드에서 동시에 추가해도 id가 겹치지 않는다"""
+        storage = ThreadPoolAdapter(connect(address, AUTHKEY).comment(), ThreadPoolExecutor(max_workers=8))
+
+        async def add_many():
+            return await asyncio.gather(*(storage.add_comment(0, 1, "2001", f"c{i}") for i in range(50)))
+
+        comment_ids = asyncio.run(add_many())
+
+        assert len(set(comment_ids)) == 50
+
+
+    def test_like_service_runs_in_storage_process(self, address):
+        """좋아요 서비스가 저장소 프로세스에서 멤버십과 좋아요 수를 함께 바꾼다"""
+        worker_a = connect(address, AUTHKEY)
+        worker_b = connect(address, AUTHKEY)
+        post_id = worker_a.post().add_post("liked", "content", 0, [])
+
+        assert worker_a.like_service().like(post_id, 2) == 1
+        assert worker_b.like_service().like(post_id, 2) is None
+        assert worker_b.like_service().unlike(post_id, 2) == 0
+        assert worker_a.post().get_post_by_id(post_id).like == 0
+        assert not worker_a.like().has_liked(post_id, 2)
+
+
+    def test_models_do_not_share_a_lock(self):
+        """한 모델의 호출이 오래 걸려도 다른 모델의 호출은 기다리지 않는다"""
+        entered, release = threading.Event(), threading.Event()
+
+        class SlowPostModel(PostModel):
+            def get_post_by_id(self, post_id):
+                entered.set()
+                release.wait(5)
+                return super().get_post_by_id(post_id)
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            address = f"127.0.0.1:{sock.getsockname()[1]}"
+        models = {"user": UserModel(), "post": SlowPostModel(), "comment": CommentModel(), "like": LikeModel()}
+        threading.Thread(target=make_server(models, address, AUTHKEY).serve_forever, daemon=True).start()
+
+        slow = threading.Thread(target=lambda: connect(address, AUTHKEY).post().get_post_by_id(0))
+        slow.start()
+        assert entered.wait(5)
+        try:
+            users = []
+            fast = threading.Thread(target=lambda: users.append(connect(address, AUTHKEY).user().get_users_by_ids([0])))
+            fast.start()
+            fast.join(2)
+            assert users and users[0][0].user_id == 0
+        finally:
+            release.set()
+            slow.join()
+
+
+    def test_converters_run_in_worker(self, address):
+        """*_2_*_public 변환은 저장소 프로세스를 거치지 않고 워커에서 바로 실행한다"""
+        assert "post_data_2_post_public" not in exposed_methods(PostModel)
+        assert "comments_2_comment_public" not in exposed_methods(CommentModel)
+
+        proxy = connect(address, AUTHKEY).post()
+        storage = ThreadPoolAdapter(proxy, ThreadPoolExecutor(max_workers=1))
+        assert storage.post_data_2_post_public is PostModel.post_data_2_post_public
+
+        public = storage.post_data_2_post_public(proxy.get_post_by_id(0))
+        assert public.post_id == 0
+
+
+    def test_requires_authkey(self, address):
+        """인증 키가 비어 있으면 저장소 서버를 열지도, 접속하지도 않는다"""
+        with pytest.raises(RuntimeError):
+            make_server({}, "127.0.0.1:0", b"")
+        with pytest.raises(RuntimeError):
+            connect(address, b"")
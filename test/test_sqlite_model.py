@@ -0,0 +1,112 @@
+import pytest
+
+from model.sqlite_model import (
+    SqlitePool,
+    SqliteUserModel,
+    SqlitePostModel,
+    SqliteCommentModel,
+    SqliteLikeModel,
+    SqliteLikeService,
+    seed_dummy_data
+)
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = SqlitePool(str(tmp_path / "test.db"), size=2)
+    seed_dummy_data(pool)
+    yield pool
+    pool.close()
+
+
+class TestSqliteModel:
+    """SQLite 저장소 테스트"""
+
+    def test_wal_mode(self, pool):
+        """커넥션이 WAL 모드로 열린다"""
+        with pool.connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+    def test_seed_matches_memory_ids(self, pool):
+        """더미 데이터가 메모리 모델과 같은 id로 들어간다"""
+        user_db = SqliteUserModel(pool)
+        post_db = SqlitePostModel(pool)
+
+        assert user_db.authenticate_user("test@example.com", "Test1234!").user_id == 0
+        assert post_db.get_post_by_id(0).image_url == [
+            "https://example.com/images/fastapi1.jpg", "https://example.com/images/fastapi2.jpg"
+        ]
+        seed_dummy_data(pool)
+        assert post_db.get_posts(0, 20)[0][-1].post_id == 9
+
+
+    def test_user_crud(self, pool):
+        user_db = SqliteUserModel(pool)
+        user_id = user_db.add_user("new@example.com", "New1234!", "newbie", "http")
+
+        assert user_db.update_user_profile(user_id, "renamed", "http://new")
+        assert user_db.search_user_by_nickname("newbie") is None
+        assert user_db.search_user_by_nickname("renamed").user_id == user_id
+        assert user_db.update_password(user_id, "Other123!")
+        assert user_db.authenticate_user("new@example.com", "Other123!") is not None
+        assert user_db.delete_user_by_user_id(user_id)
+        assert user_db.search_user_by_id(user_id) is None
+        assert sorted(user_db.get_users_by_ids([0, 3, 0, user_id])) == [0, 3]
+
+
+    def test_post_crud(self, pool):
+        post_db = SqlitePostModel(pool)
+        post_id = post_db.add_post("title", "content", poster_id=0, image_url=["img"])
+
+        assert post_db.edit_post(post_id, "new", "body", [])
+        assert post_db.update_like(post_id, 1) == 1
+        assert post_db.increase_view(post_id) == 1
+        assert post_db.get_post_by_id(post_id).title == "new"
+        assert post_db.delete_post_by_id(post_id)
+        assert post_db.update_like(post_id, 1) is None
+        assert post_db.add_post("again", "content", poster_id=0) != post_id
+
+
+    def test_comments_and_likes(self, pool):
+        comment_db = SqliteCommentModel(pool)
+        like_db = SqliteLikeModel(pool)
+
+        comment_id = comment_db.add_comment(0, 2, "2001", "hello")
+        assert [comment.user_id for comment in comment_db.get_comments_by_post_id(0)] == [1, 3, 2]
+        assert comment_db.edit_comment(comment_id, "edited", "2002")
+        assert comment_db.get_comment_by_comment_id(comment_id).comment == "edited"
+        assert comment_db.delete_comment_by_comment_id(comment_id)
+
+        assert not like_db.add_like(0, 1)
+        assert like_db.add_like(0, 3)
+        assert like_db.get_likers_by_post_id(0) == [1, 2, 3]
+        assert like_db.get_liked_post_ids_by_user_id(3) == [2, 9, 0]
+        assert like_db.delete_like(0, 3)
+        assert not like_db.has_liked(0, 3)
+
+
+    def test_like_service(self, pool):
+        """좋아요와 좋아요 수가 한 트랜잭션에서 바뀌고, 정합성 검사가 더미 데이터의 어긋남을 고친다"""
+        post_db = SqlitePostModel(pool)
+        like_service = SqliteLikeService(pool)
+
+        drift = like_service.reconcile()
+        assert drift[0] == (15, 2)
+        assert like_service.reconcile() == {}
+
+        assert like_service.like(0, 3) == 3
+        assert like_service.like(0, 3) is None
+        assert like_service.like(12345, 3) is None
+        assert like_service.unlike(0, 3) == 2
+        assert like_service.unlike(0, 3) is None
+        assert post_db.get_post_by_id(0).like == 2
+
+
+    def test_add_views(self, pool):
+        """조회수 일괄 반영이 한 트랜잭션에서 여러 포스터에 적용된다"""
+        post_db = SqlitePostModel(pool)
+
+        assert post_db.add_views([(0, 2), (5, 1), (12345, 1)]) == 2
+        assert post_db.get_post_by_id(0).view == 236
+        assert post_db.get_post_by_id(5).view == 1568
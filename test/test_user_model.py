@@ -0,0 +1,60 @@
+from model.user_model import UserModel
+
+
+class TestUserModelIndex:
+    """UserModel 인덱스 테스트"""
+
+    def test_add_user_indexed(self):
+        """추가한 사용자를 id, 이메일, 닉네임으로 찾을 수 있다"""
+        user_db = UserModel()
+        user_id = user_db.add_user("new@example.com", "New1234!", "newbie", "http")
+
+        assert user_db.search_user_by_id(user_id).email == "new@example.com"
+        assert user_db.search_user_by_email("new@example.com").user_id == user_id
+        assert user_db.search_user_by_nickname("newbie").user_id == user_id
+
+
+    def test_delete_user_removes_index(self):
+        """삭제한 사용자는 어떤 키로도 조회되지 않는다"""
+        user_db = UserModel()
+        user = user_db.search_user_by_email("test@example.com")
+
+        assert user_db.delete_user_by_user_id(user.user_id)
+        assert user_db.search_user_by_id(user.user_id) is None
+        assert user_db.search_user_by_email("test@example.com") is None
+        assert user_db.search_user_by_nickname("test") is None
+        assert not user_db.delete_user_by_user_id(user.user_id)
+
+
+    def test_user_id_not_reused_after_delete(self):
+        """삭제 후 추가한 사용자는 새로운 id를 받는다"""
+        user_db = UserModel()
+        last_id = user_db.add_user("a@example.com", "Abcd123!", "a", "http")
+        user_db.delete_user_by_user_id(last_id)
+
+        new_id = user_db.add_user("b@example.com", "Abcd123!", "b", "http")
+
+        assert new_id != last_id
+        assert user_db.search_user_by_id(last_id) is None
+
+
+    def test_update_user_profile_reindexes_nickname(self):
+        """닉네임을 바꾸면 이전 닉네임은 비고 새 닉네임으로 조회된다"""
+        user_db = UserModel()
+        user = user_db.search_user_by_nickname("foo")
+
+        assert user_db.update_user_profile(user.user_id, "bar", "http://new")
+        assert user_db.search_user_by_nickname("foo") is None
+        assert user_db.search_user_by_nickname("bar").user_id == user.user_id
+        assert user_db.search_user_by_id(user.user_id).user_profile_image_url == "http://new"
+
+
+    def test_get_users_by_ids(self):
+        """중복 id는 한 번만, 없는 사용자는 빼고 돌려준다"""
+        user_db = UserModel()
+        user_db.delete_user_by_user_id(2)
+
+        users = user_db.get_users_by_ids([1, 3, 1, 2, 999])
+
+        assert sorted(users) == [1, 3]
+        assert users[3].nickname == "foo"
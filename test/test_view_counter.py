@@ -0,0 +1,105 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from main import app
+from dependencies import get_view_counter
+from model.async_storage import InMemoryAdapter
+from model.post_model import PostModel
+from model.sharded_post_model import ShardedPostModel
+from model.view_counter import ViewCounter
+
+
+client = TestClient(app)
+
+
+class CountingPostModel(PostModel):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def add_views(self, views):
+        self.batches.append(views)
+        return super().add_views(views)
+
+
+class FailingPostModel(PostModel):
+    def add_views(self, views):
+        raise OSError("storage down")
+
+
+class TestViewCounter:
+    """조회수 쓰기 지연 집계기 테스트"""
+
+    def test_views_buffered_until_flush(self):
+        """증가분은 flush 전까지 저장소에 쓰지 않고, flush 때 한 번에 반영한다"""
+        post_db = CountingPostModel()
+        view_counter = ViewCounter(InMemoryAdapter(post_db))
+
+        async def run():
+            for _ in range(3):
+                await view_counter.increase(0)
+            await view_counter.increase(1)
+            assert post_db.get_post_by_id(0).view == 234
+            assert view_counter.pending_views(0) == 3
+
+            await view_counter.flush()
+
+        asyncio.run(run())
+
+        assert post_db.batches == [[(0, 3), (1, 1)]]
+        assert post_db.get_post_by_id(0).view == 237
+        assert view_counter.pending_views(0) == 0
+
+
+    def test_threshold_triggers_flush(self):
+        """모인 증가분이 임계값에 닿으면 바로 반영한다"""
+        post_db = CountingPostModel()
+        view_counter = ViewCounter(InMemoryAdapter(post_db), flush_threshold=5)
+
+        async def run():
+            for post_id in range(7):
+                await view_counter.increase(post_id % 2)
+
+        asyncio.run(run())
+
+        assert post_db.batches == [[(0, 3), (1, 2)]]
+        assert view_counter.pending_views(0) == 1
+        assert view_counter.pending_views(1) == 1
+
+
+    def test_failed_flush_keeps_views(self):
+        """반영에 실패한 증가분은 다음 반영을 위해 남겨둔다"""
+        view_counter = ViewCounter(InMemoryAdapter(FailingPostModel()))
+
+        async def run():
+            await view_counter.increase(2)
+            await view_counter.flush()
+
+        asyncio.run(run())
+
+        assert view_counter.pending_views(2) == 1
+        assert view_counter.pending_total == 1
+
+
+    def test_add_views_skips_missing_posts(self):
+        """조회수 일괄 반영은 없는 포스터를 건너뛴다"""
+        for post_db in (PostModel(), ShardedPostModel(shard_count=4)):
+            assert post_db.add_views([(0, 2), (5, 1), (12345, 1)]) == 2
+            assert post_db.get_post_by_id(0).view == 236
+            assert post_db.get_post_by_id(5).view == 1568
+
+
+class TestViewCounterAPI:
+    """게시글 조회 API의 조회수 테스트"""
+
+    def test_get_post_shows_buffered_views(self):
+        """게시글 조회 응답과 목록에 아직 반영되지 않은 조회수가 더해져 보인다"""
+        first = client.get("/posts/6").json()["view"]
+        second = client.get("/posts/6").json()["view"]
+
+        assert second == first + 1
+        assert get_view_counter().pending_views(6) >= 2
+
+        listed = client.get("/posts", params={"offset": 6, "limit": 1}).json()["data"][0]
+        assert listed["view"] == second